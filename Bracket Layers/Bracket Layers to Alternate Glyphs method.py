@@ -1,12 +1,21 @@
 # MenuTitle: 💫 Bracket Layers → Alternate Glyphs (Switching Shapes Method)
 # -*- coding: utf-8 -*-
-# Version: 1.3
+# Version: 1.4
 # Description: Automates the creation of suffixed glyphs, their components, custom parameters, and feature code for the Alternate Glyphs method found in the Switching Shapes tutorial.
 # Author: Fernando Díaz (Reset Type Studio) with help from AI.
 
 from GlyphsApp import *
 import vanilla
 from collections import defaultdict
+import os
+import sys
+
+# Shared modules live in the Libraries folder at the root of this repository
+LIBRARIES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Libraries")
+if LIBRARIES_PATH not in sys.path:
+    sys.path.insert(0, LIBRARIES_PATH)
+
+from resetTypeReport import ReportTable  # noqa: E402
 
 # =============================
 # Constants Section
@@ -252,15 +261,13 @@ def addOrUpdateFeature(thisFont, strFeatureTag, strFeatureCode):
     if strFeatureTag not in {thisFeature.name for thisFeature in thisFont.features}:
         thisFont.features.append(thisFeature)
 
+
 def showFinalReport(intTotalBracketGlyphs, intTotalComponents, listSuffixedGlyphs, listComponentGlyphs, thisFont, boolEraseBrackets, boolAddCustomParams, boolAddFeatures):
     """Display the final report in a Vanilla window."""
     strEraseBracketsStatus = "On" if boolEraseBrackets else "Off"
     strAddCustomParamsStatus = "On" if boolAddCustomParams else "Off"
     strAddFeaturesStatus = "On" if boolAddFeatures else "Off"
 
-    strBracketGlyphsList = ", ".join(sorted(thisGlyph.name for thisGlyph in listSuffixedGlyphs))
-    strComponentGlyphsList = ", ".join(sorted(listComponentGlyphs))
-
     strRenameGlyphsText = ""
     if boolAddCustomParams and len(thisFont.instances) > 1:
         thisInstance = thisFont.instances[1]
@@ -269,46 +276,35 @@ def showFinalReport(intTotalBracketGlyphs, intTotalComponents, listSuffixedGlyph
                 strRenameGlyphsText = thisParam.value
                 break
 
-    strCustomParamsText = ""
-    if boolAddCustomParams:
-        strCustomParamsText = (
-            f"Custom Parameters:\n"
-            f"Added '{STR_REMOVE_GLYPHS}': *.switch\n"
-            f"Added '{STR_RENAME_GLYPHS}': {strRenameGlyphsText}\n"
-        )
-
-    strReportText = (
-        f"INITIAL SEARCH:\n"
-        f"Glyphs with Bracket Layers: {intTotalBracketGlyphs}\n"
-        f"Components from Bracket Layers: {intTotalComponents}\n"
-        f"Total Glyphs + Components with Bracket Layers = {intTotalBracketGlyphs + intTotalComponents}\n\n"
-        f"CREATED GLYPHS:\n"
-        f"· Suffixed glyphs created: {len(listSuffixedGlyphs)}\n"
-        f"· Suffixed glyphs from components created: {intTotalComponents}\n"
-        f"· Total Suffixed Glyphs + Components created = {len(listSuffixedGlyphs) + intTotalComponents}\n\n"
-        f"OTHER ACTIONS:\n"
-        +
-        (f"· Added custom parameters\n" if strAddCustomParamsStatus == "On" else "") +
-        (f"· Add rlig & rvr features\n" if strAddFeaturesStatus == "On" else "") +
-        (f"· Erased existing bracket layers\n" if strEraseBracketsStatus == "On" else "") +
-        "\n\n"
-        "Note: Please determine if you need to switch in the alternate glyph or not, in the 'Rename Glyphs' custom parameter."
+    def iterRows():
+        """Yield the report as (section, item, value) rows; values are strings so the column sorts as one type."""
+        yield {"section": "Initial search", "item": "Glyphs with Bracket Layers", "value": str(intTotalBracketGlyphs)}
+        yield {"section": "Initial search", "item": "Components from Bracket Layers", "value": str(intTotalComponents)}
+        yield {"section": "Initial search", "item": "Total Glyphs + Components with Bracket Layers", "value": str(intTotalBracketGlyphs + intTotalComponents)}
+        yield {"section": "Created glyphs", "item": "Suffixed glyphs created", "value": str(len(listSuffixedGlyphs))}
+        yield {"section": "Created glyphs", "item": "Suffixed glyphs from components created", "value": str(intTotalComponents)}
+        yield {"section": "Created glyphs", "item": "Total Suffixed Glyphs + Components created", "value": str(len(listSuffixedGlyphs) + intTotalComponents)}
+        if strAddCustomParamsStatus == "On":
+            yield {"section": "Other actions", "item": "Added custom parameters", "value": ""}
+            yield {"section": "Custom parameters", "item": f"Added '{STR_REMOVE_GLYPHS}'", "value": "*.switch"}
+            yield {"section": "Custom parameters", "item": f"Added '{STR_RENAME_GLYPHS}'", "value": str(strRenameGlyphsText)}
+        if strAddFeaturesStatus == "On":
+            yield {"section": "Other actions", "item": "Add rlig & rvr features", "value": ""}
+        if strEraseBracketsStatus == "On":
+            yield {"section": "Other actions", "item": "Erased existing bracket layers", "value": ""}
+        for thisGlyph in sorted(listSuffixedGlyphs, key=lambda g: g.name):
+            yield {"section": "Bracket glyphs", "item": thisGlyph.name, "value": ""}
+        for strGlyphName in sorted(listComponentGlyphs):
+            yield {"section": "Component glyphs", "item": strGlyphName, "value": ""}
+
+    ReportTable(
+        "Final Report",
+        [("section", "Section", 140), ("item", "Item", 300), ("value", "Value", 140)],
+        iterRows(),
+        summary="Note: Please determine if you need to switch in the alternate glyph or not, in the 'Rename Glyphs' custom parameter.",
+        size=(600, 500),
     )
 
-    class FinalReportWindow:
-        """Display a Vanilla UI window showing the final report."""
-        def __init__(self):
-            self.uiWindow = vanilla.Window((600, 500), "Final Report", minSize=(600, 500))
-            self.uiWindow.txtReport = vanilla.TextEditor((10, 10, -10, -40), strReportText, readOnly=True)
-            self.uiWindow.btnClose = vanilla.Button((-100, -30, -10, 20), "Close", callback=self.closeWindow)
-            self.uiWindow.open()
-        
-        def closeWindow(self, sender):
-            """Close the report window."""
-            self.uiWindow.close()
-
-    FinalReportWindow()
-
 # =============================
 # Main Execution
 # =============================
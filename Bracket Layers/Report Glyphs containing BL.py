@@ -1,12 +1,20 @@
 # MenuTitle: 📄 Report Glyphs containing Bracket Layers
 # -*- coding: utf-8 -*-
-# Version: 1.4
-# Description: Lists glyphs with bracket layers and all affected glyphs, including nested components, in a scrollable Vanilla window with optimized performance.
+# Version: 1.5
+# Description: Lists glyphs with bracket layers and all affected glyphs, including nested components, in a sortable, filterable table that streams rows in and exports to CSV/JSON.
 # Author: Fernando Díaz (Reset Type Studio) with help from AI.
 
 from GlyphsApp import *
 from collections import deque, defaultdict
-from vanilla import Window, TextEditor
+import os
+import sys
+
+# Shared modules live in the Libraries folder at the root of this repository
+LIBRARIES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Libraries")
+if LIBRARIES_PATH not in sys.path:
+    sys.path.insert(0, LIBRARIES_PATH)
+
+from resetTypeReport import ReportTable  # noqa: E402
 
 
 def checkBracketLayers(thisGlyph):
@@ -58,22 +66,27 @@ class BracketLayerReport:
         self.intTotalAffectedGlyphs = len(self.setBracketGlyphs) + len(self.setComponentGlyphs)
         self.createWindow()
 
+    def iterRows(self):
+        """Yield one report row per affected glyph."""
+        for strGlyphName in sorted(self.setBracketGlyphs):
+            yield {"glyph": strGlyphName, "type": "Bracket layers"}
+        for strGlyphName in sorted(self.setComponentGlyphs):
+            yield {"glyph": strGlyphName, "type": "Uses bracket glyph as component"}
+
     def createWindow(self):
-        """Create and display the Vanilla UI window containing the report."""
-        self.uiWindow = Window((500, 400), "Bracket Layer Report", minSize=(500, 400))
-        
-        strReportText = (
-            f"Glyphs with Bracket Layers ({len(self.setBracketGlyphs)}):\n"
-            + ", ".join(sorted(self.setBracketGlyphs)) +
-            f"\n\nAffected Components ({len(self.setComponentGlyphs)}):\n"
-            + ", ".join(sorted(self.setComponentGlyphs)) +
-            f"\n\nTotal affected glyphs: {self.intTotalAffectedGlyphs}"
+        """Create and display the report table."""
+        strSummary = (
+            f"Bracket glyphs: {len(self.setBracketGlyphs)} · "
+            f"Affected components: {len(self.setComponentGlyphs)} · "
+            f"Total affected glyphs: {self.intTotalAffectedGlyphs}"
+        )
+        self.uiReport = ReportTable(
+            "Bracket Layer Report",
+            [("glyph", "Glyph", 220), ("type", "Type", 240)],
+            self.iterRows(),
+            summary=strSummary,
+            size=(500, 400),
         )
-        
-        # Display the report in a scrollable, read-only text field
-        self.uiWindow.report = TextEditor((10, 10, -10, -10), strReportText, readOnly=True)
-        
-        self.uiWindow.open()
 
 
 # Main Execution
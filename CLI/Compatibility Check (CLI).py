@@ -0,0 +1,360 @@
+# -*- coding: utf-8 -*-
+# Version: 1.3
+# Description: Headless compatibility gate for CI. Checks paths, components and anchors of masters and brace/bracket layers in .glyphs sources with glyphsLib, splits glyph ranges across a process pool and writes JSON, JUnit or text reports. Not a menu script (Glyphs lists it in the Scripts menu, where it only prints how to run it); run it from a terminal: python3 "Compatibility Check (CLI).py" Family.glyphs --format junit -o report.xml
+# Author: Fernando Díaz (Reset Type Studio) with help from AI.
+
+import argparse
+import importlib.util
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from xml.etree import ElementTree as ET
+
+# Shared modules live in the Libraries folder at the root of this repository
+LIBRARIES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Libraries")
+if LIBRARIES_PATH not in sys.path:
+    sys.path.insert(0, LIBRARIES_PATH)
+
+from resetTypeCompatibility import LayerStructure, compare_path_nodes  # noqa: E402
+
+# Exit codes
+EXIT_OK = 0
+EXIT_INCOMPATIBLE = 1
+EXIT_ERROR = 2
+
+# Glyphs per worker job; small enough to balance, large enough to amortize pickling
+CHUNK_SIZE = 500
+
+
+# ----------------------------
+# Checking (runs in workers)
+# ----------------------------
+
+_FONTS = {}
+
+
+def load_font(source):
+    """Loads a source once per process; forked workers inherit the parent's copy."""
+    font = _FONTS.get(source)
+    if font is None:
+        import glyphsLib
+        font = glyphsLib.GSFont(source)
+        _FONTS[source] = font
+    return font
+
+
+def master_layer(glyph, master_id):
+    try:
+        return glyph.layers[master_id]
+    except (KeyError, IndexError):
+        return None
+
+
+def is_interpolating_layer(layer):
+    """Brace and bracket layers take part in interpolation and must match their master."""
+    if layer.layerId == layer.associatedMasterId:
+        return False
+    attributes = getattr(layer, "attributes", None) or {}
+    if "coordinates" in attributes or "axisRules" in attributes:
+        return True
+    name = layer.name or ""
+    return ("[" in name and "]" in name) or ("{" in name and "}" in name)
+
+
+def glyph_issues(glyph, masters):
+    """Returns one record per difference of each master against the first master,
+    and of each brace/bracket layer against its associated master."""
+    issues = []
+    structures = {}
+    for master in masters:
+        layer = master_layer(glyph, master.id)
+        if layer is not None:
+            structures[master.id] = LayerStructure(layer)
+
+    if masters[0].id not in structures:
+        return issues
+
+    comparisons = []
+    for master in masters[1:]:
+        if master.id not in structures:
+            issues.append(issue(glyph, master.name, "missing-layer"))
+            continue
+        comparisons.append((master.name, structures[master.id], structures[masters[0].id]))
+
+    master_names = {master.id: master.name for master in masters}
+    for layer in glyph.layers:
+        if layer.layerId in structures or not is_interpolating_layer(layer):
+            continue
+        reference = structures.get(layer.associatedMasterId)
+        if reference is None:
+            continue
+        where = f"{master_names[layer.associatedMasterId]} › {layer.name}"
+        comparisons.append((where, LayerStructure(layer), reference))
+
+    for where, structure, reference in comparisons:
+        if structure.fingerprint == reference.fingerprint:
+            continue
+
+        for i in range(max(len(structure.paths), len(reference.paths))):
+            path = structure.paths[i] if i < len(structure.paths) else None
+            ref_path = reference.paths[i] if i < len(reference.paths) else None
+
+            if path is None or ref_path is None:
+                issues.append(issue(
+                    glyph, where, "missing-path", path=i + 1,
+                    expected=counts(ref_path), found=counts(path),
+                ))
+                continue
+
+            if path.fingerprint == ref_path.fingerprint:
+                continue
+
+            record = issue(
+                glyph, where, "path", path=i + 1,
+                expected=counts(ref_path), found=counts(path),
+            )
+            mismatch = compare_path_nodes(ref_path.types, path.types)
+            if mismatch:
+                index, expected_type, found_type = mismatch
+                record["firstDifference"] = {
+                    "node": index + 1,
+                    "expected": expected_type,
+                    "found": found_type,
+                }
+            issues.append(record)
+
+        if structure.components != reference.components:
+            record = issue(
+                glyph, where, "components",
+                expected=list(reference.components), found=list(structure.components),
+            )
+            mismatch = compare_path_nodes(reference.components, structure.components)
+            if mismatch:
+                index, expected_name, found_name = mismatch
+                record["firstDifference"] = {
+                    "component": index + 1,
+                    "expected": expected_name,
+                    "found": found_name,
+                }
+            issues.append(record)
+
+        if structure.anchors != reference.anchors:
+            issues.append(issue(
+                glyph, where, "anchors",
+                expected=list(reference.anchors), found=list(structure.anchors),
+            ))
+
+    return issues
+
+
+def counts(path):
+    if path is None:
+        return None
+    return [path.oncurves, path.offcurves]
+
+
+def issue(glyph, where, kind, path=None, expected=None, found=None):
+    return {
+        "glyph": glyph.name,
+        "master": where,
+        "kind": kind,
+        "path": path,
+        "expected": expected,
+        "found": found,
+        "firstDifference": None,
+    }
+
+
+def check_range(source, start, stop):
+    """Worker job: checks glyphs[start:stop] of source."""
+    font = load_font(source)
+    masters = list(font.masters)
+    glyphs = list(font.glyphs)[start:stop]
+    issues = []
+    for glyph in glyphs:
+        issues.extend(glyph_issues(glyph, masters))
+    return [glyph.name for glyph in glyphs], issues
+
+
+# ----------------------------
+# Driver
+# ----------------------------
+
+def pool_context():
+    """Prefers fork so workers share the already parsed source instead of re-reading it."""
+    try:
+        return multiprocessing.get_context("fork")
+    except ValueError:
+        return multiprocessing.get_context()
+
+
+def check_source(source, workers):
+    started = time.time()
+    font = load_font(source)
+    glyph_count = len(font.glyphs)
+    ranges = [(i, min(i + CHUNK_SIZE, glyph_count)) for i in range(0, glyph_count, CHUNK_SIZE)]
+
+    checked, issues = [], []
+    if workers <= 1 or len(ranges) <= 1:
+        for start, stop in ranges:
+            names, found = check_range(source, start, stop)
+            checked.extend(names)
+            issues.extend(found)
+    else:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=pool_context()) as pool:
+            futures = [pool.submit(check_range, source, start, stop) for start, stop in ranges]
+            for future in futures:
+                names, found = future.result()
+                checked.extend(names)
+                issues.extend(found)
+
+    return {
+        "source": source,
+        "glyphs": glyph_count,
+        "masters": [master.name for master in font.masters],
+        "incompatibleGlyphs": len({i["glyph"] for i in issues}),
+        "issues": issues,
+        "seconds": round(time.time() - started, 3),
+        "checked": checked,
+        "error": None,
+    }
+
+
+def failed_source(source, error):
+    """Result of a source that could not be read, so the report still lists it."""
+    return {
+        "source": source,
+        "glyphs": 0,
+        "masters": [],
+        "incompatibleGlyphs": 0,
+        "issues": [],
+        "seconds": 0.0,
+        "checked": [],
+        "error": str(error),
+    }
+
+
+def describe(record):
+    text = f"{record['glyph']} · {record['master']} · {record['kind']}"
+    if record["path"]:
+        text += f" · path #{record['path']}"
+    if record["expected"] is not None or record["found"] is not None:
+        text += f" · expected {record['expected']}, found {record['found']}"
+    difference = record.get("firstDifference")
+    if difference:
+        unit = "node" if "node" in difference else "component"
+        text += (
+            f" · first difference at {unit} #{difference[unit]}: "
+            f"expected {difference['expected']}, found {difference['found']}"
+        )
+    return text
+
+
+def write_json(results, stream):
+    sources = [{key: value for key, value in result.items() if key != "checked"} for result in results]
+    json.dump({"sources": sources}, stream, indent=2)
+    stream.write("\n")
+
+
+def write_junit(results, stream):
+    suites = ET.Element("testsuites")
+    for result in results:
+        by_glyph = {}
+        for record in result["issues"]:
+            by_glyph.setdefault(record["glyph"], []).append(record)
+
+        suite = ET.SubElement(suites, "testsuite", {
+            "name": os.path.basename(result["source"]),
+            "tests": str(result["glyphs"] if not result["error"] else 1),
+            "failures": str(len(by_glyph)),
+            "errors": "1" if result["error"] else "0",
+            "time": str(result["seconds"]),
+        })
+        if result["error"]:
+            case = ET.SubElement(suite, "testcase", {
+                "classname": os.path.basename(result["source"]),
+                "name": "source",
+            })
+            ET.SubElement(case, "error", {"message": result["error"]})
+        for glyph_name in result["checked"]:
+            case = ET.SubElement(suite, "testcase", {
+                "classname": os.path.basename(result["source"]),
+                "name": glyph_name,
+            })
+            records = by_glyph.get(glyph_name)
+            if not records:
+                continue
+            failure = ET.SubElement(case, "failure", {
+                "message": f"{len(records)} incompatibility(ies)",
+            })
+            failure.text = "\n".join(describe(r) for r in records)
+
+    ET.ElementTree(suites).write(stream, encoding="unicode", xml_declaration=True)
+    stream.write("\n")
+
+
+def write_text(results, stream):
+    for result in results:
+        if result["error"]:
+            stream.write(f"{result['source']}: ❌ could not be checked: {result['error']}\n")
+            continue
+        stream.write(
+            f"{result['source']}: {result['glyphs']} glyph(s), "
+            f"{result['incompatibleGlyphs']} incompatible ({result['seconds']}s)\n"
+        )
+        for record in result["issues"]:
+            stream.write(f"  ⚠️ {describe(record)}\n")
+
+
+WRITERS = {"json": write_json, "junit": write_junit, "text": write_text}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fail the build when master outlines are not compatible.")
+    parser.add_argument("sources", nargs="+", help=".glyphs or .glyphspackage sources")
+    parser.add_argument("-f", "--format", choices=sorted(WRITERS), default="text")
+    parser.add_argument("-o", "--output", help="report file (default: stdout)")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--fail-fast", action="store_true", help="stop after the first incompatible source")
+    args = parser.parse_args(argv)
+
+    try:
+        import glyphsLib  # noqa: F401
+    except ImportError:
+        print("❌ glyphsLib is required: pip install glyphsLib", file=sys.stderr)
+        return EXIT_ERROR
+
+    results = []
+    for source in args.sources:
+        try:
+            result = check_source(source, args.workers)
+        except Exception as e:
+            # Keep going: the other sources still get checked and the report names this one
+            print(f"❌ Could not check {source}: {e}", file=sys.stderr)
+            result = failed_source(source, e)
+        results.append(result)
+        if args.fail_fast and result["issues"]:
+            break
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as stream:
+            WRITERS[args.format](results, stream)
+    else:
+        WRITERS[args.format](results, sys.stdout)
+
+    if any(result["error"] for result in results):
+        return EXIT_ERROR
+    if any(result["issues"] for result in results):
+        return EXIT_INCOMPATIBLE
+    return EXIT_OK
+
+
+if __name__ == "__main__":
+    if importlib.util.find_spec("GlyphsApp") is not None:
+        # Started from the Glyphs Scripts menu: there are no arguments to parse
+        print('Compatibility Check (CLI) runs in a terminal: python3 "Compatibility Check (CLI).py" Family.glyphs')
+    else:
+        sys.exit(main())
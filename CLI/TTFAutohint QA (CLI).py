@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+# Version: 1.1
+# Description: Headless hinting check. Runs a locally installed ttfautohint over exported unhinted TTFs with the per-instance options written by “Set TTFAutohint Options Automatically”, in parallel, caching results by font hash and options, and reports timings and size deltas. Not a menu script (Glyphs lists it in the Scripts menu, where it only prints how to run it); run it from a terminal: python3 "TTFAutohint QA (CLI).py" exports/*.ttf -m ttfautohint-options.json
+# Author: Fernando Díaz (Reset Type Studio) with help from AI.
+
+import argparse
+import hashlib
+import importlib.util
+import json
+import os
+import shlex
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Exit codes
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_ERROR = 2
+
+MANIFEST_NAME = "ttfautohint-options.json"
+
+if sys.platform == "darwin":
+    CACHE_FOLDER = os.path.join(os.path.expanduser("~"), "Library", "Caches", "com.resettype.TTFAutohintQA")
+else:
+    CACHE_FOLDER = os.path.join(os.path.expanduser("~"), ".cache", "com.resettype.TTFAutohintQA")
+
+
+# ----------------------------
+# Options
+# ----------------------------
+
+def load_manifest(path):
+    """{PostScript font name: ttfautohint arguments}, as written by Set TTFAutohint Options."""
+    if not path:
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def options_for(font_path, manifest, default):
+    """
+    ttfautohint arguments of the instance a TTF was exported from; Glyphs names
+    exports after the PostScript name. Manifest entries are argument lists, so
+    values with spaces stay whole; a plain string (the --options default or an
+    older manifest) is split like a shell would.
+    """
+    name = os.path.splitext(os.path.basename(font_path))[0]
+    options = manifest.get(name, default)
+    if isinstance(options, str):
+        return shlex.split(options)
+    return [str(argument) for argument in options]
+
+
+def ttfautohint_version(executable):
+    try:
+        result = subprocess.run([executable, "--version"], capture_output=True, text=True)
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+    lines = (result.stdout or result.stderr).strip().splitlines()
+    return lines[0] if lines else f"{os.path.basename(executable)} (unknown version)"
+
+
+# ----------------------------
+# Hinting (runs in workers)
+# ----------------------------
+
+def cache_key(font_path, options, version):
+    digest = hashlib.blake2b(digest_size=16)
+    with open(font_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    digest.update(b"\0" + json.dumps(options).encode("utf-8") + b"\0" + (version or "").encode("utf-8"))
+    return digest.hexdigest()
+
+
+def output_paths(font_paths, output_folder):
+    """Output path of every font, mirroring its path relative to the common input folder."""
+    absolute = [os.path.abspath(path) for path in font_paths]
+    base = os.path.commonpath([os.path.dirname(path) for path in absolute]) if absolute else ""
+    return {
+        path: os.path.join(output_folder, os.path.relpath(full, base))
+        for path, full in zip(font_paths, absolute)
+    }
+
+
+def hint_font(font_path, output_path, options, executable, version, use_cache):
+    """Hints one font; returns its result record. Errors are recorded, never raised."""
+    record = {
+        "font": font_path,
+        "output": output_path,
+        "options": options,
+        "cached": False,
+        "seconds": 0.0,
+        "sizeBefore": None,
+        "sizeAfter": None,
+        "error": None,
+    }
+    try:
+        run_ttfautohint(record, executable, version, use_cache)
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+    return record
+
+
+def run_ttfautohint(record, executable, version, use_cache):
+    font_path, output_path, options = record["font"], record["output"], record["options"]
+    record["sizeBefore"] = os.path.getsize(font_path)
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+
+    key = cache_key(font_path, options, version)
+    cached_font = os.path.join(CACHE_FOLDER, key + ".ttf")
+    cached_meta = os.path.join(CACHE_FOLDER, key + ".json")
+
+    if use_cache and os.path.exists(cached_font) and os.path.exists(cached_meta):
+        with open(cached_meta, "r", encoding="utf-8") as f:
+            record["seconds"] = json.load(f).get("seconds", 0.0)
+        shutil.copyfile(cached_font, output_path)
+        record["cached"] = True
+        record["sizeAfter"] = os.path.getsize(output_path)
+        return
+
+    started = time.time()
+    result = subprocess.run(
+        [executable] + options + [font_path, output_path],
+        capture_output=True, text=True,
+    )
+    record["seconds"] = round(time.time() - started, 3)
+
+    if result.returncode != 0:
+        record["error"] = (result.stderr or result.stdout).strip() or f"exit code {result.returncode}"
+        return
+
+    record["sizeAfter"] = os.path.getsize(output_path)
+
+    # Written under a temporary name first, so parallel runs never read half a cache entry
+    os.makedirs(CACHE_FOLDER, exist_ok=True)
+    temporary = f"{cached_font}.{os.getpid()}.{id(record)}"
+    shutil.copyfile(output_path, temporary)
+    os.replace(temporary, cached_font)
+    with open(temporary, "w", encoding="utf-8") as f:
+        json.dump({"seconds": record["seconds"], "options": options}, f)
+    os.replace(temporary, cached_meta)
+
+
+# ----------------------------
+# Reports
+# ----------------------------
+
+def size_delta(record):
+    if record["sizeAfter"] is None:
+        return None
+    return round(100.0 * (record["sizeAfter"] - record["sizeBefore"]) / max(1, record["sizeBefore"]), 1)
+
+
+def write_json(results, stream):
+    for record in results:
+        record["sizeDeltaPercent"] = size_delta(record)
+    json.dump({"fonts": results}, stream, indent=2)
+    stream.write("\n")
+
+
+def write_text(results, stream):
+    for record in results:
+        name = record["font"]
+        if record["error"]:
+            stream.write(f"❌ {name}: {record['error']}\n")
+            continue
+        stream.write(
+            f"✅ {name}: {record['sizeBefore']} → {record['sizeAfter']} bytes "
+            f"({size_delta(record):+.1f}%), {record['seconds']}s"
+            + (" (cached)" if record["cached"] else "")
+            + "\n"
+        )
+    total = sum(record["seconds"] for record in results if not record["cached"])
+    failed = sum(1 for record in results if record["error"])
+    stream.write(f"{len(results)} font(s), {failed} failed, {total:.2f}s hinting\n")
+
+
+WRITERS = {"json": write_json, "text": write_text}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run ttfautohint over exported TTFs and report timings and size deltas.")
+    parser.add_argument("fonts", nargs="+", help="unhinted .ttf files")
+    parser.add_argument("-m", "--manifest", help=f"options per instance ({MANIFEST_NAME})")
+    parser.add_argument("--options", default="", help="options for fonts missing from the manifest")
+    parser.add_argument("-d", "--output-dir", default="hinted", help="folder for the hinted fonts")
+    parser.add_argument("-f", "--format", choices=sorted(WRITERS), default="text")
+    parser.add_argument("-o", "--output", help="report file (default: stdout)")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--ttfautohint", default="ttfautohint", help="ttfautohint executable")
+    parser.add_argument("--no-cache", action="store_true", help="re-hint every font")
+    args = parser.parse_args(argv)
+
+    version = ttfautohint_version(args.ttfautohint)
+    if version is None:
+        print(f"❌ {args.ttfautohint} not found. Install ttfautohint or pass --ttfautohint.", file=sys.stderr)
+        return EXIT_ERROR
+
+    try:
+        manifest = load_manifest(args.manifest)
+    except (OSError, ValueError) as e:
+        print(f"❌ Could not read manifest {args.manifest}: {e}", file=sys.stderr)
+        return EXIT_ERROR
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    outputs = output_paths(args.fonts, args.output_dir)
+
+    # ttfautohint does the work in its own process; threads only wait on it
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        futures = [
+            pool.submit(
+                hint_font, font_path, outputs[font_path], options_for(font_path, manifest, args.options),
+                args.ttfautohint, version, not args.no_cache,
+            )
+            for font_path in args.fonts
+        ]
+        results = [future.result() for future in futures]
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as stream:
+            WRITERS[args.format](results, stream)
+    else:
+        WRITERS[args.format](results, sys.stdout)
+
+    if any(record["error"] for record in results):
+        return EXIT_FAILED
+    return EXIT_OK
+
+
+if __name__ == "__main__":
+    if importlib.util.find_spec("GlyphsApp") is not None:
+        # Started from the Glyphs Scripts menu: there are no arguments to parse
+        print('TTFAutohint QA (CLI) runs in a terminal: python3 "TTFAutohint QA (CLI).py" exports/*.ttf -m ttfautohint-options.json')
+    else:
+        sys.exit(main())
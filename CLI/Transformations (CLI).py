@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+# Version: 1.0
+# Description: Headless Transformations Tool. Moves, scales, rotates and slants master (and optionally brace/bracket) layers of .glyphs sources with glyphsLib, with the same composed matrix and per-master stops as the menu script. Not a menu script (Glyphs lists it in the Scripts menu, where it only prints how to run it); run it from a terminal: python3 "Transformations (CLI).py" Family.glyphs --glyphs A B --scale 95 -o Family-scaled.glyphs
+# Author: Fernando Díaz (Reset Type Studio) with help from AI.
+
+import argparse
+import importlib.util
+import math
+import os
+import sys
+
+# Shared modules live in the Libraries folder at the root of this repository
+LIBRARIES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Libraries")
+if LIBRARIES_PATH not in sys.path:
+    sys.path.insert(0, LIBRARIES_PATH)
+
+from resetTypeTransform import ParametricTransforms, applyMatrix, composeMatrix, layerCenter, layerLocation, parseStops  # noqa: E402
+
+# Exit codes
+EXIT_OK = 0
+EXIT_ERROR = 2
+
+
+def is_special_layer(layer):
+    """Brace and bracket layers; glyphsLib has no isSpecialLayer."""
+    if layer.layerId == layer.associatedMasterId:
+        return False
+    attributes = getattr(layer, "attributes", None) or {}
+    if "coordinates" in attributes or "axisRules" in attributes:
+        return True
+    name = layer.name or ""
+    return ("[" in name and "]" in name) or ("{" in name and "}" in name)
+
+
+def scope_layers(glyph, master_ids, special):
+    """Master layers, plus brace/bracket layers when asked; backups are never touched."""
+    for layer in glyph.layers:
+        if layer.layerId in master_ids:
+            yield layer
+        elif special and layer.associatedMasterId in master_ids and is_special_layer(layer):
+            yield layer
+
+
+def transform_font(font, glyph_names, fixed, parametric, special):
+    """Transforms the glyphs in scope; returns (glyphs, layers, missing glyph names)."""
+    master_locations = {master.id: tuple(float(v) for v in master.axes) for master in font.masters}
+    master_ids = set(master_locations)
+    values = {}
+
+    def values_for_layer(layer):
+        """(x, y, scale, rotate, slant) for a layer, computed once per location."""
+        if parametric is None:
+            return fixed
+        location = layerLocation(font, layer, master_locations)
+        if location not in values:
+            x, y, scale, rotate, slant = parametric.valuesAt(location)
+            values[location] = (x, y, scale / 100.0, rotate, math.tan(math.radians(slant)))
+        return values[location]
+
+    if glyph_names:
+        glyphs = [font.glyphs[name] for name in glyph_names if font.glyphs[name] is not None]
+        missing = [name for name in glyph_names if font.glyphs[name] is None]
+    else:
+        glyphs = list(font.glyphs)
+        missing = []
+
+    glyph_count = 0
+    layer_count = 0
+    for glyph in glyphs:
+        layers = list(scope_layers(glyph, master_ids, special))
+        if not layers:
+            continue
+        for layer in layers:
+            # One composed matrix per layer, around the center of its bounds, as in the menu script
+            center_x, center_y = layerCenter(layer)
+            applyMatrix(layer, composeMatrix(*values_for_layer(layer), center_x, center_y))
+            layer_count += 1
+        glyph_count += 1
+    return glyph_count, layer_count, missing
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Transform master layers of a .glyphs source.")
+    parser.add_argument("source", help=".glyphs source")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("-o", "--output", help="where to save the transformed source")
+    target.add_argument("--in-place", action="store_true", help="overwrite the source")
+    parser.add_argument("-g", "--glyphs", nargs="+", help="glyph names (default: every glyph)")
+    parser.add_argument("--move", nargs=2, type=float, default=(0.0, 0.0), metavar=("X", "Y"))
+    parser.add_argument("--scale", type=float, default=100.0, help="percent")
+    parser.add_argument("--rotate", type=float, default=0.0, help="degrees, clockwise")
+    parser.add_argument("--slant", type=float, default=0.0, help="degrees")
+    parser.add_argument("--stops", help="per-master values, one stop per line: axis values : x y scale rotate slant")
+    parser.add_argument("--special", action="store_true", help="also transform brace and bracket layers")
+    args = parser.parse_args(argv)
+
+    try:
+        import glyphsLib
+    except ImportError:
+        print("❌ glyphsLib is required: pip install glyphsLib", file=sys.stderr)
+        return EXIT_ERROR
+
+    try:
+        font = glyphsLib.GSFont(args.source)
+    except Exception as e:
+        print(f"❌ {args.source}: {e}", file=sys.stderr)
+        return EXIT_ERROR
+
+    parametric = None
+    if args.stops:
+        try:
+            with open(args.stops, encoding="utf-8") as f:
+                stops = parseStops(f.read())
+        except (OSError, ValueError) as e:
+            print(f"❌ {args.stops}: {e}", file=sys.stderr)
+            return EXIT_ERROR
+        if not stops:
+            print(f"❌ {args.stops}: no stops defined", file=sys.stderr)
+            return EXIT_ERROR
+        if any(len(location) != len(font.axes) for location, _ in stops):
+            print(f"❌ {args.stops}: stops need {len(font.axes)} axis value(s)", file=sys.stderr)
+            return EXIT_ERROR
+        parametric = ParametricTransforms(stops)
+
+    fixed = (args.move[0], args.move[1], args.scale / 100.0, args.rotate, math.tan(math.radians(args.slant)))
+    glyph_count, layer_count, missing = transform_font(font, args.glyphs, fixed, parametric, args.special)
+    for name in missing:
+        print(f"⚠️ {name}: not in the font", file=sys.stderr)
+
+    output = args.source if args.in_place else args.output
+    font.save(output)
+    print(f"{glyph_count} glyph(s), {layer_count} layer(s) transformed → {output}")
+    return EXIT_OK
+
+
+if __name__ == "__main__":
+    if importlib.util.find_spec("GlyphsApp") is not None:
+        # Started from the Glyphs Scripts menu: use the Transformations Tool there
+        print('Transformations (CLI) runs in a terminal: python3 "Transformations (CLI).py" Family.glyphs --scale 95 -o Family-scaled.glyphs')
+    else:
+        sys.exit(main())
@@ -1,66 +1,267 @@
 # MenuTitle: 🔁 Component Swapper (all masters)
 # -*- coding: utf-8 -*-
-# Version: 1.2
-# Description: Swaps a component in selected glyphs, works in all masters.
+# Version: 1.3
+# Description: Swaps components in selected glyphs or in the whole font, in all masters and brace/bracket layers (backup layers are left alone). Takes one pair or a whole mapping table (CSV lines or a JSON object, optionally with regular expressions) and applies every swap in one pass.
 # Author: Fernando Díaz (Reset Type Studio) with help from AI.
 
-from GlyphsApp import Glyphs
-from vanilla import Window, EditText, Button
+import csv
+import io
+import json
+import re
+
+from GlyphsApp import Glyphs, GetOpenFile
+from vanilla import Window, EditText, Button, TextBox, TextEditor, CheckBox, PopUpButton
+
+SCOPES = ["Selected glyphs", "Whole font"]
+
+
+# ----------------------------
+# Mapping
+# ----------------------------
+
+def parse_mapping(text):
+    """
+    Reads 'old, new' pairs, one per line (CSV, so names may be quoted), or a
+    JSON object {"old": "new"}. Lines starting with # are ignored.
+    Returns a list of (old, new) in order.
+    """
+    text = text.strip()
+    if not text:
+        return []
+
+    if text.startswith("{"):
+        try:
+            data = json.loads(text)
+        except ValueError as e:
+            raise ValueError(f"Invalid JSON mapping: {e}")
+        return [(str(old).strip(), str(new).strip()) for old, new in data.items()]
+
+    pairs = []
+    for line_number, row in enumerate(csv.reader(io.StringIO(text)), start=1):
+        row = [cell.strip() for cell in row]
+        if not row or not row[0] or row[0].startswith("#"):
+            continue
+        if len(row) < 2 or not row[1]:
+            raise ValueError(f"Line {line_number}: expected 'old, new'")
+        pairs.append((row[0], row[1]))
+    return pairs
+
+
+def swap_layers(glyph):
+    """Master layers and brace/bracket layers; backup layers keep their history."""
+    return [layer for layer in glyph.layers if layer.isMasterLayer or layer.isSpecialLayer]
+
+
+def component_index(glyphs):
+    """
+    Reverse index in one pass over the swap layers: component base name →
+    the glyphs using it, in the order given.
+    """
+    index = {}
+    for glyph in glyphs:
+        for layer in swap_layers(glyph):
+            for component in layer.components:
+                users = index.setdefault(component.componentName, [])
+                if not users or users[-1] is not glyph:
+                    users.append(glyph)
+    return index
+
+
+class MappingResolver:
+    """
+    Resolves component bases against the mapping, each base only once. With
+    regex, patterns must match the whole name and the replacement may use
+    groups (\\1, \\g<name>). Earlier rows win when several match the same base.
+    Records which rows matched a base in use and which new bases are not in
+    the font.
+    """
+
+    def __init__(self, font, pairs, use_regex=False):
+        self.font = font
+        self.rules = []
+        for old, new in pairs:
+            if not use_regex:
+                self.rules.append((old, None, new))
+                continue
+            try:
+                self.rules.append((old, re.compile(old), new))
+            except re.error as e:
+                raise ValueError(f"Invalid pattern '{old}': {e}")
+        self.used = set()
+        self.missing = set()
+
+    def resolve(self, base):
+        """New name for base, or None when it stays."""
+        for old, pattern, new in self.rules:
+            if pattern is None:
+                if base != old:
+                    continue
+            else:
+                match = pattern.fullmatch(base)
+                if not match:
+                    continue
+                new = match.expand(new)
+            self.used.add(old)
+            if new == base:
+                return None
+            if self.font.glyphs[new] is None:
+                self.missing.add(new)
+                return None
+            return new
+        return None
+
+
+# ----------------------------
+# Swapping
+# ----------------------------
+
+def swap_all(font, glyphs, pairs, use_regex=False):
+    """
+    Applies every swap of the mapping in one pass over only the glyphs that use
+    an affected base, found through the reverse component index, on their
+    master and brace/bracket layers. Swaps whose new base does not exist in
+    the font are skipped. Returns a summary dict.
+    """
+    resolver = MappingResolver(font, pairs, use_regex)
+    index = component_index(glyphs)
+
+    resolved = {}
+    for base in index:
+        new = resolver.resolve(base)
+        if new is not None:
+            resolved[base] = new
+
+    affected = {}
+    for base in resolved:
+        for glyph in index[base]:
+            affected[glyph.name] = glyph
+
+    swaps = {}
+    changed_glyphs = []
+    font.disableUpdateInterface()
+    try:
+        for glyph in affected.values():
+            glyph.beginUndo()
+            try:
+                for layer in swap_layers(glyph):
+                    for component in layer.components:
+                        new = resolved.get(component.componentName)
+                        if new is None:
+                            continue
+                        pair = (component.componentName, new)
+                        component.componentName = new
+                        swaps[pair] = swaps.get(pair, 0) + 1
+            finally:
+                glyph.endUndo()
+            changed_glyphs.append(glyph.name)
+    finally:
+        font.enableUpdateInterface()
+
+    return {
+        "swaps": swaps,
+        "glyphs": changed_glyphs,
+        "missing": sorted(resolver.missing),
+        "unused": [old for old, _ in pairs if old not in resolver.used],
+    }
+
+
+# ----------------------------
+# UI
+# ----------------------------
 
 class SwapComponentsUI:
-    """Vanilla UI for swapping components in selected glyphs across all masters."""
+    """Vanilla UI for swapping components in selected glyphs or the whole font across all layers."""
 
     def __init__(self):
-        self.w = Window((300, 140), "Swap Components")
+        self.w = Window((340, 360), "Swap Components", minSize=(340, 360))
         self.w.original_input = EditText((10, 10, -10, 20), placeholder="Original Component")
         self.w.new_input = EditText((10, 40, -10, 20), placeholder="New Component")
-        self.w.swap_button = Button((10, 80, -10, 20), "Swap Components", callback=self.swap_callback)
-        self.w.status_message = EditText((10, 110, -10, 20), placeholder="Status: Ready", readOnly=True)
+        self.w.table_label = TextBox((10, 70, -10, 17), "Or a mapping table ('old, new' per line, or JSON):", sizeStyle="small")
+        self.w.table_input = TextEditor((10, 90, -10, -150))
+        self.w.load_button = Button((10, -140, 120, 20), "Load CSV…", sizeStyle="small", callback=self.load_callback)
+        self.w.regex_check = CheckBox((140, -140, -10, 20), "Regular expressions", sizeStyle="small")
+        self.w.scope_popup = PopUpButton((10, -110, -10, 20), SCOPES, sizeStyle="small")
+        self.w.swap_button = Button((10, -80, -10, 20), "Swap Components", callback=self.swap_callback)
+        self.w.status_message = EditText((10, -50, -10, 40), placeholder="Status: Ready", readOnly=True, sizeStyle="small")
         self.w.open()
 
-    def swap_components(self, original_component, new_component):
-        """Swaps one component for another in all masters of selected glyphs."""
+    def load_callback(self, sender):
+        """Loads a mapping file into the table field."""
+        path = GetOpenFile(message="Choose a component mapping", filetypes=["csv", "txt", "json"])
+        if not path:
+            return
+        with open(path, encoding="utf-8") as f:
+            self.w.table_input.set(f.read())
+
+    def swap_components(self, pairs, use_regex=False):
+        """Swaps every mapped component in all layers of the chosen glyphs."""
         font = Glyphs.font
         if not font:
             self.w.status_message.set("⚠️ No font open")
             print("Error: No font open.")
             return
 
-        selected_glyphs = {layer.parent for layer in font.selectedLayers}
-        if not selected_glyphs:
+        if self.w.scope_popup.get() == 1:
+            glyphs = list(font.glyphs)
+        else:
+            glyphs = list({layer.parent for layer in font.selectedLayers})
+        if not glyphs:
             self.w.status_message.set("⚠️ No glyphs selected")
             print("Error: No glyphs selected.")
             return
 
-        found = False
-        for thisMaster in font.masters:
-            for thisGlyph in selected_glyphs:
-                thisLayer = thisGlyph.layers[thisMaster.id]
-                for thisComponent in thisLayer.components:
-                    if thisComponent.name == original_component:
-                        thisComponent.name = new_component
-                        found = True
-                        print(f"✔ Swapped '{original_component}' → '{new_component}' in '{thisGlyph.name}' ({thisMaster.name})")
-
-        if found:
-            Glyphs.redraw()
-            self.w.status_message.set("✅ Swap completed")
-            print("✔ Component swap completed successfully.")
-            self.w.close()
+        try:
+            summary = swap_all(font, glyphs, pairs, use_regex)
+        except ValueError as e:
+            self.w.status_message.set(f"❌ {e}")
+            print(f"Error: {e}")
+            return
+
+        Glyphs.redraw()
+
+        total = sum(summary["swaps"].values())
+        for (old, new), count in sorted(summary["swaps"].items()):
+            print(f"✔ '{old}' → '{new}': {count} component(s)")
+        if summary["missing"]:
+            print(f"⚠️ Skipped, new base not in font: {', '.join(summary['missing'])}")
+        if summary["unused"]:
+            print(f"Not found in these glyphs: {', '.join(summary['unused'])}")
+
+        if total:
+            self.w.status_message.set(
+                f"✅ {total} swap(s) in {len(summary['glyphs'])} glyph(s)"
+                + (f" · ⚠️ {len(summary['missing'])} missing base(s)" if summary["missing"] else "")
+            )
+            print(f"✔ Component swap completed: {total} swap(s) in {len(summary['glyphs'])} glyph(s).")
+        elif summary["missing"]:
+            self.w.status_message.set(f"❌ New base(s) not in font: {', '.join(summary['missing'])}")
         else:
             self.w.status_message.set("❌ Component not found")
-            print(f"Error: Component '{original_component}' not found in selected glyphs.")
+            print("Error: None of the components were found in these glyphs.")
 
     def swap_callback(self, sender):
         """Callback function to execute swap on button press."""
         original = self.w.original_input.get().strip()
         new = self.w.new_input.get().strip()
 
+        try:
+            pairs = parse_mapping(self.w.table_input.get())
+        except ValueError as e:
+            self.w.status_message.set(f"❌ {e}")
+            print(f"Error: {e}")
+            return
         if original and new:
-            self.swap_components(original, new)
-        else:
+            pairs.insert(0, (original, new))
+        elif original or new:
             self.w.status_message.set("⚠️ Enter both names")
             print("Error: Please enter both component names.")
+            return
+
+        if pairs:
+            self.swap_components(pairs, bool(self.w.regex_check.get()))
+        else:
+            self.w.status_message.set("⚠️ Enter both names or a mapping")
+            print("Error: Please enter both component names or a mapping table.")
 
 # Run the UI
 SwapComponentsUI()
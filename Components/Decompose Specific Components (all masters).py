@@ -1,38 +1,122 @@
 # MenuTitle: ⛓️‍💥 Decompose Specific Components (all masters)
 # -*- coding: utf-8 -*-
-# Version: 1.4
-# Description: Decomposes only the specified component (and nested components) in all masters.
+# Version: 1.5
+# Description: Decomposes only the specified component (and every component nested inside it, at any depth) in all masters and brace/bracket layers, in the selected glyphs or in every glyph of the font that uses it.
 # Author: Fernando Díaz (Reset Type Studio) with help from AI.
 
 from GlyphsApp import Glyphs
-from vanilla import Window, EditText, Button, TextBox
+from vanilla import Window, EditText, Button, TextBox, PopUpButton
+
+SCOPES = ["Selected glyphs", "Every glyph using it"]
+
+
+# ----------------------------
+# Decomposition engine
+# ----------------------------
+
+def component_graph(font):
+    """
+    One pass over the font: base → bases it contains (on any layer), and the
+    reverse index base → names of the glyphs that use it.
+    """
+    children, users = {}, {}
+    for glyph in font.glyphs:
+        names = set()
+        for layer in glyph.layers:
+            for component in layer.components:
+                names.add(component.componentName)
+        children[glyph.name] = names
+        for name in names:
+            users.setdefault(name, set()).add(glyph.name)
+    return children, users
+
+
+def decomposition_order(children, component_name):
+    """
+    The component and all its transitively nested bases, parents before their
+    children, so one pass over a layer decomposes everything the component brings in.
+    """
+    closure, stack = {component_name}, [component_name]
+    while stack:
+        for child in children.get(stack.pop(), ()):
+            if child not in closure:
+                closure.add(child)
+                stack.append(child)
+
+    parents = {name: 0 for name in closure}
+    for name in closure:
+        for child in children.get(name, ()):
+            if child in closure:
+                parents[child] += 1
+
+    order = []
+    ready = [component_name]
+    while ready:
+        name = ready.pop()
+        order.append(name)
+        for child in sorted(children.get(name, ())):
+            if child in parents and child not in order:
+                parents[child] -= 1
+                if parents[child] == 0:
+                    ready.append(child)
+
+    # Cycles cannot be ordered; decompose whatever is left afterwards
+    order.extend(sorted(closure.difference(order)))
+    return order
+
+
+def decompose_layer(layer, order):
+    """Decomposes the bases of order on one layer; returns the number of decompositions."""
+    count = 0
+    for name in order:
+        for component in [c for c in layer.components if c.componentName == name]:
+            layer.decomposeComponent_(component)
+            count += 1
+    return count
+
+
+def decompose_in_glyphs(font, glyphs, order):
+    """Decomposes on all layers of glyphs in one batch. Returns {glyph name: decompositions}."""
+    targets = set(order)
+    done = {}
+    font.disableUpdateInterface()
+    try:
+        for glyph in glyphs:
+            if not any(c.componentName in targets for layer in glyph.layers for c in layer.components):
+                continue
+            glyph.beginUndo()
+            try:
+                count = sum(decompose_layer(layer, order) for layer in glyph.layers)
+            finally:
+                glyph.endUndo()
+            if count:
+                done[glyph.name] = count
+    finally:
+        font.enableUpdateInterface()
+    return done
+
+
+# ----------------------------
+# UI
+# ----------------------------
 
 class SmartDecomposeComponentsUI:
     """Vanilla UI for decomposing a selected component and its nested components inside the glyph."""
 
     def __init__(self):
-        self.w = Window((320, 180), "Smart Component Swapper", minSize=(320, 180), maxSize=(320, 180))
+        self.w = Window((320, 210), "Smart Component Swapper", minSize=(320, 210), maxSize=(320, 210))
 
         # UI Elements
         self.w.label = TextBox((10, 10, -10, 20), "Component to Decompose:")
         self.w.component_input = EditText((10, 30, -10, 20), placeholder="Enter component name")
+        self.w.scope_popup = PopUpButton((10, 62, -10, 20), SCOPES, sizeStyle="small")
 
-        self.w.decompose_button = Button((10, 70, -10, 30), "Decompose Component", callback=self.decompose_callback)
-        self.w.status_message = TextBox((10, 110, -10, 20), "Status: Ready", sizeStyle="small")
+        self.w.decompose_button = Button((10, 100, -10, 30), "Decompose Component", callback=self.decompose_callback)
+        self.w.status_message = TextBox((10, 140, -10, 60), "Status: Ready", sizeStyle="small")
 
         self.w.open()
         self.w.makeKey()  # Ensures the window stays on top
 
-    def get_nested_components(self, font, component_name):
-        """Returns a set of all nested components inside the given component."""
-        nested_components = set()
-        component_glyph = font.glyphs[component_name]
-        if component_glyph:
-            for layer in component_glyph.layers:
-                for sub_component in layer.components:
-                    nested_components.add(sub_component.name)
-        return nested_components
-
     def decompose_smart(self, font, component_to_decompose):
         """Decomposes the specified component and its nested components inside the glyph, keeping all others intact."""
         if not font:
@@ -40,49 +124,34 @@ class SmartDecomposeComponentsUI:
             print("Error: No font open.")
             return
 
-        selected_glyphs = {layer.parent for layer in font.selectedLayers}
-        if not selected_glyphs:
-            self.w.status_message.set("⚠️ No glyphs selected")
-            print("Error: No glyphs selected.")
-            return
-
-        # Collect all component names in the font
-        all_components = {comp.name for glyph in font.glyphs for layer in glyph.layers for comp in layer.components}
+        children, users = component_graph(font)
 
-        if component_to_decompose not in all_components:
+        if component_to_decompose not in users:
             self.w.status_message.set(f"❌ '{component_to_decompose}' not found")
             print(f"Error: Component '{component_to_decompose}' does not exist in the font.")
             return
 
-        # **Find nested components inside the component_to_decompose**
-        nested_components = self.get_nested_components(font, component_to_decompose)
-
-        found = False
-        for thisMaster in font.masters:
-            for thisGlyph in selected_glyphs:
-                thisLayer = thisGlyph.layers[thisMaster.id]
-
-                # **Step 1: Decompose the main component (component_to_decompose)**
-                for i in reversed(range(len(thisLayer.components))):  # Reverse to avoid index errors
-                    thisComponent = thisLayer.components[i]
-                    if thisComponent.name == component_to_decompose:
-                        thisLayer.decomposeComponent_(thisComponent)
-                        found = True
-                        print(f"✔ Decomposed '{thisComponent.name}' in '{thisGlyph.name}' ({thisMaster.name})")
-
-                # **Step 2: If that component had nested components, decompose them inside the glyph**
-                for i in reversed(range(len(thisLayer.components))):  
-                    thisComponent = thisLayer.components[i]
-                    if thisComponent.name in nested_components:
-                        thisLayer.decomposeComponent_(thisComponent)
-                        found = True
-                        print(f"✔ Decomposed nested '{thisComponent.name}' in '{thisGlyph.name}' ({thisMaster.name})")
-
-        if found:
+        if self.w.scope_popup.get() == 1:
+            glyphs = [font.glyphs[name] for name in sorted(users[component_to_decompose])]
+        else:
+            glyphs = list({layer.parent for layer in font.selectedLayers})
+            if not glyphs:
+                self.w.status_message.set("⚠️ No glyphs selected")
+                print("Error: No glyphs selected.")
+                return
+
+        order = decomposition_order(children, component_to_decompose)
+        done = decompose_in_glyphs(font, glyphs, order)
+
+        if done:
             Glyphs.redraw()
-            self.w.status_message.set("✅ Smart Decomposition completed!")
-            print(f"✔ Successfully decomposed '{component_to_decompose}' and its nested components.")
-            self.w.close()  
+            total = sum(done.values())
+            self.w.status_message.set(f"✅ {total} decomposition(s) in {len(done)} glyph(s)")
+            print(
+                f"✔ Decomposed '{component_to_decompose}'"
+                + (f" and nested {', '.join(order[1:])}" if len(order) > 1 else "")
+                + f" in {len(done)} glyph(s): {', '.join(sorted(done))}"
+            )
         else:
             self.w.status_message.set("❌ No matching components found")
             print(f"Warning: Component '{component_to_decompose}' was not found in selected glyphs.")
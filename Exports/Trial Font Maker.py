@@ -1,22 +1,647 @@
 # MenuTitle: 🎁 Trial Font Maker
 # -*- coding: utf-8 -*-
-# Version: 1.4
-# Description: This script creates the Trial versions of fonts. It works on a duplicate of the glyphs file, adds prefix to the font family name and instances, it removes all features and keeps only a selected set of glyphs before exporting them. 
+# Version: 1.9
+# Description: This script creates the Trial versions of fonts. It works on a duplicate of the glyphs file, adds prefix to the font family name and instances, it removes all features and keeps only a selected set of glyphs before exporting them. It can also subset already built fonts with fontTools, keeping only liga and kern and renaming the family, in parallel worker processes. Exports OTF, TTF, WOFF2 and variable trials from a background queue with progress and cancel. Kerning is pruned to the kept glyphs before export, optionally timing and weighing one instance with and without pruning.
 # Author: Fernando Díaz (Reset Type Studio) with help from AI.
 
 import vanilla
 import os
+import re
+import json
+import hashlib
+import time
+import fnmatch
+import shutil
+import subprocess
+import sys
+import tempfile
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from PyObjCTools.AppHelper import callLater
 from GlyphsApp import *
 
+# Shared modules live in the Libraries folder at the root of this repository
+LIBRARIES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Libraries")
+if LIBRARIES_PATH not in sys.path:
+    sys.path.insert(0, LIBRARIES_PATH)
+
+from resetTypeSubset import subsetOutputName  # noqa: E402
+
+# Run as a separate process for every built font that is subset
+STR_SUBSET_WORKER = os.path.join(LIBRARIES_PATH, "resetTypeSubset.py")
+
+try:
+    from fontTools import subset as ftSubset
+    from fontTools.ttLib import TTFont
+except ImportError:
+    ftSubset = None
+    TTFont = None
+
+try:
+    import brotli  # noqa: F401 (WOFF2 compression in fontTools)
+    BOOL_WOFF2 = TTFont is not None
+except ImportError:
+    BOOL_WOFF2 = False
+
+LIST_MODES = ["Re-export from sources", "Subset built fonts (fontTools)"]
+TUPLE_BINARY_EXTENSIONS = (".otf", ".ttf", ".woff", ".woff2")
+LIST_TRIAL_FEATURES = ["liga", "kern"]
+
+# Named charsets usable as @name in the glyph list
+DICT_CHARSET_PRESETS = {
+    "ascii": "U+0020-007E",
+    "latin1": "U+0020-007E U+00A0-00FF",
+    "uppercase": "U+0041-005A",
+    "lowercase": "U+0061-007A",
+    "figures": "zero one two three four five six seven eight nine",
+    "basic": ".notdef space U+0041-005A U+0061-007A @figures period comma",
+}
+
+STR_MANIFEST_NAME = "trial-manifest.json"
+INT_MANIFEST_VERSION = 1
+
+REGEX_UNICODE = re.compile(r"^U\+([0-9A-Fa-f]{4,6})(?:(?:-|\.\.)(?:U\+)?([0-9A-Fa-f]{4,6}))?$")
+
+
+# =============================
+# Glyph List Resolver
+# =============================
+
+class GlyphSetResolver:
+    """
+    Resolves a glyph list against one font: glyph names, U+XXXX and U+XXXX-YYYY
+    ranges, wildcards (*.sc, a*) and @presets. Names and codepoints are looked up
+    in maps built once per font, and the component closure keeps composites intact.
+    """
+
+    def __init__(self, thisFont):
+        self.thisFont = thisFont
+        self.setNames = set()
+        self.dictUnicodes = {}
+        self.dictSuffixes = {}
+        for thisGlyph in thisFont.glyphs:
+            strName = thisGlyph.name
+            self.setNames.add(strName)
+            for strUnicode in (thisGlyph.unicodes or []):
+                self.dictUnicodes[int(strUnicode, 16)] = strName
+            if "." in strName[1:]:
+                self.dictSuffixes.setdefault(strName[strName.index(".", 1):], []).append(strName)
+
+    def expandTokens(self, strSpec, setSeenPresets=None):
+        """Split the spec and inline @presets (once each)."""
+        setSeenPresets = set() if setSeenPresets is None else setSeenPresets
+        for strToken in re.split(r"[\s,]+", strSpec.strip()):
+            if not strToken:
+                continue
+            if strToken.startswith("@") and len(strToken) > 1:
+                strPreset = strToken[1:]
+                if strPreset in setSeenPresets:
+                    continue
+                setSeenPresets.add(strPreset)
+                if strPreset in DICT_CHARSET_PRESETS:
+                    yield from self.expandTokens(DICT_CHARSET_PRESETS[strPreset], setSeenPresets)
+                    continue
+            yield strToken
+
+    def matchWildcard(self, strToken):
+        """Names matching a wildcard; *.suffix uses the suffix index, other patterns scan."""
+        if strToken.startswith("*.") and not any(c in strToken[1:] for c in "*?["):
+            strSuffix = strToken[1:]
+            return [strName for strKey, listNames in self.dictSuffixes.items()
+                    if strKey.endswith(strSuffix) for strName in listNames]
+        return fnmatch.filter(self.setNames, strToken)
+
+    def resolve(self, strSpec):
+        """Returns (ordered glyph names incl. components, requested codepoints, missing tokens)."""
+        listNames = []
+        setUnicodes = set()
+        listMissing = []
+        setKept = set()
+
+        def keep(strName):
+            if strName not in setKept:
+                setKept.add(strName)
+                listNames.append(strName)
+
+        for strToken in self.expandTokens(strSpec):
+            thisMatch = REGEX_UNICODE.match(strToken)
+            if thisMatch:
+                intFirst = int(thisMatch.group(1), 16)
+                intLast = int(thisMatch.group(2) or thisMatch.group(1), 16)
+                for intCodepoint in range(intFirst, intLast + 1):
+                    setUnicodes.add(intCodepoint)
+                    strName = self.dictUnicodes.get(intCodepoint)
+                    if strName:
+                        keep(strName)
+                continue
+
+            if any(c in strToken for c in "*?["):
+                listMatches = self.matchWildcard(strToken)
+                if not listMatches:
+                    listMissing.append(strToken)
+                for strName in sorted(listMatches):
+                    keep(strName)
+                continue
+
+            if strToken.startswith("@"):
+                listMissing.append(strToken)  # Unknown preset
+            elif strToken in self.setNames:
+                keep(strToken)
+            else:
+                listMissing.append(strToken)
+
+        for strName in self.componentClosure(listNames):
+            keep(strName)
+
+        for strName in listNames:
+            thisGlyph = self.thisFont.glyphs[strName]
+            for strUnicode in (thisGlyph.unicodes or []):
+                setUnicodes.add(int(strUnicode, 16))
+
+        return listNames, setUnicodes, listMissing
+
+    def componentClosure(self, listNames):
+        """Every glyph used as a component, directly or nested, in any layer of the kept glyphs."""
+        setVisited = set(listNames)
+        listQueue = list(listNames)
+        listAdded = []
+        while listQueue:
+            thisGlyph = self.thisFont.glyphs[listQueue.pop()]
+            if thisGlyph is None:
+                continue
+            for thisLayer in thisGlyph.layers:
+                for thisComponent in thisLayer.components:
+                    strName = thisComponent.componentName
+                    if strName and strName not in setVisited and strName in self.setNames:
+                        setVisited.add(strName)
+                        listAdded.append(strName)
+                        listQueue.append(strName)
+        return listAdded
+
+
+# =============================
+# Build Manifest
+# =============================
+
+def changeStamp(thisGlyph):
+    """Serializable lastChange of a glyph, or None when Glyphs does not provide one."""
+    thisStamp = getattr(thisGlyph, "lastChange", None)
+    if thisStamp is None:
+        return None
+    try:
+        return float(thisStamp.timeIntervalSince1970())
+    except Exception:
+        return str(thisStamp)
+
+
+def plainValue(thisValue):
+    """
+    Glyphs values (NSDictionary, NSArray, NSNumber…) as plain JSON types, so a
+    payload hashes the same on every run: str() of Cocoa objects is not stable.
+    """
+    if thisValue is None or isinstance(thisValue, (bool, str)):
+        return thisValue
+    if isinstance(thisValue, (int, float)):
+        return float(thisValue)
+    if hasattr(thisValue, "items"):
+        return {str(k): plainValue(v) for k, v in sorted(thisValue.items(), key=lambda item: str(item[0]))}
+    if isinstance(thisValue, (list, tuple)) or hasattr(thisValue, "__iter__"):
+        return [plainValue(v) for v in thisValue]
+    return str(thisValue)
+
+
+def hashPayload(thisPayload):
+    strText = json.dumps(thisPayload, sort_keys=True, default=str)
+    return hashlib.blake2b(strText.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def contributingMasters(thisFont, thisInstance):
+    """Masters at the grid corners around the instance; all masters when it is not on a full grid."""
+    listMasters = list(thisFont.masters)
+    try:
+        tupleLocation = tuple(float(c) for c in thisInstance.axes)
+        dictByLocation = {tuple(float(c) for c in m.axes): m for m in listMasters}
+    except Exception:
+        return listMasters
+
+    listCorners = [()]
+    for intAxis, floatValue in enumerate(tupleLocation):
+        listCoords = sorted({tupleMaster[intAxis] for tupleMaster in dictByLocation})
+        listBelow = [c for c in listCoords if c <= floatValue] or listCoords[:1]
+        listAbove = [c for c in listCoords if c >= floatValue] or listCoords[-1:]
+        listCorners = [tupleCorner + (c,) for tupleCorner in listCorners for c in sorted({listBelow[-1], listAbove[0]})]
+
+    if all(tupleCorner in dictByLocation for tupleCorner in listCorners):
+        return [dictByLocation[tupleCorner] for tupleCorner in listCorners]
+    return listMasters
+
+
+TUPLE_MASTER_METRICS = ("ascender", "capHeight", "xHeight", "descender", "italicAngle")
+TUPLE_INSTANCE_PROPERTIES = ("familyName", "weightClass", "widthClass", "isItalic", "isBold", "linkStyle", "exports")
+
+
+def attributeValues(thisObject, tupleNames):
+    """Named attributes of a Glyphs object as plain values; missing ones are None."""
+    return {strName: getattr(thisObject, strName, None) for strName in tupleNames}
+
+
+def masterPayload(thisFont, thisMaster):
+    """Master inputs of an instance: location, metrics, zones, custom parameters and kerning."""
+    return {
+        "id": thisMaster.id,
+        "axes": list(thisMaster.axes),
+        "metrics": attributeValues(thisMaster, TUPLE_MASTER_METRICS),
+        "metricValues": [
+            (getattr(thisMetric, "position", None), getattr(thisMetric, "overshoot", None))
+            for thisMetric in (getattr(thisMaster, "metrics", None) or [])
+        ],
+        "alignmentZones": [
+            (thisZone.position, thisZone.size) for thisZone in (getattr(thisMaster, "alignmentZones", None) or [])
+        ],
+        "parameters": [(p.name, plainValue(p.value)) for p in thisMaster.customParameters],
+        "kerning": plainValue(thisFont.kerning.get(thisMaster.id)) if thisFont.kerning else None,
+    }
+
+
+def instanceKey(thisFont, thisInstance, listGlyphsToKeep, strPrefix, dictOptions):
+    """Hash of everything that ends up in one re-exported trial instance."""
+    listMasters = contributingMasters(thisFont, thisInstance)
+    return hashPayload({
+        "family": thisFont.familyName,
+        "version": (thisFont.versionMajor, thisFont.versionMinor),
+        "fontParameters": [(p.name, plainValue(p.value)) for p in thisFont.customParameters],
+        "instance": (thisInstance.name, thisInstance.fontName, list(thisInstance.axes)),
+        "instanceProperties": attributeValues(thisInstance, TUPLE_INSTANCE_PROPERTIES),
+        "instanceNames": [
+            (getattr(p, "key", None), getattr(p, "languageTag", None), getattr(p, "value", None))
+            for p in (getattr(thisInstance, "properties", None) or [])
+        ],
+        "instanceParameters": [(p.name, plainValue(p.value)) for p in thisInstance.customParameters],
+        "masters": [masterPayload(thisFont, thisMaster) for thisMaster in listMasters],
+        "glyphs": [(strName, changeStamp(thisFont.glyphs[strName])) for strName in listGlyphsToKeep],
+        "prefix": strPrefix,
+        "options": dictOptions,
+    })
+
+
+def binaryKey(strPath, setGlyphNames, setUnicodes, strPrefix, dictOptions):
+    """Hash of a built font's bytes and the subsetting inputs."""
+    thisDigest = hashlib.blake2b(digest_size=16)
+    with open(strPath, "rb") as thisFile:
+        for bytesBlock in iter(lambda: thisFile.read(1 << 20), b""):
+            thisDigest.update(bytesBlock)
+    return hashPayload({
+        "binary": thisDigest.hexdigest(),
+        "glyphs": sorted(setGlyphNames),
+        "unicodes": sorted(setUnicodes),
+        "prefix": strPrefix,
+        "options": dictOptions,
+    })
+
+
+class BuildManifest:
+    """
+    Input hash of every trial file in the output directory, so unchanged ones
+    are not rebuilt. With boolReuse off every file counts as changed, but the
+    entries of files not rebuilt in this run are still kept.
+    """
+
+    def __init__(self, strDirectory, boolReuse=True):
+        self.strPath = os.path.join(strDirectory, STR_MANIFEST_NAME)
+        self.strDirectory = strDirectory
+        self.boolReuse = boolReuse
+        self.dictEntries = {}
+
+    def load(self):
+        try:
+            with open(self.strPath, "r", encoding="utf-8") as thisFile:
+                dictData = json.load(thisFile)
+        except (OSError, ValueError):
+            return
+        if dictData.get("version") == INT_MANIFEST_VERSION:
+            self.dictEntries = dictData.get("files", {})
+
+    def isCurrent(self, strFileName, strKey):
+        return (
+            self.boolReuse
+            and self.dictEntries.get(strFileName) == strKey
+            and os.path.exists(os.path.join(self.strDirectory, strFileName))
+        )
+
+    def record(self, strFileName, strKey):
+        self.dictEntries[strFileName] = strKey
+
+    def save(self):
+        try:
+            with open(self.strPath, "w", encoding="utf-8") as thisFile:
+                json.dump({"version": INT_MANIFEST_VERSION, "files": self.dictEntries}, thisFile, indent=1, sort_keys=True)
+        except OSError as e:
+            print(f"⚠️ Could not save {self.strPath}: {e}")
+
+
+# =============================
+# Kerning Pruning
+# =============================
+
+def kerningKeyName(strKey, dictNames):
+    """Kerning dicts key glyphs by id; the kerning API wants glyph names. Group keys stay."""
+    return strKey if strKey.startswith("@") else dictNames.get(strKey, strKey)
+
+
+def pruneKerning(thisFont, listGlyphsToKeep):
+    """
+    Drops kerning pairs that reference glyphs outside the keep set and
+    collapses groups left with a single kept member into glyph pairs
+    (existing glyph exceptions win). Works on the trial copy in place,
+    through removeKerningForPair and setKerningForPair, since the kerning
+    dict of a font cannot be written to directly.
+    Returns (pairs before, pairs after, collapsed groups).
+    """
+    setKept = set(listGlyphsToKeep)
+    dictKeptIds = {}
+    dictNames = {}
+    dictLeftMembers = defaultdict(list)  # @MMK_L_ group: glyphs whose right side is in it
+    dictRightMembers = defaultdict(list)  # @MMK_R_ group: glyphs whose left side is in it
+    for thisGlyph in thisFont.glyphs:
+        dictNames[thisGlyph.id] = thisGlyph.name
+        if thisGlyph.name not in setKept:
+            continue
+        dictKeptIds[thisGlyph.id] = thisGlyph
+        if thisGlyph.rightKerningGroup:
+            dictLeftMembers["@MMK_L_" + thisGlyph.rightKerningGroup].append(thisGlyph)
+        if thisGlyph.leftKerningGroup:
+            dictRightMembers["@MMK_R_" + thisGlyph.leftKerningGroup].append(thisGlyph)
+
+    def resolveKey(strKey, dictMembers):
+        if strKey.startswith("@"):
+            listMembers = dictMembers.get(strKey)
+            if not listMembers:
+                return None
+            return listMembers[0].id if len(listMembers) == 1 else strKey
+        return strKey if strKey in dictKeptIds or strKey in setKept else None
+
+    intBefore = 0
+    intAfter = 0
+    for thisMaster in thisFont.masters:
+        dictMasterKerning = thisFont.kerning.get(thisMaster.id) if thisFont.kerning else None
+        if not dictMasterKerning:
+            continue
+        # Plain copy: the live kerning changes under the removals below
+        dictOriginal = {strLeft: dict(dictRights) for strLeft, dictRights in dictMasterKerning.items()}
+
+        dictPruned = defaultdict(dict)
+        # Group pairs first, so glyph exceptions overwrite collapsed group pairs
+        for strLeft in sorted(dictOriginal, key=lambda k: not k.startswith("@")):
+            dictRights = dictOriginal[strLeft]
+            intBefore += len(dictRights)
+            strNewLeft = resolveKey(strLeft, dictLeftMembers)
+            if strNewLeft is None:
+                continue
+            for strRight in sorted(dictRights, key=lambda k: not k.startswith("@")):
+                strNewRight = resolveKey(strRight, dictRightMembers)
+                if strNewRight is None:
+                    continue
+                boolException = not strLeft.startswith("@") or not strRight.startswith("@")
+                if boolException or strNewRight not in dictPruned[strNewLeft]:
+                    dictPruned[strNewLeft][strNewRight] = dictRights[strRight]
+        intAfter += sum(len(dictRights) for dictRights in dictPruned.values())
+
+        for strLeft, dictRights in dictOriginal.items():
+            for strRight in dictRights:
+                if strRight not in dictPruned.get(strLeft, {}):
+                    thisFont.removeKerningForPair(
+                        thisMaster.id, kerningKeyName(strLeft, dictNames), kerningKeyName(strRight, dictNames)
+                    )
+        for strLeft, dictRights in dictPruned.items():
+            for strRight, floatValue in dictRights.items():
+                if dictOriginal.get(strLeft, {}).get(strRight) != floatValue:
+                    thisFont.setKerningForPair(
+                        thisMaster.id, kerningKeyName(strLeft, dictNames), kerningKeyName(strRight, dictNames), floatValue
+                    )
+
+    # Single-member groups now live on as glyph pairs
+    intCollapsed = 0
+    for dictMembers, strAttribute in ((dictLeftMembers, "rightKerningGroup"), (dictRightMembers, "leftKerningGroup")):
+        for listMembers in dictMembers.values():
+            if len(listMembers) == 1:
+                setattr(listMembers[0], strAttribute, None)
+                intCollapsed += 1
+
+    return intBefore, intAfter, intCollapsed
+
+
+# =============================
+# Subsetting Built Fonts
+# =============================
+
+def workerPython():
+    """The interpreter Glyphs runs on, so the subset workers see the same fontTools."""
+    strVersion = f"python{sys.version_info.major}.{sys.version_info.minor}"
+    for strCandidate in (
+        os.path.join(sys.prefix, "bin", strVersion),
+        os.path.join(sys.prefix, "bin", "python3"),
+        sys.executable,
+    ):
+        if strCandidate and os.path.basename(strCandidate).startswith("python") and os.access(strCandidate, os.X_OK):
+            return strCandidate
+    return shutil.which("python3")
+
+
+def runSubsetWorker(strInputPath, strSaveDirectory, setGlyphNames, setUnicodes, strPrefix, boolWoff2=False):
+    """
+    Subsets one built font in its own Python process: fontTools subsetting is
+    CPU-bound Python, so threads alone would take turns on the GIL. The calling
+    thread only waits. Returns the worker's stats dict.
+    """
+    strPython = workerPython()
+    if not strPython:
+        raise RuntimeError("No Python interpreter found for the subset workers.")
+    dictJob = {
+        "input": strInputPath,
+        "directory": strSaveDirectory,
+        "glyphs": sorted(setGlyphNames),
+        "unicodes": sorted(setUnicodes),
+        "prefix": strPrefix,
+        "features": LIST_TRIAL_FEATURES,
+        "woff2": boolWoff2,
+    }
+    dictEnvironment = dict(os.environ, PYTHONPATH=os.pathsep.join(strPath for strPath in sys.path if strPath))
+    thisResult = subprocess.run(
+        [strPython, STR_SUBSET_WORKER], input=json.dumps(dictJob), capture_output=True, text=True, env=dictEnvironment,
+    )
+    if thisResult.returncode != 0:
+        listLines = (thisResult.stderr or thisResult.stdout or "").strip().splitlines()
+        raise RuntimeError(listLines[-1] if listLines else f"subset worker exited with {thisResult.returncode}")
+    return json.loads(thisResult.stdout)
+
+
+def compressWoff2(strSourcePath, strOutputPath):
+    """Compresses an exported font to WOFF2 and removes the intermediate file."""
+    thisTTFont = TTFont(strSourcePath)
+    thisTTFont.flavor = "woff2"
+    thisTTFont.save(strOutputPath)
+    thisTTFont.close()
+    os.remove(strSourcePath)
+    return strOutputPath
+
+
+def exportSucceeded(thisResult):
+    """GSInstance.generate returns True (or None) on success and a list of errors otherwise."""
+    return thisResult is True or thisResult is None
+
+
+def folderState(strDirectory):
+    """Modification time of every file in a folder, to tell which files an export wrote."""
+    return {strName: os.path.getmtime(os.path.join(strDirectory, strName)) for strName in os.listdir(strDirectory)}
+
+
+def exportedPath(thisInstance, strExpectedPath, dictBefore):
+    """
+    Moves the file an export just wrote to strExpectedPath and returns that path.
+    Glyphs names container outputs (like WOFF2) itself, so the file is taken
+    from the instance's last export or from the files with the same base name
+    that are new or changed in the folder since dictBefore (see folderState).
+    """
+    strDirectory, strName = os.path.split(strExpectedPath)
+    listWritten = sorted(
+        (os.path.join(strDirectory, n) for n, t in folderState(strDirectory).items() if dictBefore.get(n) != t),
+        key=os.path.getmtime, reverse=True,
+    )
+    strBaseName = strName.split(".")[0]
+    listCandidates = [getattr(thisInstance, "lastExportedFilePath", None), strExpectedPath] + [
+        strPath for strPath in listWritten if os.path.basename(strPath).split(".")[0] == strBaseName
+    ]
+    strActualPath = next((strPath for strPath in listCandidates if strPath in listWritten), None)
+    if strActualPath is None:
+        raise RuntimeError(f"the export reported success but {strName} was not found")
+    if strActualPath != strExpectedPath:
+        os.replace(strActualPath, strExpectedPath)
+    return strExpectedPath
+
+
+# =============================
+# Export Queue
+# =============================
+
+class ExportJob:
+    """One output file: an optional main-thread step (Glyphs export) and an optional worker step."""
+
+    def __init__(self, strLabel, fnMain=None, fnWorker=None, fnDone=None):
+        self.strLabel = strLabel
+        self.fnMain = fnMain
+        self.fnWorker = fnWorker
+        self.fnDone = fnDone
+
+
+class ExportQueue:
+    """
+    Runs export jobs without blocking the UI. Glyphs exports must run on the
+    main thread, so they are stepped one per run loop pass with callLater;
+    headless work goes to a thread pool and is collected as it finishes.
+    Subsetting threads only wait on their own worker process, so fonts are
+    subset on all cores; WOFF2 compression runs in the thread itself.
+    """
+
+    def __init__(self, fnProgress, fnFinish):
+        self.listJobs = []
+        self.intNext = 0
+        self.intDone = 0
+        self.listErrors = []
+        self.dictRunning = {}
+        self.boolCancelled = False
+        self.fnProgress = fnProgress
+        self.fnFinish = fnFinish
+        self.thisPool = None
+        self.dictStats = defaultdict(float)
+        self.floatStarted = None
+
+    def add(self, thisJob):
+        self.listJobs.append(thisJob)
+
+    def start(self):
+        # Threads rather than a process pool, which would fork the whole Glyphs app;
+        # CPU-bound subsetting gets its own processes through runSubsetWorker
+        self.thisPool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+        self.floatStarted = time.time()
+        callLater(0.0, self.step)
+
+    def cancel(self):
+        self.boolCancelled = True
+        for thisFuture in list(self.dictRunning):
+            thisFuture.cancel()
+
+    def step(self):
+        self.collect()
+
+        if not self.boolCancelled and self.intNext < len(self.listJobs):
+            thisJob = self.listJobs[self.intNext]
+            self.intNext += 1
+            self.fnProgress(self.finished(), len(self.listJobs), thisJob.strLabel)
+            try:
+                thisResult = thisJob.fnMain() if thisJob.fnMain else None
+                if thisJob.fnWorker:
+                    self.dictRunning[self.thisPool.submit(thisJob.fnWorker, thisResult)] = thisJob
+            except Exception as e:
+                self.fail(thisJob, e)
+            else:
+                if not thisJob.fnWorker:
+                    self.complete(thisJob, thisResult)
+            callLater(0.0, self.step)
+            return
+
+        if self.dictRunning:
+            self.fnProgress(self.finished(), len(self.listJobs), f"Waiting for {len(self.dictRunning)} job(s)…")
+            callLater(0.1, self.step)
+            return
+
+        self.thisPool.shutdown(wait=False)
+        self.dictStats["seconds"] = time.time() - self.floatStarted
+        self.fnFinish(self)
+
+    def collect(self):
+        """Hands finished worker results back to their jobs, on the main thread."""
+        for thisFuture in [f for f in self.dictRunning if f.done()]:
+            thisJob = self.dictRunning.pop(thisFuture)
+            if thisFuture.cancelled():
+                continue
+            try:
+                thisResult = thisFuture.result()
+            except Exception as e:
+                self.fail(thisJob, e)
+                continue
+            self.complete(thisJob, thisResult)
+
+    def finished(self):
+        """Jobs that have either succeeded or failed."""
+        return self.intDone + len(self.listErrors)
+
+    def complete(self, thisJob, thisResult):
+        """Counts a job as done once its completion step succeeded; otherwise it fails, once."""
+        if thisJob.fnDone:
+            try:
+                thisJob.fnDone(thisResult)
+            except Exception as e:
+                self.fail(thisJob, e)
+                return
+        self.intDone += 1
+
+    def fail(self, thisJob, thisError):
+        self.listErrors.append(f"{thisJob.strLabel}: {thisError}")
+
+
+# =============================
+# UI
+# =============================
+
 class TrialFontMaker:
     """Creates a trial version of the font with a custom glyph set and prefix."""
 
     def __init__(self):
         """Initialize the UI for selecting glyphs, prefix, and save directory."""
-        self.uiWindow = vanilla.FloatingWindow((400, 280), "Trial Font Maker") 
+        self.uiWindow = vanilla.FloatingWindow((400, 486), "Trial Font Maker") 
 
         # Glyphs to keep input
-        self.uiWindow.txtGlyphsToKeep = vanilla.TextBox((10, 10, -10, 17), "Glyphs to Keep (space-separated):")
+        self.uiWindow.txtGlyphsToKeep = vanilla.TextBox((10, 10, -10, 17), "Glyphs to Keep (names, U+0041-005A, *.sc, @preset):")
         self.uiWindow.inputGlyphs = vanilla.TextEditor((10, 30, -10, 80),
             ".notdef space A B C D E F G H I J K L M N O P Q R S T U V W X Y Z a b c d e f g h i j k l m n o p q r s t u v w x y z zero one two three four five six seven eight nine period comma"
         )
@@ -30,8 +655,37 @@ class TrialFontMaker:
         self.uiWindow.inputDirectory = vanilla.EditText((10, 190, -70, 22), os.path.join(os.path.expanduser("~"), "Desktop"))
         self.uiWindow.btnDirectory = vanilla.Button((-60, 190, -10, 22), "...", callback=self.selectDirectory)
 
+        # Mode and built fonts directory (subset mode)
+        self.uiWindow.txtMode = vanilla.TextBox((10, 222, 60, 17), "Mode:")
+        self.uiWindow.popMode = vanilla.PopUpButton((70, 220, -10, 22), LIST_MODES, callback=self.modeChanged)
+        self.uiWindow.txtBuiltDirectory = vanilla.TextBox((10, 250, -10, 17), "Built Fonts Directory:")
+        self.uiWindow.inputBuiltDirectory = vanilla.EditText((10, 270, -70, 22), "")
+        self.uiWindow.btnBuiltDirectory = vanilla.Button((-60, 270, -10, 22), "...", callback=self.selectBuiltDirectory)
+
+        # Output formats
+        self.uiWindow.txtFormats = vanilla.TextBox((10, 304, 60, 17), "Formats:")
+        self.uiWindow.chkOTF = vanilla.CheckBox((70, 302, 60, 20), "OTF", value=True)
+        self.uiWindow.chkTTF = vanilla.CheckBox((130, 302, 60, 20), "TTF", value=False)
+        self.uiWindow.chkWOFF2 = vanilla.CheckBox((190, 302, 75, 20), "WOFF2", value=False)
+        self.uiWindow.chkVariable = vanilla.CheckBox((265, 302, -10, 20), "Variable", value=False)
+
+        # Incremental export
+        self.uiWindow.chkOnlyChanged = vanilla.CheckBox((10, 330, -10, 20), "Only export instances whose inputs changed", value=True, sizeStyle="small")
+
+        # Kerning pruning comparison
+        self.uiWindow.chkMeasurePruning = vanilla.CheckBox((10, 350, -10, 20), "Measure kerning pruning (exports one instance with and without)", value=False, sizeStyle="small")
+
         # Run button
-        self.uiWindow.btnRun = vanilla.Button((10, 230, -10, 22), "Generate Trial Font", callback=self.runScript)
+        self.uiWindow.btnRun = vanilla.Button((10, 382, -10, 22), "Generate Trial Font", callback=self.runScript)
+
+        # Progress
+        self.uiWindow.progress = vanilla.ProgressBar((10, 420, -100, 16), minValue=0, maxValue=1)
+        self.uiWindow.btnCancel = vanilla.Button((-90, 416, -10, 22), "Cancel", callback=self.cancelExport)
+        self.uiWindow.btnCancel.enable(False)
+        self.uiWindow.txtStatus = vanilla.TextBox((10, 448, -10, 30), "", sizeStyle="small")
+
+        self.thisQueue = None
+        self.modeChanged(None)
 
         self.uiWindow.open()
 
@@ -43,6 +697,22 @@ class TrialFontMaker:
             strCleanPath = os.path.abspath(listFolderPath[0].strip())  # Normalize path
             self.uiWindow.inputDirectory.set(strCleanPath)
 
+    def selectBuiltDirectory(self, sender):
+        """Open folder selection dialog for the already built fonts."""
+        import vanilla.dialogs
+        listFolderPath = vanilla.dialogs.getFolder("Select built fonts directory")
+        if listFolderPath:
+            self.uiWindow.inputBuiltDirectory.set(os.path.abspath(listFolderPath[0].strip()))
+
+    def modeChanged(self, sender):
+        """Enable the built fonts directory only in subset mode; subsets keep the built formats."""
+        boolSubset = self.uiWindow.popMode.get() == 1
+        self.uiWindow.inputBuiltDirectory.enable(boolSubset)
+        self.uiWindow.btnBuiltDirectory.enable(boolSubset)
+        for thisCheckBox in (self.uiWindow.chkOTF, self.uiWindow.chkTTF, self.uiWindow.chkVariable):
+            thisCheckBox.enable(not boolSubset)
+        self.uiWindow.chkMeasurePruning.enable(not boolSubset)
+
     def showError(self, strMessage):
         """Display an error message in a Vanilla window."""
         self.errorWindow = vanilla.FloatingWindow((300, 100), "Error")
@@ -56,9 +726,9 @@ class TrialFontMaker:
 
     def showReport(self, strMessage):
         """Display a final report window after exporting."""
-        self.reportWindow = vanilla.FloatingWindow((350, 100), "Export Report")
-        self.reportWindow.txtMessage = vanilla.TextBox((10, 10, -10, 40), strMessage)
-        self.reportWindow.btnClose = vanilla.Button((10, 60, -10, 20), "OK", callback=self.closeReportWindow)
+        self.reportWindow = vanilla.FloatingWindow((350, 160), "Export Report")
+        self.reportWindow.txtMessage = vanilla.TextBox((10, 10, -10, 100), strMessage)
+        self.reportWindow.btnClose = vanilla.Button((10, 120, -10, 20), "OK", callback=self.closeReportWindow)
         self.reportWindow.open()
 
     def closeReportWindow(self, sender):
@@ -68,7 +738,6 @@ class TrialFontMaker:
     def runScript(self, sender):
         """Execute the script to create the trial font."""
         strGlyphsToKeep = self.uiWindow.inputGlyphs.get().strip()
-        listGlyphsToKeep = strGlyphsToKeep.split()
         strSaveDirectory = self.uiWindow.inputDirectory.get().strip()
         strPrefix = self.uiWindow.inputPrefix.get().strip()
 
@@ -84,11 +753,129 @@ class TrialFontMaker:
             self.showError("Prefix cannot be empty.")
             return
 
-        intTotalExports = 0
+        thisManifest = BuildManifest(strSaveDirectory, bool(self.uiWindow.chkOnlyChanged.get()))
+        thisManifest.load()
+
+        self.thisQueue = ExportQueue(self.exportProgress, self.exportFinished)
+        self.thisQueue.thisManifest = thisManifest
+
+        if self.uiWindow.popMode.get() == 1:
+            boolQueued = self.queueSubset(strGlyphsToKeep, strSaveDirectory, strPrefix, thisManifest)
+        else:
+            boolQueued = self.queueReexport(strGlyphsToKeep, strSaveDirectory, strPrefix, thisManifest)
+        if not boolQueued:
+            return
+
+        self.uiWindow.btnRun.enable(False)
+        self.uiWindow.btnCancel.enable(True)
+        self.thisQueue.start()
 
+    def queueSubset(self, strGlyphsToKeep, strSaveDirectory, strPrefix, thisManifest):
+        """Queue a worker job per built font in the built fonts directory."""
+        if ftSubset is None:
+            self.showError("fontTools is not installed. Install it in Glyphs › Settings › Addons › Modules.")
+            return False
+
+        strBuiltDirectory = self.uiWindow.inputBuiltDirectory.get().strip()
+        if not os.path.isdir(strBuiltDirectory):
+            self.showError("Invalid built fonts directory.")
+            return False
+
+        listBinaries = sorted(
+            os.path.join(strBuiltDirectory, strFileName)
+            for strFileName in os.listdir(strBuiltDirectory)
+            if strFileName.lower().endswith(TUPLE_BINARY_EXTENSIONS)
+        )
+        if not listBinaries:
+            self.showError("No OTF, TTF or WOFF files in the built fonts directory.")
+            return False
+
+        # Union over the open sources, so production-named binaries subset by codepoint too
+        setGlyphNames = set()
+        setUnicodes = set()
         for thisFont in Glyphs.fonts:
+            listNames, setFontUnicodes, _ = GlyphSetResolver(thisFont).resolve(strGlyphsToKeep)
+            setGlyphNames.update(listNames)
+            setUnicodes.update(setFontUnicodes)
+
+        boolWoff2 = bool(self.uiWindow.chkWOFF2.get())
+        if boolWoff2 and not BOOL_WOFF2:
+            self.showError("WOFF2 output needs the brotli module. Install it in Glyphs › Settings › Addons › Modules.")
+            return False
+        dictOptions = {"mode": "subset", "features": LIST_TRIAL_FEATURES, "woff2": boolWoff2}
+
+        self.thisQueue.intSkipped = 0
+        for strPath in listBinaries:
+            strOutputName = subsetOutputName(strPath, strPrefix)
+            strKey = binaryKey(strPath, setGlyphNames, setUnicodes, strPrefix, dictOptions)
+            if thisManifest.isCurrent(strOutputName, strKey):
+                self.thisQueue.intSkipped += 1
+                continue
+
+            def fnWorker(_, strPath=strPath):
+                return runSubsetWorker(strPath, strSaveDirectory, setGlyphNames, setUnicodes, strPrefix, boolWoff2)
+
+            def fnDone(dictResult, strOutputName=strOutputName, strKey=strKey):
+                thisManifest.record(strOutputName, strKey)
+                for strStat in ("gposBefore", "gposAfter", "sizeBefore", "sizeAfter"):
+                    self.thisQueue.dictStats[strStat] += dictResult[strStat]
+                print(
+                    f"{strOutputName}: GPOS {dictResult['gposBefore']} → {dictResult['gposAfter']} bytes, "
+                    f"file {dictResult['sizeBefore']} → {dictResult['sizeAfter']} bytes, {dictResult['seconds']:.2f}s"
+                )
+
+            self.thisQueue.add(ExportJob(f"Subsetting {os.path.basename(strPath)}", fnWorker=fnWorker, fnDone=fnDone))
+        return True
+
+    def queueReexport(self, strGlyphsToKeep, strSaveDirectory, strPrefix, thisManifest):
+        """Duplicate each open font and queue its instances, per format, with Keep Glyphs."""
+        listFormats = [
+            strFormat for strFormat, thisCheckBox in (
+                ("OTF", self.uiWindow.chkOTF), ("TTF", self.uiWindow.chkTTF), ("WOFF2", self.uiWindow.chkWOFF2),
+            ) if thisCheckBox.get()
+        ]
+        boolVariable = bool(self.uiWindow.chkVariable.get())
+        if not listFormats and not boolVariable:
+            self.showError("Choose at least one format.")
+            return False
+
+        self.thisQueue.intSkipped = 0
+        self.listTrialFonts = []  # Keep the copies alive until the queue is done
+
+        for thisFont in Glyphs.fonts:
+            # Step 0: Resolve the glyph list against this font
+            listGlyphsToKeep, _, listMissingGlyphs = GlyphSetResolver(thisFont).resolve(strGlyphsToKeep)
+
+            # Step 0b: Hash each output's inputs; unchanged ones are skipped
+            listPending = []
+            for intIndex, thisInstance in enumerate(thisFont.instances):
+                for strFormat in listFormats:
+                    strFileName = f"{strPrefix}-{thisInstance.fontName}.{strFormat.lower()}"
+                    dictOptions = {"mode": "reexport", "format": strFormat, "features": ["liga"]}
+                    strKey = instanceKey(thisFont, thisInstance, listGlyphsToKeep, strPrefix, dictOptions)
+                    if thisManifest.isCurrent(strFileName, strKey):
+                        self.thisQueue.intSkipped += 1
+                    else:
+                        listPending.append((intIndex, strFormat, strFileName, strKey))
+
+            strVariableName = f"{strPrefix}-{thisFont.familyName.replace(' ', '')}VF.ttf"
+            strVariableKey = hashPayload({
+                "instances": [
+                    instanceKey(thisFont, thisInstance, listGlyphsToKeep, strPrefix, {"mode": "variable"})
+                    for thisInstance in thisFont.instances
+                ],
+                "masters": [(m.id, list(m.axes)) for m in thisFont.masters],
+            })
+            boolVariablePending = boolVariable and not thisManifest.isCurrent(strVariableName, strVariableKey)
+            if boolVariable and not boolVariablePending:
+                self.thisQueue.intSkipped += 1
+
+            if not listPending and not boolVariablePending:
+                continue
+
             # Step 1: Duplicate the font
             thisTrialFont = thisFont.copy()
+            self.listTrialFonts.append(thisTrialFont)
 
             # Step 2: Modify font family name with prefix
             if not thisTrialFont.familyName.startswith(strPrefix + " "):
@@ -97,6 +884,7 @@ class TrialFontMaker:
             # Step 3: Modify instances and keep glyphs
             for thisInstance in thisTrialFont.instances:
                 thisInstance.customParameters['Keep Glyphs'] = listGlyphsToKeep
+                thisInstance.fontName = f"{strPrefix}-{thisInstance.fontName}"  # Prefix instance name too
 
             # Step 4: Remove OpenType features
             thisTrialFont.featurePrefixes = []
@@ -109,23 +897,179 @@ class TrialFontMaker:
             thisTrialFont.features['liga'].automatic = True
             thisTrialFont.features['liga'].update()
 
-            # Step 6: Check for missing glyphs
-            listAllGlyphs = [thisGlyph.name for thisGlyph in thisFont.glyphs]
-            listMissingGlyphs = [thisGlyph for thisGlyph in listGlyphsToKeep if thisGlyph not in listAllGlyphs]
+            # Step 5b: Keep an unpruned copy to compare against, then prune kerning
+            # to the kept glyphs, so the exporter compiles only what ships
+            thisUnprunedFont = None
+            if self.uiWindow.chkMeasurePruning.get() and listPending:
+                thisUnprunedFont = thisTrialFont.copy()
+                self.listTrialFonts.append(thisUnprunedFont)
 
+            intPairsBefore, intPairsAfter, intCollapsed = pruneKerning(thisTrialFont, listGlyphsToKeep)
+            self.thisQueue.dictStats["pairsBefore"] += intPairsBefore
+            self.thisQueue.dictStats["pairsAfter"] += intPairsAfter
+            print(
+                f"{thisFont.familyName}: kerning pairs {intPairsBefore} → {intPairsAfter}, "
+                f"{intCollapsed} single-member group(s) collapsed"
+            )
+
+            # Step 6: Report missing glyphs
             if listMissingGlyphs:
                 self.showError("Missing glyphs: " + ", ".join(listMissingGlyphs))
 
-            # Step 7: Export each instance
-            for thisInstance in thisTrialFont.instances:
-                thisInstance.fontName = f"{strPrefix}-{thisInstance.fontName}"  # Prefix instance name too
-                strExportPath = os.path.join(strSaveDirectory, thisInstance.fontName + ".otf")
-                thisInstance.generate(OTF, strExportPath)
-                intTotalExports += 1
+            # Step 7: Queue each changed output
+            for intIndex, strFormat, strFileName, strKey in listPending:
+                self.thisQueue.add(self.instanceJob(
+                    thisTrialFont.instances[intIndex], strFormat, strSaveDirectory, strFileName, strKey, thisManifest
+                ))
+
+            if thisUnprunedFont is not None:
+                intIndex, strFormat = listPending[0][:2]
+                strMeasureFormat = "TTF" if strFormat == "TTF" else "OTF"
+                strLabel = f"{thisFont.familyName} {thisFont.instances[intIndex].name}"
+                self.thisQueue.add(self.measureJob(thisUnprunedFont.instances[intIndex], strMeasureFormat, strLabel, "unpruned"))
+                self.thisQueue.add(self.measureJob(thisTrialFont.instances[intIndex], strMeasureFormat, strLabel, "pruned"))
+
+            if boolVariablePending:
+                self.thisQueue.add(self.variableJob(
+                    thisTrialFont, listGlyphsToKeep, strSaveDirectory, strVariableName, strVariableKey, thisManifest
+                ))
+        return True
+
+    def instanceJob(self, thisInstance, strFormat, strSaveDirectory, strFileName, strKey, thisManifest):
+        """Export job for one instance in one format; WOFF2 is compressed on the worker pool."""
+        strExportPath = os.path.join(strSaveDirectory, strFileName)
+
+        def fnDone(strOutputPath):
+            thisManifest.record(strFileName, strKey)
+            self.thisQueue.dictStats["sizeAfter"] += os.path.getsize(strOutputPath)
+
+        if strFormat == "WOFF2" and BOOL_WOFF2:
+            strTempPath = os.path.splitext(strExportPath)[0] + ".woff2-source.otf"
+
+            def fnMain():
+                dictBefore = folderState(strSaveDirectory)
+                thisResult = thisInstance.generate(OTF, strTempPath)
+                if not exportSucceeded(thisResult):
+                    raise RuntimeError(thisResult)
+                return exportedPath(thisInstance, strTempPath, dictBefore)
+
+            def fnWorker(strSourcePath):
+                return compressWoff2(strSourcePath, strExportPath)
+
+            return ExportJob(f"Exporting {strFileName}", fnMain=fnMain, fnWorker=fnWorker, fnDone=fnDone)
+
+        def fnMain():
+            dictBefore = folderState(strSaveDirectory)
+            if strFormat == "WOFF2":
+                thisResult = thisInstance.generate(OTF, strExportPath, containers=[WOFF2])
+            else:
+                thisResult = thisInstance.generate(TTF if strFormat == "TTF" else OTF, strExportPath)
+            if not exportSucceeded(thisResult):
+                raise RuntimeError(thisResult)
+            return exportedPath(thisInstance, strExportPath, dictBefore)
+
+        return ExportJob(f"Exporting {strFileName}", fnMain=fnMain, fnDone=fnDone)
+
+    def measureJob(self, thisInstance, strFormat, strLabel, strStat):
+        """Exports one instance to a scratch folder to time the build and weigh the output."""
+
+        def fnMain():
+            strTempDirectory = tempfile.mkdtemp(prefix="TrialFontMaker-")
+            try:
+                floatStarted = time.time()
+                thisResult = thisInstance.generate(
+                    TTF if strFormat == "TTF" else OTF, os.path.join(strTempDirectory, f"measure.{strFormat.lower()}")
+                )
+                floatSeconds = time.time() - floatStarted
+                if not exportSucceeded(thisResult):
+                    raise RuntimeError(thisResult)
+                intSize = sum(
+                    os.path.getsize(os.path.join(strFolder, strName))
+                    for strFolder, _, listNames in os.walk(strTempDirectory) for strName in listNames
+                )
+            finally:
+                shutil.rmtree(strTempDirectory, ignore_errors=True)
+            return floatSeconds, intSize
+
+        def fnDone(tupleMeasure):
+            floatSeconds, intSize = tupleMeasure
+            self.thisQueue.dictStats[strStat + "Seconds"] += floatSeconds
+            self.thisQueue.dictStats[strStat + "Size"] += intSize
+            self.thisQueue.dictStats["measured"] += 1
+            print(f"{strLabel} {strFormat}, {strStat} kerning: {intSize / 1024:.1f} KB in {floatSeconds:.2f}s")
+
+        return ExportJob(f"Measuring {strLabel} ({strStat} kerning)", fnMain=fnMain, fnDone=fnDone)
+
+    def variableJob(self, thisTrialFont, listGlyphsToKeep, strSaveDirectory, strFileName, strKey, thisManifest):
+        """Export job for the variable trial, through the font's variable font setting."""
+        strExportPath = os.path.join(strSaveDirectory, strFileName)
+
+        def fnMain():
+            thisVariable = next((i for i in thisTrialFont.instances if i.type == INSTANCETYPEVARIABLE), None)
+            if thisVariable is None:
+                thisVariable = GSInstance()
+                thisVariable.type = INSTANCETYPEVARIABLE
+                thisVariable.name = "Variable"
+                thisTrialFont.instances.append(thisVariable)
+            thisVariable.customParameters['Keep Glyphs'] = listGlyphsToKeep
+            dictBefore = folderState(strSaveDirectory)
+            thisResult = thisVariable.generate(VARIABLE, strExportPath)
+            if not exportSucceeded(thisResult):
+                raise RuntimeError(thisResult)
+            return exportedPath(thisVariable, strExportPath, dictBefore)
+
+        def fnDone(strOutputPath):
+            thisManifest.record(strFileName, strKey)
+            self.thisQueue.dictStats["sizeAfter"] += os.path.getsize(strOutputPath)
+
+        return ExportJob(f"Exporting {strFileName}", fnMain=fnMain, fnDone=fnDone)
+
+    def cancelExport(self, sender):
+        """Stop scheduling new jobs; running workers finish, queued ones are dropped."""
+        if self.thisQueue:
+            self.thisQueue.cancel()
+            self.uiWindow.txtStatus.set("Cancelling…")
+
+    def exportProgress(self, intDone, intTotal, strLabel):
+        self.uiWindow.progress.set(intDone / max(1, intTotal))
+        self.uiWindow.txtStatus.set(f"{intDone}/{intTotal} · {strLabel}")
+
+    def exportFinished(self, thisQueue):
+        thisQueue.thisManifest.save()
+        self.listTrialFonts = []
+        self.uiWindow.progress.set(1)
+        self.uiWindow.btnRun.enable(True)
+        self.uiWindow.btnCancel.enable(False)
+
+        for strError in thisQueue.listErrors:
+            print(f"⚠️ {strError}")
+
+        dictStats = thisQueue.dictStats
+        intExported = thisQueue.intDone - int(dictStats["measured"])  # Pruning measurements are not trial files
+        strReport = f"Exported {intExported} trial file(s), skipped {thisQueue.intSkipped} unchanged, in {dictStats['seconds']:.1f}s."
+        if dictStats["pairsBefore"]:
+            strReport += f" Kerning pairs {int(dictStats['pairsBefore'])} → {int(dictStats['pairsAfter'])}."
+        if dictStats["unprunedSize"] and dictStats["prunedSize"]:
+            strReport += (
+                f" Without pruning {dictStats['unprunedSize'] / 1024:.0f} KB in {dictStats['unprunedSeconds']:.1f}s,"
+                f" with {dictStats['prunedSize'] / 1024:.0f} KB in {dictStats['prunedSeconds']:.1f}s."
+            )
+        if dictStats["gposBefore"]:
+            strReport += f" GPOS {int(dictStats['gposBefore']) // 1024} → {int(dictStats['gposAfter']) // 1024} KB."
+        if dictStats["sizeBefore"]:
+            strReport += f" Files {int(dictStats['sizeBefore']) // 1024} → {int(dictStats['sizeAfter']) // 1024} KB."
+        elif dictStats["sizeAfter"]:
+            strReport += f" Output {int(dictStats['sizeAfter']) // 1024} KB."
+        if thisQueue.listErrors:
+            strReport += f" {len(thisQueue.listErrors)} failed, see Macro Window."
+        if thisQueue.boolCancelled:
+            strReport = "Cancelled. " + strReport
+        self.uiWindow.txtStatus.set(strReport)
+        self.showReport(strReport)
 
-        self.showReport(f"Exported {intTotalExports} instance(s) as OTFs.")
-        Glyphs.showNotification('Trial Font Maker', 'The export of the trial fonts was successful.')
-        self.uiWindow.close()
+        if not thisQueue.boolCancelled:
+            Glyphs.showNotification('Trial Font Maker', 'The export of the trial fonts was successful.')
+            self.uiWindow.close()
 
 # Run the UI Window
 TrialFontMaker()
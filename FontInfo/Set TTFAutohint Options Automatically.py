@@ -1,13 +1,49 @@
 # MenuTitle: 🖥️ Set TTFAutohint Options Automatically
 # -*- coding: utf-8 -*-
-# Version: 1.1
-# Description: Adds “TTFAutohint options” parameter for every export, calculating every "Fallback Stem Width" from "Stems"
+# Version: 1.3
+# Description: Adds “TTFAutohint options” parameter for every export, calculating every "Fallback Stem Width" from "Stems" or by measuring the outlines of n, l, o and H
 # Author: Fernando Díaz (Reset Type Studio) with help from AI.
 
+import json
+import os
 import GlyphsApp
-from GlyphsApp import GSCustomParameter
+from GlyphsApp import GSCustomParameter, OFFCURVE
 from vanilla import Window, TextBox, EditText, CheckBox, PopUpButton, Button
 
+try:
+    from fontTools.varLib.models import VariationModel
+except ImportError:
+    VariationModel = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+STEM_SOURCES = [
+    "Stems, measure outlines if missing",
+    "Measure outlines",
+    "Stems only",
+]
+
+# Reference glyphs and the heights (fraction of the glyph's bounds) of the
+# horizontal rays cast through them; the heights stay clear of bars and arches
+STEM_RAYS = {
+    "n": (0.25, 0.4),
+    "l": (0.3, 0.5, 0.7),
+    "o": (0.5,),
+    "H": (0.25, 0.75),
+}
+CURVE_STEPS = 16
+
+# Ink runs wider than this fraction of the UPM are bars or serifs, not stems;
+# runs further than STEM_OUTLIER from the median of all runs are dropped too
+STEM_MAX_UPM = 0.35
+STEM_OUTLIER = 0.5
+
+# Options per instance, read by “TTFAutohint QA (CLI)”
+MANIFEST_NAME = "ttfautohint-options.json"
+
 # ────────────────────────────────────────────────────────────────
 # Presets: Sans / Serif × UI / Text / Display
 # ────────────────────────────────────────────────────────────────
@@ -51,9 +87,284 @@ PRESETS = {
     "Custom": {}
 }
 
+# ────────────────────────────────────────────────────────────────
+# Stem interpolation from master values
+# ────────────────────────────────────────────────────────────────
+def verticalStemValue(font, master):
+    """First vertical stem of a master, as in Font Info › Masters › Stems."""
+    for index, metric in enumerate(font.stems):
+        if metric.horizontal:
+            continue
+        for key in (metric.id, metric.name, index):
+            try:
+                value = master.stems[key]
+            except Exception:
+                continue
+            if value is not None:
+                return float(value)
+    return None
+
+
+class StemInterpolator:
+    """
+    Interpolates the vertical stem at any design location straight from the
+    master stem values, so no interpolated font has to be built. Uses the
+    fontTools variation model when available and falls back to multilinear
+    interpolation between grid masters. Results are cached per location.
+
+    Locations are design coordinates, the space masters and instances share
+    and the one Glyphs interpolates outlines in. Axis Mappings are not
+    applied: they map user values (Axis Location) to design coordinates, and
+    instance coordinates are already design values, so mapping them again
+    would move the stem away from what the exported instance draws.
+    """
+
+    def __init__(self, font):
+        self.font = font
+        self.cache = {}
+        self.locations = []
+        self.values = []
+        self.default = None
+
+        origin = font.customParameters["Variable Font Origin"]
+        for master in font.masters:
+            if self.default is None or origin in (master.id, master.name):
+                self.default = tuple(float(c) for c in master.axes)
+            value = verticalStemValue(font, master)
+            if value is None:
+                continue
+            self.locations.append(tuple(float(c) for c in master.axes))
+            self.values.append(value)
+
+        self.model = None
+        if VariationModel is not None and len(self.values) > 1:
+            try:
+                self.model = VariationModel([self.normalize(loc) for loc in self.locations])
+            except Exception:
+                self.model = None
+
+    def axisRange(self, i):
+        """(min, default, max) of axis i over the masters; the origin master is the default."""
+        coords = [loc[i] for loc in self.locations]
+        return min(coords), self.default[i], max(coords)
+
+    def normalize(self, location):
+        normalized = {}
+        for i, value in enumerate(location):
+            lower, default, upper = self.axisRange(i)
+            if value < default and default > lower:
+                normalized[i] = max(-1.0, (value - default) / (default - lower))
+            elif value > default and upper > default:
+                normalized[i] = min(1.0, (value - default) / (upper - default))
+            else:
+                normalized[i] = 0.0
+        return normalized
+
+    def stemAt(self, location):
+        location = tuple(float(c) for c in location)
+        if location not in self.cache:
+            self.cache[location] = self.compute(location)
+        return self.cache[location]
+
+    def compute(self, location):
+        if not self.values:
+            return None
+        if len(self.values) == 1:
+            return self.values[0]
+        if len(location) != len(self.locations[0]):
+            return None
+        if self.model is not None:
+            return self.model.interpolateFromMasters(self.normalize(location), self.values)
+        return self.multilinear(location)
+
+    def multilinear(self, location):
+        """Blends the corner masters around location; None if the masters do not form a grid there."""
+        table = dict(zip(self.locations, self.values))
+        corners = [((), 1.0)]
+        for i, value in enumerate(location):
+            coords = sorted({loc[i] for loc in self.locations})
+            value = min(max(value, coords[0]), coords[-1])
+            upper = next(c for c in coords if c >= value)
+            lower = max((c for c in coords if c <= value), default=upper)
+            if upper == lower:
+                stops = ((lower, 1.0),)
+            else:
+                t = (value - lower) / (upper - lower)
+                stops = ((lower, 1.0 - t), (upper, t))
+            corners = [
+                (prefix + (c,), weight * w)
+                for prefix, weight in corners
+                for c, w in stops
+            ]
+
+        total = 0.0
+        for corner, weight in corners:
+            if corner not in table:
+                return None
+            total += table[corner] * weight
+        return total
+
+
+# ────────────────────────────────────────────────────────────────
+# Stem measurement from outlines
+# ────────────────────────────────────────────────────────────────
+def layerSegments(layer):
+    """Every outline segment of layer as a cubic (p0, p1, p2, p3); lines become straight cubics."""
+    segments = []
+    for path in layer.paths:
+        nodes = [(float(n.x), float(n.y), n.type == OFFCURVE) for n in path.nodes]
+        oncurves = [i for i, n in enumerate(nodes) if not n[2]]
+        if not oncurves:
+            continue
+        start = oncurves[-1]
+        ordered = nodes[start + 1:] + nodes[:start + 1]
+        if not path.closed:
+            ordered = nodes[oncurves[0] + 1:]
+            start = oncurves[0]
+
+        p0 = nodes[start][:2]
+        offcurves = []
+        for x, y, isOffcurve in ordered:
+            if isOffcurve:
+                offcurves.append((x, y))
+                continue
+            p3 = (x, y)
+            if len(offcurves) == 2:
+                segments.append((p0, offcurves[0], offcurves[1], p3))
+            else:
+                # Lines, and quadratic runs flattened through their control points
+                points = [p0] + offcurves + [p3]
+                for a, b in zip(points, points[1:]):
+                    segments.append((
+                        a,
+                        (a[0] + (b[0] - a[0]) / 3, a[1] + (b[1] - a[1]) / 3),
+                        (a[0] + (b[0] - a[0]) * 2 / 3, a[1] + (b[1] - a[1]) * 2 / 3),
+                        b,
+                    ))
+            p0 = p3
+            offcurves = []
+    return segments
+
+
+def rayCrossings(segments, heights):
+    """Sorted x positions where each horizontal ray crosses the flattened outline."""
+    if np is not None:
+        points = np.asarray(segments, dtype=float)  # (N, 4, 2)
+        t = np.linspace(0.0, 1.0, CURVE_STEPS + 1)[None, :, None]
+        mt = 1.0 - t
+        curve = (
+            mt ** 3 * points[:, None, 0] + 3 * mt ** 2 * t * points[:, None, 1]
+            + 3 * mt * t ** 2 * points[:, None, 2] + t ** 3 * points[:, None, 3]
+        )
+        a = curve[:, :-1].reshape(-1, 2)
+        b = curve[:, 1:].reshape(-1, 2)
+        y = np.asarray(heights, dtype=float)[:, None]
+        hit = (a[None, :, 1] <= y) != (b[None, :, 1] <= y)
+        dy = np.where(hit, b[None, :, 1] - a[None, :, 1], 1.0)
+        x = a[None, :, 0] + (y - a[None, :, 1]) * (b[None, :, 0] - a[None, :, 0]) / dy
+        return [np.sort(x[i][hit[i]]).tolist() for i in range(len(heights))]
+
+    polyline = []
+    for p0, p1, p2, p3 in segments:
+        previous = p0
+        for step in range(1, CURVE_STEPS + 1):
+            t = step / CURVE_STEPS
+            mt = 1.0 - t
+            point = tuple(
+                mt ** 3 * p0[k] + 3 * mt ** 2 * t * p1[k] + 3 * mt * t ** 2 * p2[k] + t ** 3 * p3[k]
+                for k in (0, 1)
+            )
+            polyline.append((previous, point))
+            previous = point
+
+    crossings = []
+    for y in heights:
+        xs = []
+        for a, b in polyline:
+            if (a[1] <= y) != (b[1] <= y):
+                xs.append(a[0] + (y - a[1]) * (b[0] - a[0]) / (b[1] - a[1]))
+        crossings.append(sorted(xs))
+    return crossings
+
+
+def median(values):
+    values = sorted(values)
+    middle = len(values) // 2
+    if len(values) % 2:
+        return values[middle]
+    return (values[middle - 1] + values[middle]) / 2
+
+
+def measureLayerStems(layer, upm):
+    """Ink run widths along the reference rays of one layer."""
+    if layer.components:
+        layer = layer.copyDecomposedLayer()
+    bounds = layer.bounds
+    height = float(bounds.size.height)
+    if height <= 0 or float(bounds.size.width) <= 0:
+        return []
+
+    glyphName = layer.parent.name if layer.parent else None
+    heights = [float(bounds.origin.y) + height * f for f in STEM_RAYS.get(glyphName, (0.5,))]
+    segments = layerSegments(layer)
+    if not segments:
+        return []
+
+    widths = []
+    for xs in rayCrossings(segments, heights):
+        for left, right in zip(xs[0::2], xs[1::2]):
+            run = right - left
+            if 0 < run < upm * STEM_MAX_UPM:
+                widths.append(run)
+    return widths
+
+
+def typicalStem(widths):
+    """Median of the runs after dropping the ones far from it (bars, serifs, joins)."""
+    if not widths:
+        return None
+    middle = median(widths)
+    kept = [w for w in widths if abs(w - middle) <= middle * STEM_OUTLIER]
+    return median(kept) if kept else middle
+
+
+class StemMeasurer:
+    """Measures the vertical stem of each instance from its interpolated n, l, o and H; cached per location."""
+
+    def __init__(self, font):
+        self.font = font
+        self.cache = {}
+
+    def stemFor(self, inst):
+        key = tuple(float(c) for c in inst.axes)
+        if key not in self.cache:
+            self.cache[key] = self.measure(inst)
+        return self.cache[key]
+
+    def measure(self, inst):
+        try:
+            iFont = inst.interpolatedFontProxy
+        except AttributeError:
+            iFont = None
+        if iFont is None:
+            iFont = inst.interpolatedFont
+        if not iFont:
+            return None
+
+        masterId = iFont.masters[0].id
+        upm = float(iFont.upm or 1000)
+        widths = []
+        for glyphName in STEM_RAYS:
+            glyph = iFont.glyphs[glyphName]
+            if glyph is None:
+                continue
+            widths.extend(measureLayerStems(glyph.layers[masterId], upm))
+        return typicalStem(widths)
+
+
 class TTFHintOptionsWindow:
     def __init__(self):
-        self.w = Window((400, 650), "TTFAutohint Options")
+        self.w = Window((400, 702), "TTFAutohint Options")
 
         self.font = Glyphs.font
         if not self.font:
@@ -76,6 +387,11 @@ class TTFHintOptionsWindow:
         self.w.maxEdit = EditText((15, y, -15, 22), "")
         y += 30
 
+        self.w.stemSourceLabel = TextBox((15, y, -15, 20), "Fallback Stem Width source:")
+        y += 22
+        self.w.stemSourcePop = PopUpButton((15, y, -15, 22), STEM_SOURCES)
+        y += 30
+
         self.w.defaultScriptLabel = TextBox((15, y, -15, 20), "Default Script:")
         y += 22
         self.w.defaultScriptEdit = EditText((15, y, -15, 22), "latn")
@@ -118,6 +434,9 @@ class TTFHintOptionsWindow:
 
         self.w.applyButton = Button((15, y, -15, 30), "Apply to All Instances", callback=self.applyOptions)
 
+        self.stems = None  # Built on first use by getInfoStem
+        self.measurer = StemMeasurer(self.font)
+
         self.applyPreset(None)  # Load defaults
         self.w.open()
 
@@ -132,6 +451,10 @@ class TTFHintOptionsWindow:
 
     def applyOptions(self, sender):
         font = self.font
+        # Master stems and outlines may have been edited since the last run
+        self.stems = None
+        self.measurer = StemMeasurer(self.font)
+
         opts = [
             f"--hinting-range-min={self.w.minEdit.get()}",
             f"--hinting-range-max={self.w.maxEdit.get()}",
@@ -165,12 +488,15 @@ class TTFHintOptionsWindow:
             opts.append("--windows-compatibility")
 
         applied = 0
+        skipped = []
+        manifest = {}
         for inst in font.instances:
             if not inst.exports:
                 continue
 
             stem = self.getFallbackStem(inst)
             if stem is None:
+                skipped.append(inst.name)
                 continue
 
             full_opts = opts + [f"--fallback-stem-width={stem}"]
@@ -184,15 +510,61 @@ class TTFHintOptionsWindow:
             inst.customParameters.append(
                 GSCustomParameter("TTFAutohint options", " ".join(full_opts))
             )
+            manifest[inst.fontName] = full_opts  # An argument list, so values with spaces stay whole
 
             applied += 1
 
+        report = f"TTFAutohint options applied to {applied} instance(s)."
+        manifestPath = self.writeManifest(manifest)
+        if manifestPath:
+            report += f"\nOptions saved to {manifestPath}"
+        if skipped:
+            report += f"\nNo fallback stem found for: {', '.join(skipped)}"
         Message(
             "Fallback Stem Widths calculated automatically.",
-            f"TTFAutohint options applied."
+            report
         )
 
+    def writeManifest(self, manifest):
+        """Saves the options per PostScript name next to the source, for headless hinting runs."""
+        if not manifest or not self.font.filepath:
+            return None
+        path = os.path.join(os.path.dirname(self.font.filepath), MANIFEST_NAME)
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=2, sort_keys=True)
+        except OSError as e:
+            print(f"⚠️ Could not write {path}: {e}")
+            return None
+        return path
+
     def getFallbackStem(self, inst):
+        source = STEM_SOURCES[self.w.stemSourcePop.get()]
+        if source == "Measure outlines":
+            return self.getMeasuredStem(inst)
+
+        stem = self.getInfoStem(inst)
+        if stem is None and source != "Stems only":
+            stem = self.getMeasuredStem(inst)
+        return stem
+
+    def getMeasuredStem(self, inst):
+        stem = self.measurer.stemFor(inst)
+        if stem is None:
+            return None
+        return int(round(stem))
+
+    def getInfoStem(self, inst):
+        if self.stems is None:
+            self.stems = StemInterpolator(self.font)
+        try:
+            stem = self.stems.stemAt(inst.axes)
+        except Exception:
+            stem = None
+        if stem is not None:
+            return int(round(stem))
+
+        # Masters off the grid or without stems: let Glyphs interpolate
         iFont = inst.interpolatedFont
         if not iFont:
             return None
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+# Description: Shared structure fingerprints for the Compatibility Check menu script and its CLI. Reads Glyphs layers and glyphsLib layers alike. Not a menu script: scripts add this folder to sys.path and import from here.
+# Author: Fernando Díaz (Reset Type Studio) with help from AI.
+
+import hashlib
+
+# Node types as Glyphs and glyphsLib both spell them
+LINE = "line"
+CURVE = "curve"
+QCURVE = "qcurve"
+OFFCURVE = "offcurve"
+
+NODE_CODES = {LINE: "L", CURVE: "C", QCURVE: "Q", OFFCURVE: "O"}
+
+
+def structure_digest(text):
+    """Short, process-independent hash of a structure string."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+
+
+class PathStructure(object):
+    """Node-type sequence, closed flag and counts of one path, read in a single pass."""
+
+    __slots__ = ("types", "closed", "oncurves", "offcurves", "lines", "curves", "fingerprint")
+
+    def __init__(self, path):
+        self.types = tuple(str(n.type) for n in path.nodes)
+        self.closed = bool(path.closed)
+        self.offcurves = self.types.count(OFFCURVE)
+        self.oncurves = len(self.types) - self.offcurves
+        self.lines = self.types.count(LINE)
+        self.curves = self.types.count(CURVE) + self.types.count(QCURVE)
+        code = "".join(NODE_CODES.get(t, "?") for t in self.types)
+        self.fingerprint = structure_digest(("c" if self.closed else "o") + code)
+
+
+class LayerStructure(object):
+    """Ordered path, component and anchor fingerprints of a layer; compatible layers compare equal."""
+
+    __slots__ = ("paths", "components", "anchors", "fingerprint")
+
+    def __init__(self, layer):
+        self.paths = [PathStructure(path) for path in layer.paths]
+        self.components = tuple(component_name(c) for c in layer.components)
+        self.anchors = tuple(sorted(a.name for a in layer.anchors))
+        self.fingerprint = (
+            tuple(p.fingerprint for p in self.paths),
+            self.components,
+            self.anchors,
+        )
+
+
+def component_name(component):
+    """Base glyph name; glyphsLib components may only carry it as name."""
+    return getattr(component, "componentName", None) or component.name
+
+
+def compare_path_nodes(ref_types, test_types):
+    """(index, expected, found) of the first difference between two sequences, or None."""
+    max_len = max(len(ref_types), len(test_types))
+
+    for i in range(max_len):
+        if i >= len(ref_types):
+            return i, None, test_types[i]
+        if i >= len(test_types):
+            return i, ref_types[i], None
+        if ref_types[i] != test_types[i]:
+            return i, ref_types[i], test_types[i]
+    return None  # No differences
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+# Description: Shared master index for the scripts in this repository. Not a menu script: scripts add this folder to sys.path and import from here.
+# Author: Fernando Díaz (Reset Type Studio) with help from AI.
+
+METRICS = ("ascender", "capHeight", "xHeight", "descender", "italicAngle")
+
+
+def master_signature(font):
+    """Master ids with their axis coordinates, in order; changes when masters are added, removed, reordered or moved."""
+    return tuple((master.id, tuple(master.axes)) for master in font.masters)
+
+
+class MasterIndex:
+    """Maps master id to master, axis coordinates and metric values; built once per run."""
+
+    def __init__(self, font):
+        self.masters = {}
+        self.names = {}
+        self.axes = {}
+        self.metrics = {}
+        for master in font.masters:
+            self.masters[master.id] = master
+            self.names.setdefault(master.name, master.id)
+            self.axes[master.id] = tuple(master.axes)
+            self.metrics[master.id] = {key: getattr(master, key, None) for key in METRICS}
+        self.signature = master_signature(font)
+        self.reference_id = next(iter(self.masters), None)  # The first master, which the others are compared against
+
+    def is_stale(self, font):
+        """True when masters were added, removed, reordered or moved on an axis since the index was built."""
+        return master_signature(font) != self.signature
+
+    def master(self, master_id):
+        return self.masters.get(master_id)
+
+    def resolve(self, key):
+        """Master id from a master id or name; None when neither matches."""
+        if key in self.masters:
+            return key
+        return self.names.get(key)
+
+    def others(self):
+        """Ids of every master but the reference one."""
+        return [master_id for master_id in self.masters if master_id != self.reference_id]
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+# Description: Shared report window for the scripts in this repository. Not a menu script: scripts add this folder to sys.path and import ReportTable from here.
+# Author: Fernando Díaz (Reset Type Studio) with help from AI.
+
+import csv
+import itertools
+import json
+
+import vanilla
+from vanilla.dialogs import putFile
+from PyObjCTools.AppHelper import callLater
+
+
+class ReportTable(object):
+    """
+    Report window backed by a row model instead of one big string.
+
+    Rows are dicts keyed by column. They are streamed in from an iterable in
+    batches, so the window opens immediately and the producer runs while the
+    user reads. A producer that skips most of its work units (like glyphs
+    without problems) yields None after each one, so a batch stays bounded
+    by work done rather than by rows found. Closing the window stops the
+    stream. The vanilla List (an NSTableView) only draws visible rows,
+    columns sort on header click, the search box filters across all columns,
+    and CSV/JSON export writes row by row from the model.
+    """
+
+    BATCH_SIZE = 500
+
+    def __init__(self, title, columns, rows, summary=None, size=(700, 500)):
+        self.columns = columns  # [(key, title, width)]
+        self.rows = []
+        self.source = iter(rows)
+        self.summary = summary
+        self.query = ""
+        self.streaming = True
+        self.stopped = False  # Set when the window closes, so pending pumps stop pulling from the producer
+
+        self.w = vanilla.Window(size, title, minSize=(400, 300))
+        self.w.search = vanilla.SearchBox((10, 10, -200, 22), placeholder="Filter", callback=self.filterChanged)
+        self.w.exportCSV = vanilla.Button((-190, 10, 85, 22), "CSV…", callback=self.exportCSV)
+        self.w.exportJSON = vanilla.Button((-95, 10, 85, 22), "JSON…", callback=self.exportJSON)
+        self.w.table = vanilla.List(
+            (10, 42, -10, -30),
+            [],
+            columnDescriptions=[{"title": title, "key": key, "width": width} for key, title, width in columns],
+            allowsSorting=True,
+        )
+        self.w.status = vanilla.TextBox((10, -24, -10, 17), "", sizeStyle="small")
+        self.w.bind("close", self.windowClosed)
+        self.w.open()
+
+        callLater(0.0, self.pump)
+
+    # --- Streaming ---
+
+    def windowClosed(self, sender):
+        self.stopped = True
+        self.streaming = False
+
+    def pump(self):
+        if self.stopped:
+            return
+        items = list(itertools.islice(self.source, self.BATCH_SIZE))
+        if items:
+            batch = [row for row in items if row is not None]
+            self.rows.extend(batch)
+            visible = [row for row in batch if self.matches(row)]
+            if visible:
+                self.w.table.extend(visible)
+            self.updateStatus()
+            callLater(0.0, self.pump)
+            return
+        self.streaming = False
+        self.updateStatus()
+
+    def allRows(self):
+        """Every row, draining whatever the producer has not streamed yet."""
+        for row in self.rows:
+            yield row
+        for row in self.source:
+            if row is None:
+                continue
+            self.rows.append(row)
+            yield row
+
+    def updateStatus(self):
+        text = f"{len(self.rows)} row(s)"
+        if self.query:
+            text = f"{len(self.w.table)} of " + text
+        if self.streaming:
+            text += " · loading…"
+        elif self.summary:
+            text += " · " + (self.summary() if callable(self.summary) else self.summary)
+        self.w.status.set(text)
+
+    # --- Filtering ---
+
+    def matches(self, row):
+        if not self.query:
+            return True
+        return any(self.query in str(row.get(key, "")).lower() for key, _, _ in self.columns)
+
+    def filterChanged(self, sender):
+        self.query = (sender.get() or "").strip().lower()
+        self.refresh()
+
+    def refresh(self):
+        self.w.table.set([row for row in self.rows if self.matches(row)])
+        self.updateStatus()
+
+    # --- Export ---
+
+    def exportCSV(self, sender):
+        path = putFile(fileTypes=["csv"])
+        if not path:
+            return
+        keys = [key for key, _, _ in self.columns]
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=keys, extrasaction="ignore")
+            writer.writerow({key: title or key for key, title, _ in self.columns})
+            for row in self.allRows():
+                writer.writerow(row)
+        self.streaming = False
+        self.refresh()
+
+    def exportJSON(self, sender):
+        path = putFile(fileTypes=["json"])
+        if not path:
+            return
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("[\n")
+            for i, row in enumerate(self.allRows()):
+                f.write((",\n" if i else "") + json.dumps(row, ensure_ascii=False))
+            f.write("\n]\n")
+        self.streaming = False
+        self.refresh()
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+# Description: Shared smart component helpers for the scripts in this repository. Not a menu script: scripts add this folder to sys.path and import from here.
+# Author: Fernando Díaz (Reset Type Studio) with help from AI.
+
+from GlyphsApp import GSSmartComponentAxis
+
+
+class SmartIndex:
+    """Component glyphs and their smart axis ids, looked up once per run."""
+
+    def __init__(self, font, master_index):
+        self.font = font
+        self.master_index = master_index
+        self.glyphs = {}
+        self.axis_ids = {}
+        self.value_ranges = {}
+
+        # Smart axis range per font axis, and the pole of every master on each axis
+        self.axis_ranges = []
+        for i, axis in enumerate(font.axes):
+            values = [coordinates[i] for coordinates in master_index.axes.values()]
+            self.axis_ranges.append((axis.name, min(values), max(values)))
+        self.poles = {}
+        for master_id, coordinates in master_index.axes.items():
+            self.poles[master_id] = {}
+            for i, (_, bottom, top) in enumerate(self.axis_ranges):
+                if coordinates[i] == top:
+                    self.poles[master_id][i] = 2
+                elif coordinates[i] == bottom:
+                    self.poles[master_id][i] = 1
+
+    def glyph(self, name):
+        if name not in self.glyphs:
+            self.glyphs[name] = self.font.glyphs[name]
+        return self.glyphs[name]
+
+    def axes(self, name):
+        """{axis name: axis id} of the smart axes of a component glyph."""
+        if name not in self.axis_ids:
+            glyph = self.glyph(name)
+            self.axis_ids[name] = {axis.name: axis.id for axis in glyph.smartComponentAxes} if glyph else {}
+        return self.axis_ids[name]
+
+    def ranges(self, name):
+        """{axis name: (axis id, lower, upper)} of the smart axes of a component glyph; empty when it is not smart."""
+        if name not in self.value_ranges:
+            glyph = self.glyph(name)
+            self.value_ranges[name] = {}
+            if glyph is not None:
+                for axis in glyph.smartComponentAxes:
+                    lower, upper = sorted((axis.bottomValue, axis.topValue))
+                    self.value_ranges[name][axis.name] = (axis.id, lower, upper)
+        return self.value_ranges[name]
+
+    def make_smart(self, name):
+        """Adds one smart axis per font axis to a component glyph and maps its master layers to the poles."""
+        glyph = self.glyph(name)
+        axis_ids = []
+        for axis_name, bottom, top in self.axis_ranges:
+            new_axis = GSSmartComponentAxis()
+            new_axis.name = axis_name
+            new_axis.bottomValue = bottom
+            new_axis.topValue = top
+            glyph.smartComponentAxes.append(new_axis)
+            axis_ids.append(glyph.smartComponentAxes[axis_name].id)
+
+        for layer in glyph.layers:
+            if layer.isMasterLayer:
+                for i, pole in self.poles.get(layer.associatedMasterId, {}).items():
+                    layer.smartComponentPoleMapping[axis_ids[i]] = pole
+        self.axis_ids.pop(name, None)
+        self.value_ranges.pop(name, None)
+
+
+def component_lookup(layer):
+    """{(component name, occurrence): component} of a layer, so repeated bases stay distinct."""
+    lookup, seen = {}, {}
+    for component in layer.components:
+        name = component.componentName
+        index = seen.get(name, 0)
+        seen[name] = index + 1
+        lookup[(name, index)] = component
+    return lookup
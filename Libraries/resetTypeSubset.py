@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+# Description: Subsets built fonts for Trial Font Maker. Not a menu script: Trial Font Maker imports it and runs it as one process per font, reading a JSON job on stdin and writing the stats as JSON on stdout.
+# Author: Fernando Díaz (Reset Type Studio) with help from AI.
+
+import json
+import os
+import sys
+import time
+
+try:
+    from fontTools import subset as ftSubset
+    from fontTools.ttLib import TTFont
+except ImportError:
+    ftSubset = None
+    TTFont = None
+
+
+def gposSize(thisTTFont):
+    """GPOS size in bytes: as stored in the file, or as it compiles after subsetting (0 without GPOS)."""
+    if "GPOS" not in thisTTFont:
+        return 0
+    if thisTTFont.isLoaded("GPOS"):
+        return len(thisTTFont["GPOS"].compile(thisTTFont))
+    return len(thisTTFont.reader["GPOS"])
+
+
+def renameFamily(thisTTFont, strPrefix):
+    """Prefixes family, full and PostScript names in the name table (and CFF) of a font."""
+    thisNameTable = thisTTFont["name"]
+    strPSPrefix = strPrefix.replace(" ", "")
+
+    for thisRecord in thisNameTable.names:
+        if thisRecord.nameID not in (1, 3, 4, 6, 16, 21):
+            continue
+        strValue = thisRecord.toUnicode()
+        if thisRecord.nameID == 6:
+            strNewValue = strValue if strValue.startswith(strPSPrefix + "-") else f"{strPSPrefix}-{strValue}"
+        else:
+            strNewValue = strValue if strValue.startswith(strPrefix + " ") else f"{strPrefix} {strValue}"
+        thisNameTable.setName(strNewValue, thisRecord.nameID, thisRecord.platformID, thisRecord.platEncID, thisRecord.langID)
+
+    if "CFF " in thisTTFont:
+        thisCFF = thisTTFont["CFF "].cff
+        strPSName = thisNameTable.getDebugName(6)
+        if strPSName:
+            thisCFF.fontNames = [strPSName]
+        for thisTopDict in thisCFF.topDictIndex:
+            for strKey in ("FamilyName", "FullName"):
+                strValue = getattr(thisTopDict, strKey, None)
+                if strValue and not strValue.startswith(strPrefix + " "):
+                    setattr(thisTopDict, strKey, f"{strPrefix} {strValue}")
+
+
+def subsetOutputName(strInputPath, strPrefix, thisTTFont=None):
+    """
+    File name of a subset trial: the prefixed PostScript name with the input's
+    extension. Reads the name from thisTTFont when the font is already open.
+    """
+    if thisTTFont is None:
+        thisTTFont = TTFont(strInputPath, lazy=True)
+        try:
+            return subsetOutputName(strInputPath, strPrefix, thisTTFont)
+        finally:
+            thisTTFont.close()
+
+    strExtension = os.path.splitext(strInputPath)[1]
+    strPSName = thisTTFont["name"].getDebugName(6)
+    if not strPSName:
+        return f"{strPrefix.replace(' ', '')}-{os.path.basename(strInputPath)}"
+    strPSPrefix = strPrefix.replace(" ", "")
+    if not strPSName.startswith(strPSPrefix + "-"):
+        strPSName = f"{strPSPrefix}-{strPSName}"
+    return strPSName + strExtension
+
+
+def subsetBinary(strInputPath, strSaveDirectory, setGlyphNames, setUnicodes, strPrefix, listFeatures, boolWoff2=False):
+    """
+    Subsets one built font to the trial glyph set and saves it with the prefixed
+    PostScript name (and as WOFF2). Returns the outputs with GPOS and file sizes.
+    """
+    floatStarted = time.time()
+    thisOptions = ftSubset.Options()
+    thisOptions.layout_features = listFeatures
+    thisOptions.name_IDs = ["*"]
+    thisOptions.name_languages = ["*"]
+    thisOptions.name_legacy = True
+    thisOptions.notdef_outline = True
+    thisOptions.glyph_names = True
+    thisOptions.ignore_missing_glyphs = True
+    thisOptions.ignore_missing_unicodes = True
+
+    thisTTFont = TTFont(strInputPath)
+    thisOptions.flavor = thisTTFont.flavor
+    intGposBefore = gposSize(thisTTFont)
+    strOutputPath = os.path.join(strSaveDirectory, subsetOutputName(strInputPath, strPrefix, thisTTFont))
+
+    thisSubsetter = ftSubset.Subsetter(options=thisOptions)
+    thisSubsetter.populate(
+        glyphs=[strName for strName in setGlyphNames if strName in thisTTFont.getReverseGlyphMap()],
+        unicodes=setUnicodes,
+    )
+    thisSubsetter.subset(thisTTFont)
+
+    renameFamily(thisTTFont, strPrefix)
+    intGposAfter = gposSize(thisTTFont)
+    thisTTFont.save(strOutputPath)
+    listOutputs = [strOutputPath]
+
+    if boolWoff2 and thisTTFont.flavor != "woff2":
+        thisTTFont.flavor = "woff2"
+        strWoff2Path = os.path.splitext(strOutputPath)[0] + ".woff2"
+        thisTTFont.save(strWoff2Path)
+        listOutputs.append(strWoff2Path)
+
+    thisTTFont.close()
+    return {
+        "outputs": listOutputs,
+        "gposBefore": intGposBefore,
+        "gposAfter": intGposAfter,
+        "sizeBefore": os.path.getsize(strInputPath),
+        "sizeAfter": os.path.getsize(strOutputPath),
+        "seconds": time.time() - floatStarted,
+    }
+
+
+def main():
+    """Worker entry point: one JSON job on stdin, the stats as JSON on stdout."""
+    if ftSubset is None:
+        sys.exit("fontTools is not available to the subset worker.")
+    dictJob = json.load(sys.stdin)
+    dictResult = subsetBinary(
+        dictJob["input"], dictJob["directory"], set(dictJob["glyphs"]), set(dictJob["unicodes"]),
+        dictJob["prefix"], dictJob["features"], dictJob.get("woff2", False),
+    )
+    json.dump(dictResult, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+# Description: Shared transformation engine for the Transformations Tool and its CLI: one composed matrix per layer and per-master values interpolated from designspace stops. Works on Glyphs layers and on glyphsLib layers. Not a menu script: scripts add this folder to sys.path and import from here.
+# Author: Fernando Díaz (Reset Type Studio) with help from AI.
+
+import math
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from fontTools.varLib.models import VariationModel
+except ImportError:
+    VariationModel = None
+
+LIST_IDENTITY = [1, 0, 0, 1, 0, 0]
+
+
+# =============================
+# Matrix Engine
+# =============================
+
+def composeMatrix(floatMoveX, floatMoveY, floatScale, floatRotate, floatSlant, floatCenterX, floatCenterY):
+    """
+    One affine matrix [a, b, c, d, tx, ty] for the whole transformation:
+    move the center to the origin, rotate clockwise, scale, slant (horizontal
+    skew), move, and move the center back.
+    """
+    floatRadians = math.radians(floatRotate)
+    floatCos = math.cos(floatRadians)
+    floatSin = math.sin(floatRadians)
+
+    # Linear part: [[scale, slant], [0, scale]] · clockwise rotation
+    floatA = floatScale * floatCos - floatSlant * floatSin
+    floatB = -floatScale * floatSin
+    floatC = floatScale * floatSin + floatSlant * floatCos
+    floatD = floatScale * floatCos
+
+    floatTX = floatCenterX + floatMoveX - (floatA * floatCenterX + floatC * floatCenterY)
+    floatTY = floatCenterY + floatMoveY - (floatB * floatCenterX + floatD * floatCenterY)
+    return [floatA, floatB, floatC, floatD, floatTX, floatTY]
+
+
+def boundsRect(rectBounds):
+    """(x, y, width, height) of an NSRect (Glyphs) or of a four-value rect (glyphsLib)."""
+    if hasattr(rectBounds, "origin"):
+        return rectBounds.origin.x, rectBounds.origin.y, rectBounds.size.width, rectBounds.size.height
+    floatX, floatY, floatWidth, floatHeight = rectBounds
+    return floatX, floatY, floatWidth, floatHeight
+
+
+def layerCenter(thisLayer):
+    """
+    Center of the layer's bounds. glyphsLib layers have no bounds when they
+    are empty and raise when a component's base glyph is missing; those fall
+    back to the extent of the node coordinates.
+    """
+    try:
+        rectBounds = thisLayer.bounds
+        tupleRect = boundsRect(rectBounds) if rectBounds is not None else None
+    except Exception:
+        tupleRect = None
+    if tupleRect is not None:
+        floatX, floatY, floatWidth, floatHeight = tupleRect
+        return floatX + floatWidth / 2, floatY + floatHeight / 2
+
+    listPoints = [(n.position.x, n.position.y) if hasattr(n, "position") else (n.x, n.y) for p in thisLayer.paths for n in p.nodes]
+    if not listPoints:
+        return 0.0, 0.0
+    listXs = [x for x, _ in listPoints]
+    listYs = [y for _, y in listPoints]
+    return (min(listXs) + max(listXs)) / 2, (min(listYs) + max(listYs)) / 2
+
+
+def multiplyMatrices(listOuter, listInner):
+    """Affine matrix that applies listInner first, then listOuter."""
+    a1, b1, c1, d1, tx1, ty1 = listOuter
+    a2, b2, c2, d2, tx2, ty2 = listInner
+    return [
+        a1 * a2 + c1 * b2,
+        b1 * a2 + d1 * b2,
+        a1 * c2 + c1 * d2,
+        b1 * c2 + d1 * d2,
+        a1 * tx2 + c1 * ty2 + tx1,
+        b1 * tx2 + d1 * ty2 + ty1,
+    ]
+
+
+def applyMatrix(thisLayer, listMatrix):
+    """
+    Applies the matrix in a single call. Layers without applyTransform
+    (glyphsLib layers in CLI/Transformations (CLI).py) get their node and
+    anchor coordinates transformed as one NumPy array, and their component
+    transforms composed.
+    """
+    if listMatrix == LIST_IDENTITY:
+        return
+    if hasattr(thisLayer, "applyTransform"):
+        thisLayer.applyTransform(listMatrix)
+        return
+
+    listPoints = [thisNode for thisPath in thisLayer.paths for thisNode in thisPath.nodes]
+    listPoints += list(thisLayer.anchors)
+    if listPoints:
+        a, b, c, d, tx, ty = listMatrix
+        if np is not None:
+            arrCoords = np.array([(p.position.x, p.position.y) for p in listPoints], dtype=float)
+            arrResult = arrCoords @ np.array([[a, b], [c, d]]) + np.array([tx, ty])
+            listResult = arrResult.tolist()
+        else:
+            listResult = [
+                (a * p.position.x + c * p.position.y + tx, b * p.position.x + d * p.position.y + ty)
+                for p in listPoints
+            ]
+        for thisPoint, (floatX, floatY) in zip(listPoints, listResult):
+            thisPoint.position = type(thisPoint.position)(floatX, floatY)
+
+    for thisComponent in thisLayer.components:
+        thisComponent.transform = multiplyMatrices(listMatrix, list(thisComponent.transform))
+
+
+# =============================
+# Per-Master Values
+# =============================
+
+def parseStops(strText):
+    """
+    Parses one stop per line: 'axis values : x y scale rotate slant',
+    e.g. '100, 12 : 0 0 100 0 0'. Lines starting with # are ignored.
+    Returns [(location tuple, (x, y, scale, rotate, slant))].
+    """
+    listStops = []
+    for intLine, strLine in enumerate(strText.splitlines(), start=1):
+        strLine = strLine.split("#", 1)[0].strip()
+        if not strLine:
+            continue
+        if ":" not in strLine:
+            raise ValueError(f"Line {intLine}: expected 'location : x y scale rotate slant'")
+        strLocation, strValues = strLine.split(":", 1)
+        try:
+            tupleLocation = tuple(float(v) for v in strLocation.replace(",", " ").split())
+            tupleValues = tuple(float(v) for v in strValues.replace(",", " ").split())
+        except ValueError:
+            raise ValueError(f"Line {intLine}: not a number")
+        if len(tupleValues) != 5:
+            raise ValueError(f"Line {intLine}: expected 5 values (x y scale rotate slant)")
+        listStops.append((tupleLocation, tupleValues))
+    return listStops
+
+
+class ParametricTransforms:
+    """
+    Transform values defined at a few designspace locations, interpolated to
+    any location: with the fontTools variation model when available,
+    multilinearly between grid stops otherwise, and by inverse distance as a
+    last resort. Results are cached per location, so each master is computed once.
+    """
+
+    def __init__(self, listStops):
+        self.listStops = listStops
+        self.dictCache = {}
+        self.thisModel = None
+        if VariationModel is not None and len(listStops) > 1:
+            try:
+                self.thisModel = VariationModel([self.normalize(loc) for loc, _ in listStops])
+            except Exception:
+                self.thisModel = None
+
+    def normalize(self, tupleLocation):
+        """-1…0…1 per axis around the first stop, which acts as the default."""
+        dictNormalized = {}
+        for intAxis, floatValue in enumerate(tupleLocation):
+            listCoords = [loc[intAxis] for loc, _ in self.listStops]
+            floatMin, floatDefault, floatMax = min(listCoords), listCoords[0], max(listCoords)
+            if floatValue < floatDefault and floatDefault > floatMin:
+                dictNormalized[intAxis] = max(-1.0, (floatValue - floatDefault) / (floatDefault - floatMin))
+            elif floatValue > floatDefault and floatMax > floatDefault:
+                dictNormalized[intAxis] = min(1.0, (floatValue - floatDefault) / (floatMax - floatDefault))
+            else:
+                dictNormalized[intAxis] = 0.0
+        return dictNormalized
+
+    def valuesAt(self, tupleLocation):
+        tupleLocation = tuple(float(v) for v in tupleLocation)
+        if tupleLocation not in self.dictCache:
+            self.dictCache[tupleLocation] = self.compute(tupleLocation)
+        return self.dictCache[tupleLocation]
+
+    def compute(self, tupleLocation):
+        if len(self.listStops) == 1:
+            return self.listStops[0][1]
+        if self.thisModel is not None:
+            dictLocation = self.normalize(tupleLocation)
+            return tuple(
+                self.thisModel.interpolateFromMasters(dictLocation, [values[i] for _, values in self.listStops])
+                for i in range(5)
+            )
+        return self.multilinear(tupleLocation) or self.inverseDistance(tupleLocation)
+
+    def multilinear(self, tupleLocation):
+        """Blends the grid stops around the location; None when they do not form a grid there."""
+        dictStops = dict(self.listStops)
+        listCorners = [((), 1.0)]
+        for intAxis, floatValue in enumerate(tupleLocation):
+            listCoords = sorted({loc[intAxis] for loc, _ in self.listStops})
+            floatValue = min(max(floatValue, listCoords[0]), listCoords[-1])
+            floatUpper = next(c for c in listCoords if c >= floatValue)
+            floatLower = max((c for c in listCoords if c <= floatValue), default=floatUpper)
+            if floatUpper == floatLower:
+                tupleWeights = ((floatLower, 1.0),)
+            else:
+                floatT = (floatValue - floatLower) / (floatUpper - floatLower)
+                tupleWeights = ((floatLower, 1.0 - floatT), (floatUpper, floatT))
+            listCorners = [
+                (tuplePrefix + (c,), floatWeight * w)
+                for tuplePrefix, floatWeight in listCorners
+                for c, w in tupleWeights
+            ]
+
+        listValues = [0.0] * 5
+        for tupleCorner, floatWeight in listCorners:
+            if tupleCorner not in dictStops:
+                return None
+            for i, floatValue in enumerate(dictStops[tupleCorner]):
+                listValues[i] += floatValue * floatWeight
+        return tuple(listValues)
+
+    def inverseDistance(self, tupleLocation):
+        listWeights = []
+        for tupleStop, tupleValues in self.listStops:
+            floatDistance = math.dist(tupleStop, tupleLocation)
+            if floatDistance == 0:
+                return tupleValues
+            listWeights.append((1.0 / floatDistance ** 2, tupleValues))
+        floatTotal = sum(w for w, _ in listWeights)
+        return tuple(sum(w * values[i] for w, values in listWeights) / floatTotal for i in range(5))
+
+
+def layerLocation(thisFont, thisLayer, dictMasterLocations):
+    """Designspace location of a layer: brace coordinates, else its (associated) master's axes."""
+    dictAttributes = getattr(thisLayer, "attributes", None) or {}
+    dictCoordinates = dictAttributes.get("coordinates") if hasattr(dictAttributes, "get") else None
+    if dictCoordinates:
+        tupleMaster = dictMasterLocations.get(thisLayer.associatedMasterId, ())
+        return tuple(
+            float(dictCoordinates.get(thisAxis.axisId, tupleMaster[i] if i < len(tupleMaster) else 0))
+            for i, thisAxis in enumerate(thisFont.axes)
+        )
+    return dictMasterLocations.get(thisLayer.associatedMasterId) or dictMasterLocations.get(thisLayer.layerId, ())
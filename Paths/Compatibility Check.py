@@ -1,30 +1,131 @@
 # MenuTitle: ⚖️ Compatibility Check (Node Report)
 # -*- coding: utf-8 -*-
-# Version: 1.2
-# Description: Reports node and handle counts per master for selected glyphs. Highlights master incompatibilities and node mismatches.
+# Version: 1.6
+# Description: Reports node and handle counts per master for selected glyphs. Highlights path, component and anchor incompatibilities in masters and brace/bracket layers. With no selection, checks the whole font incrementally (hold Option to ignore the cache).
 # Author: Fernando Díaz (Reset Type Studio) with help from AI.
 
 from GlyphsApp import *
-import vanilla
+from AppKit import NSEvent, NSEventModifierFlagOption
+import json
+import os
+import sys
+
+# Shared modules live in the Libraries folder at the root of this repository
+LIBRARIES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Libraries")
+if LIBRARIES_PATH not in sys.path:
+    sys.path.insert(0, LIBRARIES_PATH)
+
+from resetTypeCompatibility import LayerStructure, compare_path_nodes, structure_digest  # noqa: E402
+from resetTypeMasters import MasterIndex  # noqa: E402
+from resetTypeReport import ReportTable  # noqa: E402
 
 # ----------------------------
-# Utility
+# Layers
+# ----------------------------
+
+def is_interpolating_layer(layer):
+    """Brace and bracket layers take part in interpolation and must match their master; backups do not."""
+    return not layer.isMasterLayer and layer.isSpecialLayer
+
+
 # ----------------------------
+# Persistent cache
+# ----------------------------
+
+CACHE_VERSION = 3
+CACHE_FOLDER = os.path.join(os.path.expanduser("~"), "Library", "Caches", "com.resettype.CompatibilityCheck")
+
+
+def option_key_pressed():
+    try:
+        return bool(NSEvent.modifierFlags() & NSEventModifierFlagOption)
+    except Exception:
+        return False
+
+
+def glyph_change_stamp(glyph):
+    """Serializable lastChange of a glyph, or None when Glyphs does not provide one."""
+    stamp = getattr(glyph, "lastChange", None)
+    if stamp is None:
+        return None
+    try:
+        return float(stamp.timeIntervalSince1970())
+    except Exception:
+        return str(stamp)
+
 
-def compare_path_nodes(ref_path, test_path):
-    ref_nodes = list(ref_path.nodes)
-    test_nodes = list(test_path.nodes)
-    max_len = max(len(ref_nodes), len(test_nodes))
+class CompatibilityCache(object):
+    """
+    Per-font JSON file with, for each glyph, its lastChange stamp, the
+    fingerprint of every master and brace/bracket layer and the cached report.
 
-    for i in range(max_len):
-        if i >= len(ref_nodes):
-            return i, None, test_nodes[i].type
-        if i >= len(test_nodes):
-            return i, ref_nodes[i].type, None
-        if ref_nodes[i].type != test_nodes[i].type:
-            return i, ref_nodes[i].type, test_nodes[i].type
-    return None  # No differences
+    A glyph whose stamp is unchanged is not read at all; a glyph whose stamp
+    changed but whose fingerprints did not keeps its cached result.
+    """
 
+    def __init__(self, font):
+        self.master_ids = [master.id for master in font.masters]
+        key = font.filepath or font.familyName or "Untitled"
+        self.path = os.path.join(CACHE_FOLDER, structure_digest(key) + ".json")
+        self.glyphs = {}
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") != CACHE_VERSION or data.get("masters") != self.master_ids:
+            return
+        self.glyphs = data.get("glyphs", {})
+
+    def save(self):
+        data = {"version": CACHE_VERSION, "masters": self.master_ids, "glyphs": self.glyphs}
+        try:
+            os.makedirs(CACHE_FOLDER, exist_ok=True)
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+        except OSError as e:
+            print(f"⚠️ Could not write compatibility cache: {e}")
+
+    @staticmethod
+    def encode(fingerprint):
+        return [list(part) for part in fingerprint]
+
+    def entry(self, glyph):
+        """Cached entry when the glyph has not changed since it was stored."""
+        entry = self.glyphs.get(glyph.name)
+        stamp = glyph_change_stamp(glyph)
+        if entry and stamp is not None and entry.get("lastChange") == stamp:
+            return entry
+        return None
+
+    def matching_fingerprints(self, glyph, fingerprints):
+        """Cached entry when every layer fingerprint still matches."""
+        entry = self.glyphs.get(glyph.name)
+        if entry and entry.get("layers") == fingerprints:
+            entry["lastChange"] = glyph_change_stamp(glyph)
+            return entry
+        return None
+
+    def prune(self, names):
+        """Drops the entries of glyphs no longer in the font."""
+        self.glyphs = {name: entry for name, entry in self.glyphs.items() if name in names}
+
+    def store(self, glyph, fingerprints, compatible, report):
+        entry = {
+            "lastChange": glyph_change_stamp(glyph),
+            "layers": fingerprints,
+            "compatible": compatible,
+            "report": report,
+        }
+        self.glyphs[glyph.name] = entry
+        return entry
+
+
+# ----------------------------
+# Utility
+# ----------------------------
 
 def nodeTypeName(t):
     if t is None:
@@ -44,20 +145,17 @@ def nodeTypeName(t):
 # UI
 # ----------------------------
 
-class CompatibilityReportWindow(object):
-    def __init__(self, text):
-        self.w = vanilla.FloatingWindow(
-            (500, 500),
-            "Compatibility Check – Node Report"
-        )
 
-        self.w.report = vanilla.TextEditor(
-            (10, 10, -10, -10),
-            text,
-            readOnly=True
-        )
+REPORT_COLUMNS = [
+    ("glyph", "Glyph", 120),
+    ("layer", "Layer", 160),
+    ("status", "Status", 50),
+    ("detail", "Detail", 520),
+]
 
-        self.w.open()
+
+def CompatibilityReportWindow(rows, summary=None):
+    return ReportTable("Compatibility Check – Node Report", REPORT_COLUMNS, rows, summary=summary, size=(860, 500))
 
 
 # ----------------------------
@@ -66,99 +164,198 @@ class CompatibilityReportWindow(object):
 
 class CompatibilityReporter(object):
     def __init__(self):
-        self.lines = []
-
-    def write(self, text=""):
-        self.lines.append(text)
+        self.rows = []
+        self.glyph_name = ""
+        self.checked = self.reused = self.incompatible = self.total = 0
+
+    def write(self, layer, status, detail):
+        self.rows.append({"glyph": self.glyph_name, "layer": layer, "status": status, "detail": detail})
+
+    def report_mismatch(self, where, reference, structure):
+        """Writes the path, component and anchor differences of one incompatible layer."""
+        for i, path in enumerate(structure.paths):
+            if i >= len(reference.paths):
+                self.write(where, "⚠️", f"Path #{i + 1} → Path missing.")
+                continue
+
+            ref_path = reference.paths[i]
+            if path.fingerprint == ref_path.fingerprint:
+                continue
+
+            detail = (
+                f"Path #{i + 1} mismatch → "
+                f"Expected ({ref_path.oncurves}, {ref_path.offcurves}), "
+                f"Found ({path.oncurves}, {path.offcurves})"
+            )
+
+            mismatch = compare_path_nodes(ref_path.types, path.types)
+            if mismatch:
+                index, expected_type, found_type = mismatch
+                detail += (
+                    f" · First difference at node #{index + 1}: "
+                    f"Expected {nodeTypeName(expected_type)}, "
+                    f"Found {nodeTypeName(found_type)}"
+                )
+            elif path.closed != ref_path.closed:
+                detail += (
+                    f" · Path is {'closed' if path.closed else 'open'}, "
+                    f"reference is {'closed' if ref_path.closed else 'open'}"
+                )
+            self.write(where, "⚠️", detail)
+
+        for i in range(len(structure.paths), len(reference.paths)):
+            self.write(where, "⚠️", f"Path #{i + 1} → Path missing in this layer.")
+
+        if structure.components != reference.components:
+            detail = "Components differ"
+            mismatch = compare_path_nodes(reference.components, structure.components)
+            if mismatch:
+                index, expected_name, found_name = mismatch
+                detail += (
+                    f" · Component #{index + 1}: "
+                    f"Expected {expected_name or '—'}, Found {found_name or '—'}"
+                )
+            self.write(where, "⚠️", detail)
+
+        if structure.anchors != reference.anchors:
+            detail = "Anchors differ"
+            missing = sorted(set(reference.anchors) - set(structure.anchors))
+            extra = sorted(set(structure.anchors) - set(reference.anchors))
+            if missing:
+                detail += f" · Missing: {', '.join(missing)}"
+            if extra:
+                detail += f" · Extra: {', '.join(extra)}"
+            self.write(where, "⚠️", detail)
+
+    def glyph_structures(self, masters, glyph):
+        """Structures of every master layer and every brace/bracket layer, keyed by layer id."""
+        structures = {
+            master_id: LayerStructure(glyph.layers[master_id])
+            for master_id in masters.masters
+        }
+        for layer in glyph.layers:
+            if layer.layerId not in structures and is_interpolating_layer(layer):
+                structures[layer.layerId] = LayerStructure(layer)
+        return structures
+
+    def comparisons(self, masters, glyph, structures):
+        """Yields (layer label, layer id, reference layer id) for every layer that must interpolate."""
+        for master_id in masters.others():
+            yield masters.master(master_id).name, master_id, masters.reference_id
+
+        for layer in glyph.layers:
+            if layer.layerId in masters.masters or layer.layerId not in structures:
+                continue
+            master = masters.master(layer.associatedMasterId)
+            if master is None:
+                continue
+            yield f"{master.name} › {layer.name}", layer.layerId, master.id
+
+    def check_glyph(self, masters, glyph, structures, details=True):
+        """Returns (compatible, rows) for one glyph."""
+        glyph_is_compatible = True
+        self.rows = []
+        self.glyph_name = glyph.name
+
+        # Per master report
+        if details:
+            for master in masters.masters.values():
+                structure = structures[master.id]
+                self.write(master.name, "ℹ️", f"Paths: {len(structure.paths)}")
+
+                for i, path in enumerate(structure.paths):
+                    self.write(
+                        master.name, "ℹ️",
+                        f"Path #{i + 1} · Nodes: {path.oncurves} (Lines: {path.lines} · Curves: {path.curves})"
+                        f" · Handles: {path.offcurves} · Total Points: {len(path.types)}"
+                    )
+
+        # Compare against reference: one tuple comparison per layer,
+        # the per-path diff only runs when the fingerprints disagree
+        for where, layer_id, reference_id in self.comparisons(masters, glyph, structures):
+            structure = structures[layer_id]
+            reference = structures[reference_id]
+            if structure.fingerprint == reference.fingerprint:
+                continue
+
+            glyph_is_compatible = False
+            self.report_mismatch(where, reference, structure)
+
+        if glyph_is_compatible and details:
+            self.write("", "✅", "All masters and brace/bracket layers are fully compatible.")
+
+        return glyph_is_compatible, self.rows
+
+    def iter_selection(self, font, glyphs):
+        masters = MasterIndex(font)
+        for glyph in glyphs:
+            _, rows = self.check_glyph(masters, glyph, self.glyph_structures(masters, glyph))
+            yield from rows
+
+    def iter_font(self, font, use_cache=True):
+        """
+        Checks every glyph lazily, re-reading only glyphs changed since the cached
+        run. Yields None after each glyph so the report pumps a bounded number of
+        glyphs per batch, however few of them are incompatible.
+        """
+        cache = CompatibilityCache(font)
+        if use_cache:
+            cache.load()
+        masters = MasterIndex(font)
+
+        self.total = len(font.glyphs)
+        names = set()
+
+        for glyph in font.glyphs:
+            names.add(glyph.name)
+            entry = cache.entry(glyph)
+
+            if entry is None:
+                structures = self.glyph_structures(masters, glyph)
+                fingerprints = {mid: cache.encode(st.fingerprint) for mid, st in structures.items()}
+                entry = cache.matching_fingerprints(glyph, fingerprints)
+
+            if entry is not None:
+                self.reused += 1
+            else:
+                self.checked += 1
+                compatible, rows = self.check_glyph(masters, glyph, structures, details=False)
+                entry = cache.store(glyph, fingerprints, compatible, rows)
+
+            if not entry["compatible"]:
+                self.incompatible += 1
+                yield from entry["report"]
+            yield None
+
+        cache.prune(names)
+        cache.save()
+
+    def font_summary(self):
+        text = (
+            f"Font-wide check: {self.total} glyph(s), "
+            f"{self.checked} re-checked, {self.reused} unchanged since last run · "
+        )
+        if self.incompatible:
+            return text + f"{self.incompatible} incompatible glyph(s)"
+        return text + "✅ All glyphs are compatible with the reference master"
 
     def run(self):
         Glyphs.clearLog()
         font = Glyphs.font
 
         if not font:
-            self.write("❌ No font open.")
+            print("❌ No font open.")
             return
 
-        if font.selectedLayers:
-            glyphs_to_check = list({l.parent for l in font.selectedLayers})
-        else:
-            self.write("❌ No glyph selected.")
+        if not font.selectedLayers:
+            # Nothing selected: check the whole font incrementally.
+            # Hold Option to ignore the cache and re-check every glyph.
+            rows = self.iter_font(font, use_cache=not option_key_pressed())
+            self.window = CompatibilityReportWindow(rows, summary=self.font_summary)
             return
 
-        for glyph in glyphs_to_check:
-            glyph_is_compatible = True
-
-            self.write(f"🔠 Glyph: {glyph.name}")
-
-            reference_master = font.masters[0]
-            reference_layer = glyph.layers[reference_master.id]
-            ref_path_structures = []
-
-            for path in reference_layer.paths:
-                oncurves = [n for n in path.nodes if n.type != OFFCURVE]
-                offcurves = [n for n in path.nodes if n.type == OFFCURVE]
-                ref_path_structures.append((len(oncurves), len(offcurves), path))
-
-            # Per master report
-            for master in font.masters:
-                layer = glyph.layers[master.id]
-                self.write(f"\n    ⭕️ Master: {master.name}")
-                self.write(f"     • Paths: {len(layer.paths)}")
-
-                for path in layer.paths:
-                    oncurves = [n for n in path.nodes if n.type != OFFCURVE]
-                    offcurves = [n for n in path.nodes if n.type == OFFCURVE]
-
-                    n_lines = sum(1 for n in oncurves if n.type == LINE)
-                    n_curves = sum(1 for n in oncurves if n.type in (CURVE, QCURVE))
-
-                    self.write(f"     • Nodes: {len(oncurves)} (Lines: {n_lines} · Curves: {n_curves})")
-                    self.write(f"     • Handles: {len(offcurves)}")
-                    self.write(f"     • Total Points: {len(path.nodes)}")
-
-            # Compare against reference
-            for master in font.masters[1:]:
-                layer = glyph.layers[master.id]
-
-                for i, path in enumerate(layer.paths):
-                    try:
-                        ref_on, ref_off, ref_path = ref_path_structures[i]
-                    except IndexError:
-                        glyph_is_compatible = False
-                        self.write(
-                            f"  ⚠️ Incompatibility in master '{master.name}': "
-                            f"Path #{i + 1} → Path missing."
-                        )
-                        continue
-
-                    test_on = sum(1 for n in path.nodes if n.type != OFFCURVE)
-                    test_off = sum(1 for n in path.nodes if n.type == OFFCURVE)
-
-                    if (ref_on, ref_off) != (test_on, test_off):
-                        glyph_is_compatible = False
-                        mismatch = compare_path_nodes(ref_path, path)
-
-                        self.write(f"  ⚠️ Incompatibility in master '{master.name}':")
-                        self.write(
-                            f"     • Path #{i + 1} mismatch → "
-                            f"Expected ({ref_on}, {ref_off}), "
-                            f"Found ({test_on}, {test_off})"
-                        )
-
-                        if mismatch:
-                            index, expected_type, found_type = mismatch
-                            self.write(
-                                f"     • First difference at node #{index + 1}: "
-                                f"Expected {nodeTypeName(expected_type)}, "
-                                f"Found {nodeTypeName(found_type)}"
-                            )
-
-            if glyph_is_compatible:
-                self.write("\n")
-                self.write("-" * 100)
-                self.write("  ✅ All masters are fully compatible with the reference master.")
-
-        CompatibilityReportWindow("\n".join(self.lines))
+        glyphs_to_check = list({l.parent for l in font.selectedLayers})
+        self.window = CompatibilityReportWindow(self.iter_selection(font, glyphs_to_check))
 
 
 # ----------------------------
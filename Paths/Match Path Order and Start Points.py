@@ -0,0 +1,348 @@
+# MenuTitle: 🧭 Match Path Order and Start Points
+# -*- coding: utf-8 -*-
+# Version: 1.0
+# Description: Fixes incompatible masters by reordering paths and rotating start points so each master matches the reference master as closely as possible. Works on selected glyphs or on the whole font.
+# Author: Fernando Díaz (Reset Type Studio) with help from AI.
+
+import vanilla
+from GlyphsApp import Glyphs, GSPath, OFFCURVE, LINE, CURVE, QCURVE
+import os
+import sys
+
+# Shared modules live in the Libraries folder at the root of this repository
+LIBRARIES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Libraries")
+if LIBRARIES_PATH not in sys.path:
+    sys.path.insert(0, LIBRARIES_PATH)
+
+from resetTypeMasters import MasterIndex  # noqa: E402
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from scipy.optimize import linear_sum_assignment
+except ImportError:
+    linear_sum_assignment = None
+
+NODE_CODES = {LINE: "L", CURVE: "C", QCURVE: "Q", OFFCURVE: "O"}
+
+# Cost of pairing two paths whose structures can never match
+NO_MATCH = 1e12
+
+
+# ----------------------------
+# Path data
+# ----------------------------
+
+class PathData(object):
+    """Node types, normalized coordinates and the rotation-invariant signature of one path."""
+
+    __slots__ = ("path", "code", "closed", "xs", "ys", "signature", "centroid", "size")
+
+    def __init__(self, path, origin, scale):
+        self.path = path
+        nodes = list(path.nodes)
+        self.code = "".join(NODE_CODES.get(n.type, "?") for n in nodes)
+        self.closed = bool(path.closed)
+        ox, oy = origin
+        self.xs = [(float(n.x) - ox) / scale for n in nodes]
+        self.ys = [(float(n.y) - oy) / scale for n in nodes]
+
+        if self.closed and self.code:
+            doubled = self.code + self.code
+            self.signature = "c" + min(doubled[r:r + len(self.code)] for r in range(len(self.code)))
+        else:
+            self.signature = "o" + self.code
+
+        count = max(1, len(nodes))
+        self.centroid = (sum(self.xs) / count, sum(self.ys) / count)
+        if nodes:
+            self.size = (max(self.xs) - min(self.xs), max(self.ys) - min(self.ys))
+        else:
+            self.size = (0.0, 0.0)
+
+
+def layer_paths(layer):
+    """PathData for every path of layer, normalized to the layer's node bounds."""
+    paths = list(layer.paths)
+    xs = [float(n.x) for p in paths for n in p.nodes]
+    ys = [float(n.y) for p in paths for n in p.nodes]
+    if not xs:
+        return []
+    origin = (min(xs), min(ys))
+    scale = max(max(xs) - min(xs), max(ys) - min(ys), 1.0)
+    return [PathData(p, origin, scale) for p in paths]
+
+
+# ----------------------------
+# Matching engine
+# ----------------------------
+
+def cost_matrix(reference, test):
+    """Pairing cost of reference path i with test path j: centroid and size distance, or NO_MATCH."""
+    if np is not None:
+        rc = np.array([p.centroid for p in reference], dtype=float)
+        tc = np.array([p.centroid for p in test], dtype=float)
+        rs = np.array([p.size for p in reference], dtype=float)
+        ts = np.array([p.size for p in test], dtype=float)
+        cost = ((rc[:, None, :] - tc[None, :, :]) ** 2).sum(axis=2)
+        cost += ((rs[:, None, :] - ts[None, :, :]) ** 2).sum(axis=2)
+        rsig = np.array([p.signature for p in reference], dtype=object)
+        tsig = np.array([p.signature for p in test], dtype=object)
+        cost[rsig[:, None] != tsig[None, :]] = NO_MATCH
+        return cost
+
+    cost = []
+    for r in reference:
+        row = []
+        for t in test:
+            if r.signature != t.signature:
+                row.append(NO_MATCH)
+                continue
+            row.append(
+                (r.centroid[0] - t.centroid[0]) ** 2 + (r.centroid[1] - t.centroid[1]) ** 2
+                + (r.size[0] - t.size[0]) ** 2 + (r.size[1] - t.size[1]) ** 2
+            )
+        cost.append(row)
+    return cost
+
+
+def hungarian(cost):
+    """Minimum-cost assignment of a square matrix; returns the column for every row."""
+    n = len(cost)
+    u = [0.0] * (n + 1)
+    v = [0.0] * (n + 1)
+    p = [0] * (n + 1)
+    way = [0] * (n + 1)
+
+    for i in range(1, n + 1):
+        p[0] = i
+        j0 = 0
+        minv = [float("inf")] * (n + 1)
+        used = [False] * (n + 1)
+        while True:
+            used[j0] = True
+            i0 = p[j0]
+            delta = float("inf")
+            j1 = 0
+            for j in range(1, n + 1):
+                if used[j]:
+                    continue
+                cur = cost[i0 - 1][j - 1] - u[i0] - v[j]
+                if cur < minv[j]:
+                    minv[j] = cur
+                    way[j] = j0
+                if minv[j] < delta:
+                    delta = minv[j]
+                    j1 = j
+            for j in range(n + 1):
+                if used[j]:
+                    u[p[j]] += delta
+                    v[j] -= delta
+                else:
+                    minv[j] -= delta
+            j0 = j1
+            if p[j0] == 0:
+                break
+        while True:
+            j1 = way[j0]
+            p[j0] = p[j1]
+            j0 = j1
+            if j0 == 0:
+                break
+
+    assignment = [0] * n
+    for j in range(1, n + 1):
+        assignment[p[j] - 1] = j - 1
+    return assignment
+
+
+def assign_paths(reference, test):
+    """Test path index for every reference path, or None when the structures cannot be paired."""
+    cost = cost_matrix(reference, test)
+    if linear_sum_assignment is not None and np is not None:
+        rows, cols = linear_sum_assignment(cost)
+        assignment = [0] * len(reference)
+        for r, c in zip(rows, cols):
+            assignment[r] = int(c)
+    else:
+        rows = cost.tolist() if np is not None else cost
+        assignment = hungarian(rows)
+
+    for r, c in enumerate(assignment):
+        if cost[r][c] >= NO_MATCH:
+            return None
+    return assignment
+
+
+def best_rotation(reference, test):
+    """Node rotation of test that reproduces the reference node types with the smallest distance."""
+    if not test.closed:
+        return 0 if test.code == reference.code else None
+
+    n = len(test.code)
+    doubled = test.code + test.code
+    candidates = []
+    r = doubled.find(reference.code)
+    while 0 <= r < n:
+        candidates.append(r)
+        r = doubled.find(reference.code, r + 1)
+    if not candidates:
+        return None
+    if len(candidates) == 1:
+        return candidates[0]
+
+    if np is not None:
+        tx = np.asarray(test.xs)
+        ty = np.asarray(test.ys)
+        idx = (np.arange(n)[None, :] + np.asarray(candidates)[:, None]) % n
+        d = (tx[idx] - np.asarray(reference.xs)) ** 2 + (ty[idx] - np.asarray(reference.ys)) ** 2
+        return candidates[int(d.sum(axis=1).argmin())]
+
+    def distance(rot):
+        return sum(
+            (test.xs[(k + rot) % n] - reference.xs[k]) ** 2
+            + (test.ys[(k + rot) % n] - reference.ys[k]) ** 2
+            for k in range(n)
+        )
+    return min(candidates, key=distance)
+
+
+def match_layer(reference_layer, layer):
+    """
+    Plans the fix for one layer: the path order and the per-path start rotation.
+    Returns (order, rotations), or None when the layer cannot be matched.
+    """
+    reference = layer_paths(reference_layer)
+    test = layer_paths(layer)
+    if len(reference) != len(test):
+        return None
+    if not reference:
+        return [], []
+
+    order = assign_paths(reference, test)
+    if order is None:
+        return None
+
+    rotations = []
+    for i, j in enumerate(order):
+        rotation = best_rotation(reference[i], test[j])
+        if rotation is None:
+            return None
+        rotations.append(rotation)
+    return order, rotations
+
+
+def apply_match(layer, order, rotations):
+    """Reorders the paths of layer (keeping components in place) and rotates their start nodes."""
+    paths = list(layer.paths)
+    changed = False
+
+    for path, rotation in zip((paths[j] for j in order), rotations):
+        if rotation:
+            nodes = list(path.nodes)
+            path.nodes = [n.copy() for n in nodes[rotation:] + nodes[:rotation]]
+            changed = True
+
+    if order != list(range(len(order))):
+        reordered = iter([paths[j] for j in order])
+        layer.shapes = [
+            next(reordered).copy() if isinstance(shape, GSPath) else shape.copy()
+            for shape in layer.shapes
+        ]
+        changed = True
+
+    return changed
+
+
+def paths_compatible(reference_layer, layer):
+    reference = [(bool(p.closed), [n.type for n in p.nodes]) for p in reference_layer.paths]
+    test = [(bool(p.closed), [n.type for n in p.nodes]) for p in layer.paths]
+    return reference == test
+
+
+# ----------------------------
+# UI
+# ----------------------------
+
+class MatchPathsUI(object):
+    def __init__(self):
+        self.w = vanilla.FloatingWindow((300, 130), "Match Path Order & Start Points")
+        self.w.info = vanilla.TextBox(
+            (15, 12, -15, 34),
+            "Reference master: first master. Only incompatible glyphs are changed.",
+            sizeStyle="small"
+        )
+        self.w.fixSelection = vanilla.Button((15, 52, -15, 22), "Fix Selected Glyphs", callback=self.fixSelection)
+        self.w.fixFont = vanilla.Button((15, 80, -15, 22), "Fix Whole Font", callback=self.fixFont)
+        self.w.status = vanilla.TextBox((15, 108, -15, 17), "Status: Ready", sizeStyle="small")
+        self.w.open()
+
+    def fixSelection(self, sender):
+        font = Glyphs.font
+        if not font or not font.selectedLayers:
+            self.w.status.set("⚠️ No glyphs selected")
+            return
+        glyphs = []
+        for layer in font.selectedLayers:
+            if layer.parent not in glyphs:
+                glyphs.append(layer.parent)
+        self.run(font, glyphs)
+
+    def fixFont(self, sender):
+        font = Glyphs.font
+        if not font:
+            self.w.status.set("⚠️ No font open")
+            return
+        self.run(font, font.glyphs)
+
+    def run(self, font, glyphs):
+        masters = MasterIndex(font)
+        reference_id = masters.reference_id
+        other_ids = masters.others()
+        fixed, unmatched = [], []
+
+        font.disableUpdateInterface()
+        try:
+            for glyph in glyphs:
+                reference_layer = glyph.layers[reference_id]
+                plans = []
+                for master_id in other_ids:
+                    layer = glyph.layers[master_id]
+                    if paths_compatible(reference_layer, layer):
+                        continue
+                    plan = match_layer(reference_layer, layer)
+                    if plan is None:
+                        unmatched.append(glyph.name)
+                        plans = []
+                        break
+                    plans.append((layer, plan))
+
+                if not plans:
+                    continue
+
+                glyph.beginUndo()
+                try:
+                    changed = False
+                    for layer, (order, rotations) in plans:
+                        changed = apply_match(layer, order, rotations) or changed
+                finally:
+                    glyph.endUndo()
+                if changed:
+                    fixed.append(glyph.name)
+        finally:
+            font.enableUpdateInterface()
+
+        Glyphs.redraw()
+
+        if fixed:
+            print(f"✔ Matched path order and start points in {len(fixed)} glyph(s): {', '.join(fixed)}")
+        if unmatched:
+            print(f"⚠️ {len(unmatched)} glyph(s) differ in structure and need manual fixing: {', '.join(unmatched)}")
+
+        self.w.status.set(f"✅ Fixed {len(fixed)} · ⚠️ Unmatched {len(unmatched)}")
+
+
+MatchPathsUI()
@@ -1,13 +1,41 @@
 # MenuTitle: ⚡️ Smart Italic
 # -*- coding: utf-8 -*-
-# Version: 1.4
-# Description: Applies optical slant algorythm, approximating cursivy behavior (sorry Rainer) by modulating horizontal shift across the vertical axis. Preserves spacing, metrics keys, and anchors, with optional master-level italic angle support.
+# Version: 1.8
+# Description: Applies optical slant algorythm, approximating cursivy behavior (sorry Rainer) by modulating horizontal shift across the vertical axis and counter-rotating curve extrema, with live preview. Preserves spacing, metrics keys, and anchors, with optional master-level italic angle support.
 # Author: Fernando Díaz (Reset Type Studio) with help from AI.
 
 import vanilla
 import math
-from AppKit import NSAffineTransform
-from GlyphsApp import Glyphs, GSLayer
+import itertools
+from PyObjCTools.AppHelper import callLater
+from GlyphsApp import Glyphs, GSLayer, OFFCURVE
+import os
+import sys
+
+# Shared modules live in the Libraries folder at the root of this repository
+LIBRARIES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Libraries")
+if LIBRARIES_PATH not in sys.path:
+    sys.path.insert(0, LIBRARIES_PATH)
+
+from resetTypeMasters import MasterIndex  # noqa: E402
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Glyphs processed per batch before control returns to the UI
+BATCH_SIZE = 50
+
+# Relative height of the shear pivot inside the layer bounds
+Y_REF_RATIO = 0.335
+
+# Handles within this vertical distance of their node count as horizontal
+EXTREMA_EPS = 0.5
+
+# Live preview is limited to this many selected layers
+PREVIEW_LIMIT = 24
 
 
 # -------------------------
@@ -24,18 +52,39 @@ def _anchors_iter(layer):
 
 
 def _apply_path_transform(path, t):
-    path.applyTransform(t.transformStruct())
+    path.applyTransform(t)
+
+
+def _shear_transform(shear, yRef, dx=0.0):
+    """Horizontal shear around yRef followed by a horizontal shift, as one (a, b, c, d, tx, ty) matrix."""
+    return (1.0, 0.0, shear, 1.0, dx - shear * yRef, 0.0)
 
 
-def _associated_master(layer):
-    font = Glyphs.font
+def _associated_master(layer, masterIndex):
     mid = getattr(layer, "associatedMasterId", None)
-    if not font or not mid:
+    if not mid:
         return None
-    for m in font.masters:
-        if m.id == mid:
-            return m
-    return None
+    return masterIndex.master(mid)
+
+
+def _set_italic_angle(master, italicAngleDeg, masterIndex):
+    """Writes a master's italic angle once per run instead of once per layer, checked against the indexed metrics."""
+    angle = float(italicAngleDeg)
+    metrics = masterIndex.metrics.get(master.id, {})
+    if metrics.get("italicAngle") == angle:
+        return
+    master.italicAngle = angle
+    metrics["italicAngle"] = angle
+
+
+def _iter_glyph_layers(font, masterIds):
+    """
+    Lazily yields (glyph, layers) for the given masters, one glyph at a time.
+    Every glyph is yielded, with an empty list when it has none of the
+    layers, so a run walks exactly len(font.glyphs) items.
+    """
+    for g in font.glyphs:
+        yield g, [l for l in (g.layers[mid] for mid in masterIds) if l]
 
 
 def _glyph_is_avoided(glyph, avoidColor):
@@ -47,12 +96,187 @@ def _glyph_is_avoided(glyph, avoidColor):
         return False
 
 
+# -------------------------
+# Optical slant engine
+# -------------------------
+
+def _profile(t, k):
+    """Integrated shear profile: slope 1 + k·cos(πt) inside the bounds, linear outside."""
+    if t < 0.0:
+        return (1.0 + k) * t
+    if t > 1.0:
+        return 1.0 + (1.0 - k) * (t - 1.0)
+    return t + (k / math.pi) * math.sin(math.pi * t)
+
+
+def _profile_array(t, k):
+    inside = t + (k / math.pi) * np.sin(math.pi * np.clip(t, 0.0, 1.0))
+    below = (1.0 + k) * t
+    above = 1.0 + (1.0 - k) * (t - 1.0)
+    return np.where(t < 0.0, below, np.where(t > 1.0, above, inside))
+
+
+class _LayerGeometry(object):
+    """Flat node coordinates of a layer plus the neighbour indices the engine needs."""
+
+    def __init__(self, layer):
+        self.nodes = []
+        xs, ys, offcurve, prev, nxt = [], [], [], [], []
+        for path in layer.paths:
+            start = len(self.nodes)
+            pathNodes = list(path.nodes)
+            count = len(pathNodes)
+            closed = bool(path.closed)
+            for j, node in enumerate(pathNodes):
+                self.nodes.append(node)
+                xs.append(float(node.x))
+                ys.append(float(node.y))
+                offcurve.append(node.type == OFFCURVE)
+                if closed:
+                    prev.append(start + (j - 1) % count)
+                    nxt.append(start + (j + 1) % count)
+                else:
+                    prev.append(start + max(j - 1, 0))
+                    nxt.append(start + min(j + 1, count - 1))
+        self.xs, self.ys = xs, ys
+        self.offcurve, self.prev, self.next = offcurve, prev, nxt
+
+        b = layer.bounds
+        self.y0 = float(b.origin.y)
+        self.height = float(b.size.height)
+
+    def __len__(self):
+        return len(self.nodes)
+
+
+class OpticalSlant(object):
+    """
+    y-dependent shear with counter-rotated horizontal extrema.
+
+    modulation (-0.9 … 0.9) bends the shear along the height: positive values
+    lean the lower half more than the upper half. extremaRotation (0 … 1) turns
+    the handles of top/bottom extrema clockwise by that fraction of the slant
+    angle, the way a rotate-and-shear italic keeps curve weight.
+    """
+
+    def __init__(self, italicAngleDeg, modulation=0.0, extremaRotation=0.0):
+        self.shear = math.tan(math.radians(float(italicAngleDeg)))
+        self.modulation = max(-0.9, min(0.9, float(modulation)))
+        self.rotation = float(extremaRotation) * math.radians(float(italicAngleDeg))
+
+    def isAffine(self):
+        return not self.modulation and not self.rotation
+
+    def displacement(self, y, y0, height):
+        """Horizontal shift at y, relative to the shift at the vertical centre of the bounds."""
+        if height <= 0:
+            return 0.0
+        k = self.modulation
+        t = (y - y0) / height
+        return self.shear * height * (_profile(t, k) - _profile(0.5, k))
+
+    def coordinates(self, geometry):
+        """Returns new (xs, ys) for every node of geometry."""
+        if not len(geometry) or geometry.height <= 0:
+            return list(geometry.xs), list(geometry.ys)
+        if np is not None:
+            return self._coordinatesArray(geometry)
+        return self._coordinatesPython(geometry)
+
+    def _extrema(self, geometry):
+        ys, off, prev, nxt = geometry.ys, geometry.offcurve, geometry.prev, geometry.next
+        for i in range(len(geometry)):
+            p, n = prev[i], nxt[i]
+            if off[i] or not (off[p] and off[n]) or p == i or n == i:
+                continue
+            if abs(ys[p] - ys[i]) < EXTREMA_EPS and abs(ys[n] - ys[i]) < EXTREMA_EPS:
+                yield i
+
+    def _coordinatesPython(self, geometry):
+        xs = [x + self.displacement(y, geometry.y0, geometry.height) for x, y in zip(geometry.xs, geometry.ys)]
+        ys = list(geometry.ys)
+        if self.rotation:
+            cosR, sinR = math.cos(self.rotation), math.sin(self.rotation)
+            for i in list(self._extrema(geometry)):
+                for h in (geometry.prev[i], geometry.next[i]):
+                    vx, vy = xs[h] - xs[i], ys[h] - ys[i]
+                    xs[h] = xs[i] + vx * cosR + vy * sinR
+                    ys[h] = ys[i] - vx * sinR + vy * cosR
+        return xs, ys
+
+    def _coordinatesArray(self, geometry):
+        X = np.asarray(geometry.xs, dtype=float)
+        Y = np.asarray(geometry.ys, dtype=float)
+        k = self.modulation
+        t = (Y - geometry.y0) / geometry.height
+        X = X + self.shear * geometry.height * (_profile_array(t, k) - _profile(0.5, k))
+        Y = Y.copy()
+
+        if self.rotation:
+            off = np.asarray(geometry.offcurve, dtype=bool)
+            prev = np.asarray(geometry.prev, dtype=int)
+            nxt = np.asarray(geometry.next, dtype=int)
+            idx = np.arange(len(off))
+            ext = (
+                ~off & off[prev] & off[nxt] & (prev != idx) & (nxt != idx)
+                & (np.abs(Y[prev] - Y) < EXTREMA_EPS)
+                & (np.abs(Y[nxt] - Y) < EXTREMA_EPS)
+            )
+            centre = idx[ext]
+            cosR, sinR = math.cos(self.rotation), math.sin(self.rotation)
+            for handles in (prev[ext], nxt[ext]):
+                vx = X[handles] - X[centre]
+                vy = Y[handles] - Y[centre]
+                X[handles] = X[centre] + vx * cosR + vy * sinR
+                Y[handles] = Y[centre] - vx * sinR + vy * cosR
+
+        return X.tolist(), Y.tolist()
+
+
+def _write_positions(layer, geometry, xs, ys):
+    """Writes node positions inside one begin/endChanges block so the layer is invalidated once."""
+    try:
+        layer.beginChanges()
+    except Exception:
+        pass
+    try:
+        for node, x, y, ox, oy in zip(geometry.nodes, xs, ys, geometry.xs, geometry.ys):
+            if x != ox or y != oy:
+                node.position = (x, y)
+    finally:
+        try:
+            layer.endChanges()
+        except Exception:
+            pass
+
+
 # -------------------------
 # Core slant logic
 # -------------------------
 
-def _slant_one_layer(layer, italicAngleDeg, setItalicAngle):
-    master = _associated_master(layer)
+def _affine_slant(layer, shear):
+    # --- BOUNDS & REFERENCE ---
+    b0 = layer.bounds
+    yRef = float(b0.origin.y) + float(b0.size.height) * Y_REF_RATIO
+    centerY = float(b0.origin.y) + float(b0.size.height) * 0.5
+
+    # --- COMPOSE SHEAR + RECENTER ---
+    # Shearing around yRef moves the bounds centre by shear * (centerY - yRef),
+    # so the recentring shift is known before touching any node and both
+    # steps collapse into a single matrix.
+    dx = -shear * (centerY - yRef)
+    t = _shear_transform(shear, yRef, dx)
+
+    for path in layer.paths:
+        _apply_path_transform(path, t)
+
+    for a in _anchors_iter(layer):
+        x, y = a.position.x, a.position.y
+        a.position = (x + t[2] * y + t[4], y)
+
+
+def _slant_one_layer(layer, italicAngleDeg, setItalicAngle, masterIndex, engine=None):
+    master = _associated_master(layer, masterIndex)
     if not master:
         return
 
@@ -69,39 +293,18 @@ def _slant_one_layer(layer, italicAngleDeg, setItalicAngle):
     layer.widthMetricsKey = None
 
     if setItalicAngle:
-        master.italicAngle = float(italicAngleDeg)
-
-    shear = math.tan(math.radians(float(italicAngleDeg)))
-
-    # --- BOUNDS & REFERENCE ---
-    b0 = layer.bounds
-    yRef = float(b0.origin.y) + float(b0.size.height) * 0.335
-
-    # --- APPLY AFFINE SHEAR ---
-    for path in layer.paths:
-        for node in path.nodes:
-            node.x += shear * (node.y - yRef)
-
-    for a in _anchors_iter(layer):
-        a.position = (
-            a.position.x + shear * (a.position.y - yRef),
-            a.position.y
-        )
-
-    # --- RECENTER ---
-    centerX = float(b0.origin.x) + float(b0.size.width) * 0.5
-    b1 = layer.bounds
-    newCenterX = float(b1.origin.x) + float(b1.size.width) * 0.5
+        _set_italic_angle(master, italicAngleDeg, masterIndex)
 
-    dx = centerX - newCenterX
-    if abs(dx) > 1e-6:
-        shift = NSAffineTransform.transform()
-        shift.translateXBy_yBy_(dx, 0.0)
+    if engine is None or engine.isAffine():
+        _affine_slant(layer, math.tan(math.radians(float(italicAngleDeg))))
+    else:
+        geometry = _LayerGeometry(layer)
+        xs, ys = engine.coordinates(geometry)
+        _write_positions(layer, geometry, xs, ys)
 
-        for path in layer.paths:
-            _apply_path_transform(path, shift)
         for a in _anchors_iter(layer):
-            a.position = shift.transformPoint_(a.position)
+            x, y = a.position.x, a.position.y
+            a.position = (x + engine.displacement(y, geometry.y0, geometry.height), y)
 
     # --- RESTORE ---
     layer.LSB = originalLSB
@@ -117,13 +320,42 @@ def _slant_one_layer(layer, italicAngleDeg, setItalicAngle):
 
 class SimpleSlantUI(object):
     def __init__(self):
-        self.w = vanilla.FloatingWindow((330, 240), "Simple Slant")
+        self.w = vanilla.FloatingWindow((330, 365), "Smart Italic")
+        self._job = None
+        self._closed = False
+        self._preview = {}
 
         y = 15
 
         self.w.t1 = vanilla.TextBox((15, y, 140, 17), "Italic angle (°)")
-        self.w.angle = vanilla.EditText((170, y - 2, 130, 22), "9")
-        y += 35
+        self.w.angle = vanilla.EditText((170, y - 2, 130, 22), "9", callback=self.angleEdited)
+        y += 28
+
+        self.w.angleSlider = vanilla.Slider(
+            (15, y, 285, 23),
+            minValue=0.0,
+            maxValue=20.0,
+            value=9.0,
+            continuous=True,
+            callback=self.angleSlid
+        )
+        y += 32
+
+        self.w.t2 = vanilla.TextBox((15, y, 150, 17), "Modulation (%)")
+        self.w.modulation = vanilla.EditText((170, y - 2, 130, 22), "0", callback=self.opticsEdited)
+        y += 30
+
+        self.w.t3 = vanilla.TextBox((15, y, 150, 17), "Extrema rotation (%)")
+        self.w.extremaRotation = vanilla.EditText((170, y - 2, 130, 22), "0", callback=self.opticsEdited)
+        y += 30
+
+        self.w.preview = vanilla.CheckBox(
+            (15, y, 300, 20),
+            "Live preview (selected layers)",
+            value=False,
+            callback=self.previewToggled
+        )
+        y += 30
 
         self.w.setAngle = vanilla.CheckBox(
             (15, y, 300, 20),
@@ -158,25 +390,147 @@ class SimpleSlantUI(object):
             "Apply to all masters",
             callback=self.applyAll
         )
+        y += 36
+
+        self.w.progress = vanilla.ProgressBar((15, y + 3, 210, 16))
+        self.w.cancel = vanilla.Button(
+            (235, y, 65, 24),
+            "Cancel",
+            callback=self.cancelRun
+        )
+        self.w.cancel.enable(False)
 
+        self.w.bind("close", self.windowClosed)
         self.w.open()
 
     # -------------------------
 
-    def _run(self, layers):
+    def _engine(self):
+        """Reads the dialog into an OpticalSlant; returns None for invalid input."""
+        try:
+            angle = float(self.w.angle.get())
+            modulation = float(self.w.modulation.get() or 0) / 100.0
+            extremaRotation = float(self.w.extremaRotation.get() or 0) / 100.0
+        except Exception:
+            return None
+        return OpticalSlant(angle, modulation, extremaRotation)
+
+    # --- Live preview ---
+
+    def _startPreview(self):
         font = Glyphs.font
         if not font:
             return
+        layers = [l for l in font.selectedLayers if isinstance(l, GSLayer)][:PREVIEW_LIMIT]
+        self._preview = {}
+        for layer in layers:
+            geometry = _LayerGeometry(layer)
+            if len(geometry):
+                self._preview[layer] = geometry
+
+    def _updatePreview(self):
+        engine = self._engine()
+        if engine is None or not self._preview:
+            return
+        for layer, geometry in self._preview.items():
+            xs, ys = engine.coordinates(geometry)
+            _write_positions(layer, geometry, xs, ys)
+
+    def _stopPreview(self):
+        for layer, geometry in self._preview.items():
+            try:
+                layer.beginChanges()
+            except Exception:
+                pass
+            for node, x, y in zip(geometry.nodes, geometry.xs, geometry.ys):
+                node.position = (x, y)
+            try:
+                layer.endChanges()
+            except Exception:
+                pass
+        self._preview = {}
+
+    def previewToggled(self, sender):
+        if sender.get():
+            self._startPreview()
+            self._updatePreview()
+        else:
+            self._stopPreview()
 
+    def angleEdited(self, sender):
         try:
-            angle = float(self.w.angle.get())
+            self.w.angleSlider.set(float(sender.get()))
         except Exception:
-            Glyphs.showNotification("Simple Slant", "Invalid angle")
             return
+        self._updatePreview()
+
+    def angleSlid(self, sender):
+        self.w.angle.set("%g" % round(sender.get(), 1))
+        self._updatePreview()
+
+    def opticsEdited(self, sender):
+        self._updatePreview()
+
+    # --- Chunked run ---
+
+    def _setRunning(self, running):
+        for control in (self.w.applySel, self.w.applyMaster, self.w.applyAll, self.w.preview):
+            control.enable(not running)
+        self.w.cancel.enable(running)
+
+    def _run(self, glyphLayers, glyphCount):
+        """Starts a chunked run over (glyph, layers) pairs; yields to the UI between batches."""
+        font = Glyphs.font
+        if not font or self._job:
+            return
+
+        engine = self._engine()
+        if engine is None:
+            Glyphs.showNotification("Smart Italic", "Invalid angle")
+            return
+
+        if self._preview:
+            self._stopPreview()
+            self.w.preview.set(False)
 
-        setItalicAngle = bool(self.w.setAngle.get())
+        angle = float(self.w.angle.get())
         avoidRed = bool(self.w.avoidColor.get())
-        avoidColor = 0 if avoidRed else -1  # Red = 0
+
+        self._job = {
+            "font": font,
+            "masters": MasterIndex(font),
+            "items": iter(glyphLayers),
+            "total": max(1, glyphCount),
+            "glyphsDone": 0,
+            "layersDone": 0,
+            "angle": angle,
+            "engine": engine,
+            "setItalicAngle": bool(self.w.setAngle.get()),
+            "avoidColor": 0 if avoidRed else -1,  # Red = 0
+            "cancelled": False,
+        }
+
+        self.w.progress.set(0)
+        self._setRunning(True)
+        callLater(0.0, self._step)
+
+    def _step(self):
+        job = self._job
+        if not job:
+            return
+
+        if job["cancelled"]:
+            self._finish()
+            return
+
+        batch = list(itertools.islice(job["items"], BATCH_SIZE))
+        if not batch:
+            self._finish()
+            return
+
+        font = job["font"]
+        if job["masters"].is_stale(font):
+            job["masters"] = MasterIndex(font)
 
         try:
             font.disableUpdateInterface()
@@ -184,38 +538,57 @@ class SimpleSlantUI(object):
             pass
 
         try:
-            for layer in layers:
-                if not isinstance(layer, GSLayer):
-                    continue
-
-                glyph = layer.parent
-                if _glyph_is_avoided(glyph, avoidColor):
+            for glyph, layers in batch:
+                job["glyphsDone"] += 1
+                if not layers or _glyph_is_avoided(glyph, job["avoidColor"]):
                     continue
 
-                began = False
+                glyph.beginUndo()
                 try:
-                    glyph.beginUndo()
-                    began = True
-                except Exception:
-                    pass
-
-                _slant_one_layer(layer, angle, setItalicAngle)
-
-                if began:
-                    try:
-                        glyph.endUndo()
-                    except Exception:
-                        pass
+                    for layer in layers:
+                        _slant_one_layer(layer, job["angle"], job["setItalicAngle"], job["masters"], job["engine"])
+                        job["layersDone"] += 1
+                finally:
+                    glyph.endUndo()
+        except Exception as e:
+            job["error"] = "%s: %s" % (glyph.name, e)
         finally:
             try:
                 font.enableUpdateInterface()
             except Exception:
                 pass
 
-        Glyphs.showNotification(
-            "Simple Slant",
-            "Done (%d layer(s))" % len(layers)
-        )
+        if job.get("error"):
+            self._finish()
+            return
+
+        if not self._closed:
+            self.w.progress.set(100.0 * job["glyphsDone"] / job["total"])
+        callLater(0.0, self._step)
+
+    def _finish(self):
+        job = self._job
+        self._job = None
+        if not self._closed:
+            self._setRunning(False)
+            self.w.progress.set(0)
+
+        message = "Done (%d layer(s))" % job["layersDone"]
+        if job.get("error"):
+            message = "Stopped after %d layer(s): %s" % (job["layersDone"], job["error"])
+            print("⚠️ Smart Italic stopped on %s" % job["error"])
+        elif job["cancelled"]:
+            message = "Cancelled after %d layer(s)" % job["layersDone"]
+        Glyphs.showNotification("Smart Italic", message)
+
+    def cancelRun(self, sender):
+        if self._job:
+            self._job["cancelled"] = True
+
+    def windowClosed(self, sender):
+        self._closed = True
+        self.cancelRun(sender)
+        self._stopPreview()
 
     # -------------------------
 
@@ -223,31 +596,25 @@ class SimpleSlantUI(object):
         font = Glyphs.font
         if not font or not font.selectedLayers:
             return
-        self._run(list(font.selectedLayers))
+        glyphMap = {}
+        for layer in font.selectedLayers:
+            if isinstance(layer, GSLayer) and layer.parent:
+                glyphMap.setdefault(layer.parent, []).append(layer)
+        self._run(glyphMap.items(), len(glyphMap))
 
     def applyMaster(self, sender):
         font = Glyphs.font
         if not font:
             return
         master = font.selectedFontMaster
-        layers = []
-        for g in font.glyphs:
-            l = g.layers[master.id]
-            if l:
-                layers.append(l)
-        self._run(layers)
+        self._run(_iter_glyph_layers(font, [master.id]), len(font.glyphs))
 
     def applyAll(self, sender):
         font = Glyphs.font
         if not font:
             return
-        layers = []
-        for g in font.glyphs:
-            for m in font.masters:
-                l = g.layers[m.id]
-                if l:
-                    layers.append(l)
-        self._run(layers)
+        masterIds = [m.id for m in font.masters]
+        self._run(_iter_glyph_layers(font, masterIds), len(font.glyphs))
 
 
 SimpleSlantUI()
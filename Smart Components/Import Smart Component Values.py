@@ -0,0 +1,204 @@
+# MenuTitle: 📥 Import Smart Component Values (all masters)
+# -*- coding: utf-8 -*-
+# Version: 1.1
+# Description: Imports smart component values from a CSV or JSON table with one row per glyph, component index, master, axis and value. Rows are validated against the smart axes of each component and all valid ones are applied in one batch.
+# Author: Fernando Díaz (Reset Type Studio) with help from AI.
+
+import csv
+import json
+import os
+import sys
+
+from GlyphsApp import Glyphs, GetOpenFile
+
+# Shared modules live in the Libraries folder at the root of this repository
+LIBRARIES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Libraries")
+if LIBRARIES_PATH not in sys.path:
+    sys.path.insert(0, LIBRARIES_PATH)
+
+from resetTypeMasters import MasterIndex  # noqa: E402
+from resetTypeSmartComponents import SmartIndex  # noqa: E402
+
+COLUMNS = ("glyph", "component", "master", "axis", "value")
+
+# Accepted header spellings for each column
+COLUMN_ALIASES = {
+    "glyph": "glyph", "glyph name": "glyph",
+    "component": "component", "component index": "component", "index": "component",
+    "master": "master", "master name": "master", "master id": "master",
+    "axis": "axis", "axis name": "axis",
+    "value": "value",
+}
+
+# Rejected rows printed in the report; the rest are only counted
+MAX_REPORTED_ERRORS = 25
+
+
+# ----------------------------
+# Reading
+# ----------------------------
+
+def read_rows(path):
+    """
+    Yields (line, row dict) from a CSV file with a header row, or from a JSON
+    list of objects (or of [glyph, component, master, axis, value] lists).
+    JSON items that are neither yield (line, None) and are rejected in validation.
+    """
+    if os.path.splitext(path)[1].lower() == ".json":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, list):
+            raise ValueError("The JSON file must hold a list of rows")
+        for line, item in enumerate(data, start=1):
+            if isinstance(item, dict):
+                yield line, {COLUMN_ALIASES.get(str(k).strip().lower(), k): v for k, v in item.items()}
+            elif isinstance(item, list):
+                yield line, dict(zip(COLUMNS, item))
+            else:
+                yield line, None
+        return
+
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        keys = [COLUMN_ALIASES.get(cell.strip().lower()) for cell in header]
+        if not set(COLUMNS).issubset(keys):
+            raise ValueError(f"The header must name the columns: {', '.join(COLUMNS)}")
+        for line, cells in enumerate(reader, start=2):
+            if not cells or not any(cell.strip() for cell in cells):
+                continue
+            yield line, {key: cell.strip() for key, cell in zip(keys, cells) if key}
+
+
+# ----------------------------
+# Validation
+# ----------------------------
+
+class ImportIndex:
+    """Master and smart axis lookups shared with the other scripts, plus the component list of each layer read once."""
+
+    def __init__(self, font):
+        self.masters = MasterIndex(font)
+        self.smart = SmartIndex(font, self.masters)
+        self.components = {}
+
+    def layer_components(self, glyph_name, master_id):
+        """Component list of a master layer, read from the layer only once."""
+        key = (glyph_name, master_id)
+        if key not in self.components:
+            layer = self.smart.glyph(glyph_name).layers[master_id]
+            self.components[key] = list(layer.components) if layer is not None else []
+        return self.components[key]
+
+
+def validate_rows(index, rows):
+    """
+    Checks every row against the font. Returns the accepted values grouped as
+    {glyph name: {(master id, component index): {axis id: value}}} and the
+    list of (line, reason) for the rejected rows.
+    """
+    accepted, errors = {}, []
+    for line, row in rows:
+        if row is None:
+            errors.append((line, "row must be an object or a list of values"))
+            continue
+        try:
+            glyph_name = str(row["glyph"]).strip()
+            component_index = int(row["component"])
+            master_key = str(row["master"]).strip()
+            axis_name = str(row["axis"]).strip()
+            value = float(row["value"])
+        except KeyError as e:
+            errors.append((line, f"missing column {e}"))
+            continue
+        except (TypeError, ValueError):
+            errors.append((line, "component index and value must be numbers"))
+            continue
+
+        if index.smart.glyph(glyph_name) is None:
+            errors.append((line, f"glyph '{glyph_name}' not in font"))
+            continue
+        master_id = index.masters.resolve(master_key)
+        if master_id is None:
+            errors.append((line, f"master '{master_key}' not in font"))
+            continue
+        components = index.layer_components(glyph_name, master_id)
+        if not 0 <= component_index < len(components):
+            errors.append((line, f"'{glyph_name}' has no component #{component_index} in '{master_key}'"))
+            continue
+        base = components[component_index].componentName
+        axis = index.smart.ranges(base).get(axis_name)
+        if axis is None:
+            errors.append((line, f"'{base}' has no smart axis '{axis_name}'"))
+            continue
+        axis_id, lower, upper = axis
+        if not lower <= value <= upper:
+            errors.append((line, f"{value:g} outside {axis_name} range {lower:g}–{upper:g} of '{base}'"))
+            continue
+
+        accepted.setdefault(glyph_name, {}).setdefault((master_id, component_index), {})[axis_id] = value
+    return accepted, errors
+
+
+# ----------------------------
+# Applying
+# ----------------------------
+
+def apply_values(font, index, accepted):
+    """Writes all accepted values in one batch, one undo step per glyph. Returns the number of values set."""
+    count = 0
+    font.disableUpdateInterface()
+    try:
+        for glyph_name, targets in accepted.items():
+            glyph = index.smart.glyph(glyph_name)
+            glyph.beginUndo()
+            try:
+                for (master_id, component_index), values in targets.items():
+                    component = index.layer_components(glyph_name, master_id)[component_index]
+                    for axis_id, value in values.items():
+                        component.smartComponentValues[axis_id] = value
+                    count += len(values)
+            finally:
+                glyph.endUndo()
+    finally:
+        font.enableUpdateInterface()
+    return count
+
+
+def import_table(font, path):
+    """Reads, validates and applies a table. Returns (values set, glyphs changed, errors)."""
+    index = ImportIndex(font)
+    accepted, errors = validate_rows(index, read_rows(path))
+    count = apply_values(font, index, accepted)
+    return count, len(accepted), errors
+
+
+def main():
+    font = Glyphs.font
+    if not font:
+        print("❌ No font open.")
+        return
+
+    path = GetOpenFile(message="Choose a smart component values table", filetypes=["csv", "json"])
+    if not path:
+        return
+
+    try:
+        count, glyph_count, errors = import_table(font, path)
+    except (OSError, ValueError) as e:
+        print(f"❌ Could not read {os.path.basename(path)}: {e}")
+        return
+
+    Glyphs.redraw()
+
+    for line, reason in errors[:MAX_REPORTED_ERRORS]:
+        print(f"⚠️ Row {line}: {reason}")
+    if len(errors) > MAX_REPORTED_ERRORS:
+        print(f"⚠️ … and {len(errors) - MAX_REPORTED_ERRORS} more rejected row(s).")
+
+    print(f"✅ Set {count} smart component value(s) in {glyph_count} glyph(s); {len(errors)} row(s) rejected.")
+
+# Run the script
+main()
@@ -1,46 +1,49 @@
 # MenuTitle: 🧠 Selected to Smart Components (all masters)
 # -*- coding: utf-8 -*-
-# Version: 1.3
+# Version: 1.5
 # Description: Converts selected glyphs into smart components based on font master axes.
 # Author: Fernando Díaz (Reset Type Studio) with help from AI.
 
-from GlyphsApp import Glyphs, GSSmartComponentAxis
+from GlyphsApp import Glyphs
+import os
+import sys
+
+# Shared modules live in the Libraries folder at the root of this repository
+LIBRARIES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Libraries")
+if LIBRARIES_PATH not in sys.path:
+    sys.path.insert(0, LIBRARIES_PATH)
+
+from resetTypeMasters import MasterIndex  # noqa: E402
+from resetTypeSmartComponents import SmartIndex  # noqa: E402
+
 
 def collect_component_names(selected_layers):
     """Collects unique component names from the selected glyphs."""
-    return {component.name for layer in selected_layers for component in layer.components}
+    return {component.componentName for layer in selected_layers for component in layer.components}
 
-def find_non_smart_components(font, component_names):
+def find_non_smart_components(smart_index, component_names):
     """Finds components that are NOT already smart components."""
-    return {name for name in component_names if not font.glyphs[name].smartComponentAxes}
-
-def create_smart_components(font, smart_component_names):
-    """Creates smart components for glyphs that are not already smart."""
-    for name in smart_component_names:
-        componentGlyph = font.glyphs[name]
-        for i, axis in enumerate(font.axes):
-            axisValues = [m.axes[i] for m in font.masters]
-            newAxis = GSSmartComponentAxis()
-            newAxis.name = axis.name
-            newAxis.bottomValue = min(axisValues)
-            newAxis.topValue = max(axisValues)
-            componentGlyph.smartComponentAxes.append(newAxis)
-
-            for layer in componentGlyph.layers:
-                if layer.isMasterLayer:
-                    master_value = font.masters[layer.associatedMasterId].axes[i]
-                    if master_value == newAxis.bottomValue:
-                        layer.smartComponentPoleMapping[componentGlyph.smartComponentAxes[newAxis.name].id] = 1
-                    if master_value == newAxis.topValue:
-                        layer.smartComponentPoleMapping[componentGlyph.smartComponentAxes[newAxis.name].id] = 2
+    return {
+        name for name in component_names
+        if smart_index.glyph(name) is not None and not smart_index.glyph(name).smartComponentAxes
+    }
+
+def create_smart_components(font, smart_component_names, smart_index):
+    """Creates smart components for glyphs that are not already smart, in one interface update."""
+    font.disableUpdateInterface()
+    try:
+        for name in sorted(smart_component_names):
+            smart_index.make_smart(name)
+    finally:
+        font.enableUpdateInterface()
 
 def assign_smart_component_values(selected_layers, smart_component_names, font):
     """Assigns smart component values to components in selected glyphs."""
     processedGlyphs = []
     for layer in selected_layers:
         for component in layer.components:
-            if component.name in smart_component_names:
-                if not component.smartComponentValues:
+            if component.componentName in smart_component_names:
+                if not component.smartComponentValues and layer.parent.name not in processedGlyphs:
                     processedGlyphs.append(layer.parent.name)
     
     return processedGlyphs
@@ -57,14 +60,15 @@ def main():
         print("❌ No components found in selected glyphs.")
         return
 
+    smart_index = SmartIndex(font, MasterIndex(font))
     component_names = collect_component_names(selected_layers)
-    smart_component_names = find_non_smart_components(font, component_names)
+    smart_component_names = find_non_smart_components(smart_index, component_names)
 
     if not smart_component_names:
         print("⚠️ No new smart components to create.")
         return
 
-    create_smart_components(font, smart_component_names)
+    create_smart_components(font, smart_component_names, smart_index)
     processedGlyphs = assign_smart_component_values(selected_layers, smart_component_names, font)
 
     if processedGlyphs:
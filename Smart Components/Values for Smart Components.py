@@ -1,22 +1,36 @@
 # MenuTitle: 🔢 Values for Smart Components (all masters)
 # -*- coding: utf-8 -*-
-# Version: 1.4
-# Description: Assigns values to smart components in selected glyphs for all axes and masters.
+# Version: 1.6
+# Description: Assigns values to smart components in selected glyphs, or in every glyph of the font, for all axes and masters. Components that are not smart yet are converted first.
 # Author: Fernando Díaz (Reset Type Studio) with help from AI.
 
-from GlyphsApp import Glyphs, GSSmartComponentAxis
+from GlyphsApp import Glyphs
 import vanilla
+import os
+import sys
+
+# Shared modules live in the Libraries folder at the root of this repository
+LIBRARIES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Libraries")
+if LIBRARIES_PATH not in sys.path:
+    sys.path.insert(0, LIBRARIES_PATH)
+
+from resetTypeMasters import MasterIndex  # noqa: E402
+from resetTypeSmartComponents import SmartIndex, component_lookup  # noqa: E402
+
+SCOPES = ["Selected glyphs", "Whole font"]
+
 
 class SmartComponentAxesUI:
     """UI for setting axis values in smart components for selected glyphs across all masters."""
 
     def __init__(self, font):
         self.font = font
+        self.master_index = MasterIndex(font)  # The input fields are built from these masters
         self.axes = font.axes  # Get all axes in the font
         self.master_count = len(self.font.masters)
         self.axis_count = len(self.axes)
 
-        window_height = 80 + (self.master_count * self.axis_count * 37)  # Dynamic window height
+        window_height = 110 + (self.master_count * self.axis_count * 37)  # Dynamic window height
 
         self.w = vanilla.FloatingWindow((260, window_height), "Smart Component Axes Values", minSize=(260, 400), maxSize=(350, 1000))
 
@@ -37,6 +51,8 @@ class SmartComponentAxesUI:
 
             y_offset += 10  # ✅ Adds extra spacing before the next master
 
+        self.w.scopePopup = vanilla.PopUpButton((10, -65, 175, 20), SCOPES, sizeStyle="small")
+
         # Create "OK" and "Cancel" buttons
         self.w.okButton = vanilla.Button((10, -35, 85, 0), "OK", callback=self.ok_button_callback)
         self.w.cancelButton = vanilla.Button((100, -35, 85, 0), "Cancel", callback=self.cancel_button_callback)
@@ -58,65 +74,64 @@ class SmartComponentAxesUI:
                     return None
         return master_axis_values
 
-    def find_component_in_layer(self, layer, name):
-        """Finds a specific component by name in a layer."""
-        for component in layer.components:
-            if component.name == name:
-                return component
-        return None
-
     def apply_smart_component_values(self, master_axis_values):
-        """Processes selected glyphs and assigns smart component axis values."""
+        """Converts components to smart components and assigns the axis values in one indexed pass."""
         font = self.font
-        selected_layers = [layer for layer in font.selectedLayers if layer.components]
-        processed_glyphs = []
+        master_index = self.master_index
+        if master_index.is_stale(font):
+            Glyphs.displayDialog("❌ Masters changed since this window was opened. Please run the script again.")
+            return
+        smart_index = SmartIndex(font, master_index)
+
+        # One reference layer per glyph; its components are matched by (name, occurrence) in every master
+        if self.w.scopePopup.get() == 1:
+            reference_layers = [glyph.layers[master_index.reference_id] for glyph in font.glyphs]
+        else:
+            reference_layers = list({layer.parent.name: layer for layer in font.selectedLayers}.values())
+        reference_layers = [layer for layer in reference_layers if layer is not None and layer.components]
 
-        if not selected_layers:
+        if not reference_layers:
             Glyphs.displayDialog("❌ No components found in selected glyphs.")
             return
 
-        # Collect component names in selected glyphs
-        component_names = {component.name for layer in selected_layers for component in layer.components}
-
-        # Find components that are NOT already smart components
-        smart_component_names = {name for name in component_names if not font.glyphs[name].smartComponentAxes}
-
-        # Convert components to smart components
-        for name in smart_component_names:
-            component_glyph = font.glyphs[name]
-            for i, axis in enumerate(font.axes):
-                axis_values = [m.axes[i] for m in font.masters]
-                new_axis = GSSmartComponentAxis()
-                new_axis.name = axis.name
-                new_axis.bottomValue = min(axis_values)
-                new_axis.topValue = max(axis_values)
-                component_glyph.smartComponentAxes.append(new_axis)
-
-                for layer in component_glyph.layers:
-                    if layer.isMasterLayer:
-                        master_value = font.masters[layer.associatedMasterId].axes[i]
-                        if master_value == new_axis.bottomValue:
-                            layer.smartComponentPoleMapping[component_glyph.smartComponentAxes[new_axis.name].id] = 1
-                        if master_value == new_axis.topValue:
-                            layer.smartComponentPoleMapping[component_glyph.smartComponentAxes[new_axis.name].id] = 2
-
-        # Assign smart component values for all axes
-        for layer in selected_layers:
-            for component in layer.components:
-                component_glyph = font.glyphs[component.name]
-                for master in font.masters:
-                    master_layer = layer.parent.layers[master.id]
-                    component_master = self.find_component_in_layer(master_layer, component.name)
-                    if component_master is not None:
-                        for axis in component_glyph.smartComponentAxes:
-                            if axis.name in master_axis_values[master.id]:
-                                component_master.smartComponentValues[axis.id] = master_axis_values[master.id][axis.name]
-
-            processed_glyphs.append(layer.parent.name)
+        component_names = {component.componentName for layer in reference_layers for component in layer.components}
+        missing = sorted(name for name in component_names if smart_index.glyph(name) is None)
+        processed_glyphs = []
+
+        font.disableUpdateInterface()
+        try:
+            # Convert components to smart components
+            for name in sorted(component_names.difference(missing)):
+                if not smart_index.glyph(name).smartComponentAxes:
+                    smart_index.make_smart(name)
+
+            # Assign smart component values for all axes
+            for layer in reference_layers:
+                glyph = layer.parent
+                keys = list(component_lookup(layer))
+                glyph.beginUndo()
+                try:
+                    for master_id in master_index.masters:
+                        lookup = component_lookup(glyph.layers[master_id])
+                        values = master_axis_values[master_id]
+                        for key in keys:
+                            component = lookup.get(key)
+                            if component is None:
+                                continue
+                            for axis_name, axis_id in smart_index.axes(key[0]).items():
+                                if axis_name in values:
+                                    component.smartComponentValues[axis_id] = values[axis_name]
+                finally:
+                    glyph.endUndo()
+                processed_glyphs.append(glyph.name)
+        finally:
+            font.enableUpdateInterface()
 
         # Update the UI
         Glyphs.redraw()
-        print(f"✅ {', '.join(processed_glyphs)} now have smart components with specific values for all axes and masters.")
+        if missing:
+            print(f"⚠️ Skipped missing component glyphs: {', '.join(missing)}")
+        print(f"✅ {len(processed_glyphs)} glyph(s) now have smart components with specific values for all axes and masters: {', '.join(processed_glyphs)}")
 
     def ok_button_callback(self, sender):
         """Handles OK button click: validates input and applies axis values."""
@@ -1,20 +1,98 @@
 # MenuTitle: 🛠️ Transformations Tool (for All Masters)
 # -*- coding: utf-8 -*-
-# Version: 1.4
-# Description: Transformations tools but for all Master
+# Version: 1.8
+# Description: Transformations tools but for all Master. Values can be the same everywhere or interpolated per master from a few designspace locations. Works on master, brace/bracket or selected layers of the selected glyphs, or font-wide filtered by category, script and color. The same engine runs headless on .glyphs sources from CLI/Transformations (CLI).py
 # Author: Fernando Díaz (Reset Type Studio) with help from AI.
 
 from GlyphsApp import *
 import vanilla
 import math
-from AppKit import NSAffineTransform
+import os
+import sys
+
+# Shared modules live in the Libraries folder at the root of this repository
+LIBRARIES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Libraries")
+if LIBRARIES_PATH not in sys.path:
+    sys.path.insert(0, LIBRARIES_PATH)
+
+from resetTypeTransform import ParametricTransforms, applyMatrix, composeMatrix, layerCenter, layerLocation, parseStops  # noqa: E402
+
+LIST_LAYER_SCOPES = ["Master layers", "Masters + brace/bracket", "Selected layers"]
+LIST_GLYPH_SOURCES = ["Selected glyphs", "Whole font (filtered)"]
+LIST_CATEGORIES = ["Any category", "Letter", "Number", "Punctuation", "Symbol", "Mark", "Separator", "Other"]
+LIST_COLORS = [
+    "Any color", "Red", "Orange", "Brown", "Yellow", "Light Green", "Dark Green",
+    "Light Blue", "Dark Blue", "Purple", "Magenta", "Light Gray", "Charcoal",
+]
+
+
+# =============================
+# Scope
+# =============================
+
+def iterUniqueGlyphs(thisFont):
+    """Glyphs of the selected layers, each once, in selection order."""
+    setSeen = set()
+    for thisLayer in thisFont.selectedLayers:
+        thisGlyph = thisLayer.parent
+        if thisGlyph is None or thisGlyph.name in setSeen:
+            continue
+        setSeen.add(thisGlyph.name)
+        yield thisGlyph
+
+
+def iterFilteredGlyphs(thisFont, strCategory=None, strScript=None, intColor=None):
+    """Glyphs of the whole font matching the filters, without building a list."""
+    for thisGlyph in thisFont.glyphs:
+        if strCategory and thisGlyph.category != strCategory:
+            continue
+        if strScript and (thisGlyph.script or "") != strScript:
+            continue
+        if intColor is not None and thisGlyph.color != intColor:
+            continue
+        yield thisGlyph
+
+
+def iterScopeLayers(thisGlyph, intLayerScope):
+    """Master layers, or master plus brace/bracket layers; backups are never touched."""
+    for thisLayer in thisGlyph.layers:
+        if thisLayer.isMasterLayer:
+            yield thisLayer
+        elif intLayerScope == 1 and thisLayer.isSpecialLayer:
+            yield thisLayer
+
+
+def iterScope(thisFont, intLayerScope, intGlyphSource, dictFilters):
+    """(glyph, [layers]) pairs to transform, de-duplicated."""
+    if intLayerScope == 2:
+        # Selected layers: exactly what is selected in the edit view, once each
+        dictLayers = {}
+        for thisLayer in thisFont.selectedLayers:
+            if thisLayer.parent is None:
+                continue
+            dictLayers.setdefault(thisLayer.parent.name, (thisLayer.parent, {}))[1].setdefault(thisLayer.layerId, thisLayer)
+        for thisGlyph, dictGlyphLayers in dictLayers.values():
+            yield thisGlyph, list(dictGlyphLayers.values())
+        return
+
+    if intGlyphSource == 1:
+        iterGlyphs = iterFilteredGlyphs(thisFont, **dictFilters)
+    else:
+        iterGlyphs = iterUniqueGlyphs(thisFont)
+    for thisGlyph in iterGlyphs:
+        yield thisGlyph, list(iterScopeLayers(thisGlyph, intLayerScope))
+
+
+# =============================
+# UI
+# =============================
 
 class TransformGlyphsInAllMasters:
     
     def __init__(self):
         """Initialize the user interface for transformation settings."""
-        intWindowWidth = 180
-        intWindowHeight = 280  
+        intWindowWidth = 400
+        intWindowHeight = 420  
         
         self.uiWindow = vanilla.FloatingWindow(
             (intWindowWidth, intWindowHeight),  
@@ -43,12 +121,33 @@ class TransformGlyphsInAllMasters:
         self.uiWindow.txtSlant = vanilla.TextBox((20, 142, 80, 22), "Slant (°)", sizeStyle='regular')
         self.uiWindow.inputSlant = vanilla.EditText((100, 140, 60, 22), "0", sizeStyle='regular')
 
+        # Scope
+        self.uiWindow.popLayerScope = vanilla.PopUpButton((20, 175, 140, 20), LIST_LAYER_SCOPES, sizeStyle='small', callback=self.scopeChanged)
+        self.uiWindow.popGlyphSource = vanilla.PopUpButton((20, 203, 140, 20), LIST_GLYPH_SOURCES, sizeStyle='small', callback=self.scopeChanged)
+
+        # Font-wide filters
+        self.uiWindow.popCategory = vanilla.PopUpButton((20, 231, 140, 20), LIST_CATEGORIES, sizeStyle='small')
+        self.uiWindow.inputScript = vanilla.EditText((20, 259, 140, 20), "", placeholder="Any script (e.g. latin)", sizeStyle='small')
+        self.uiWindow.popColor = vanilla.PopUpButton((20, 287, 140, 20), LIST_COLORS, sizeStyle='small')
+
         # Apply Button
-        self.uiWindow.btnApply = vanilla.Button((20, 190, 140, 22), "Apply", callback=self.applyTransformations)
+        self.uiWindow.btnApply = vanilla.Button((20, 325, 140, 22), "Apply", callback=self.applyTransformations)
         self.uiWindow.btnApply.getNSButton().setKeyEquivalent_("\r")
 
         # Close Button
-        self.uiWindow.btnClose = vanilla.Button((20, 220, 140, 22), "Close", callback=self.cancel)
+        self.uiWindow.btnClose = vanilla.Button((20, 355, 140, 22), "Close", callback=self.cancel)
+
+        # Status
+        self.uiWindow.txtStatus = vanilla.TextBox((20, 387, 140, 28), "", sizeStyle='mini')
+
+        # Per-master values, interpolated from designspace stops
+        self.uiWindow.chkPerMaster = vanilla.CheckBox((190, 20, -20, 20), "Per-master values", sizeStyle='small', callback=self.perMasterChanged)
+        self.uiWindow.txtStopsHelp = vanilla.TextBox((190, 44, -20, 28), "One stop per line: axis values : x y scale rotate slant", sizeStyle='mini')
+        self.uiWindow.inputStops = vanilla.TextEditor((190, 74, -20, -80), "")
+        self.uiWindow.btnFillStops = vanilla.Button((190, -70, -20, 22), "Fill from Masters", sizeStyle='small', callback=self.fillStops)
+        self.perMasterChanged(None)
+
+        self.scopeChanged(None)
 
         self.uiWindow.open()  # Open window
         self.uiWindow.makeKey()  # Bring window to front
@@ -60,14 +159,53 @@ class TransformGlyphsInAllMasters:
         except ValueError:
             return floatDefault
 
+    def scopeChanged(self, sender):
+        """Filters only apply to font-wide runs; selected layers always use the selection."""
+        boolSelectedLayers = self.uiWindow.popLayerScope.get() == 2
+        self.uiWindow.popGlyphSource.enable(not boolSelectedLayers)
+        boolFiltered = not boolSelectedLayers and self.uiWindow.popGlyphSource.get() == 1
+        for thisControl in (self.uiWindow.popCategory, self.uiWindow.inputScript, self.uiWindow.popColor):
+            thisControl.enable(boolFiltered)
+
+    def perMasterChanged(self, sender):
+        boolPerMaster = bool(self.uiWindow.chkPerMaster.get())
+        self.uiWindow.inputStops.enable(boolPerMaster)
+        self.uiWindow.btnFillStops.enable(boolPerMaster)
+
+    def fillStops(self, sender):
+        """One stop per master location, with the current field values."""
+        thisFont = Glyphs.font
+        if not thisFont:
+            return
+        strValues = " ".join(
+            thisField.get().strip() or strDefault for thisField, strDefault in (
+                (self.uiWindow.inputTranslateX, "0"), (self.uiWindow.inputTranslateY, "0"),
+                (self.uiWindow.inputScale, "100"), (self.uiWindow.inputRotate, "0"), (self.uiWindow.inputSlant, "0"),
+            )
+        )
+        listLines = [f"# {', '.join(a.name for a in thisFont.axes)} : x y scale rotate slant"]
+        for thisMaster in thisFont.masters:
+            listLines.append(f"{', '.join('%g' % v for v in thisMaster.axes)} : {strValues}  # {thisMaster.name}")
+        self.uiWindow.inputStops.set("\n".join(listLines))
+
+    def getFilters(self):
+        intCategory = self.uiWindow.popCategory.get()
+        intColor = self.uiWindow.popColor.get()
+        return {
+            "strCategory": LIST_CATEGORIES[intCategory] if intCategory > 0 else None,
+            "strScript": self.uiWindow.inputScript.get().strip() or None,
+            "intColor": intColor - 1 if intColor > 0 else None,
+        }
+
     def cancel(self, sender):
         """Closes the window when the Close button is clicked."""
         self.uiWindow.close()
 
     def applyTransformations(self, sender):
-        """Applies transformations to selected glyphs across all masters."""
+        """Applies transformations to the glyphs and layers in scope, in one UI update batch."""
         thisFont = Glyphs.font
-        listSelectedGlyphs = [thisLayer.parent for thisLayer in thisFont.selectedLayers]
+        if not thisFont:
+            return
 
         # Validate input values
         floatMoveX = self.getValidNumber(self.uiWindow.inputTranslateX.get(), 0)
@@ -75,57 +213,63 @@ class TransformGlyphsInAllMasters:
         floatScale = self.getValidNumber(self.uiWindow.inputScale.get(), 100) / 100.0
         floatRotate = self.getValidNumber(self.uiWindow.inputRotate.get(), 0)  # Clockwise
         floatSlant = math.tan(math.radians(self.getValidNumber(self.uiWindow.inputSlant.get(), 0)))  # Horizontal skew
+        tupleFixed = (floatMoveX, floatMoveY, floatScale, floatRotate, floatSlant)
+
+        thisParametric = None
+        if self.uiWindow.chkPerMaster.get():
+            try:
+                listStops = parseStops(self.uiWindow.inputStops.get())
+            except ValueError as e:
+                self.uiWindow.txtStatus.set(f"⚠️ {e}")
+                return
+            if not listStops:
+                self.uiWindow.txtStatus.set("⚠️ No stops defined")
+                return
+            if any(len(loc) != len(thisFont.axes) for loc, _ in listStops):
+                self.uiWindow.txtStatus.set(f"⚠️ Stops need {len(thisFont.axes)} axis value(s)")
+                return
+            thisParametric = ParametricTransforms(listStops)
+
+        dictMasterLocations = {m.id: tuple(float(v) for v in m.axes) for m in thisFont.masters}
+        dictValues = {}
 
-        for thisGlyph in listSelectedGlyphs:
-            for thisLayer in thisGlyph.layers:
-                # Compute the center of the glyph using bounds
-                rectBounds = thisLayer.bounds
-                floatCenterX = rectBounds.origin.x + (rectBounds.size.width / 2)
-                floatCenterY = rectBounds.origin.y + (rectBounds.size.height / 2)
-
-                # Move glyph to (0,0) before applying transformations
-                listMoveToOrigin = [
-                    1, 0, 0, 1,
-                    -floatCenterX, -floatCenterY
-                ]
-                thisLayer.applyTransform(listMoveToOrigin)
-
-                # Apply rotation first, centered on (0,0)
-                if floatRotate != 0:
-                    objRotationMatrix = NSAffineTransform.alloc().init()
-                    objRotationMatrix.rotateByDegrees_(-floatRotate)  # Clockwise rotation
-                    thisLayer.applyTransform(objRotationMatrix.transformStruct())
-
-                # Initialize transformation matrix with default values (identity matrix)
-                listTransformMatrix = [1, 0, 0, 1, 0, 0]
-
-                # Apply Scale
-                if floatScale != 1.0:
-                    listTransformMatrix[0] = floatScale  # Scale X
-                    listTransformMatrix[3] = floatScale  # Scale Y
-
-                # Apply Slant (only horizontal skew)
-                if floatSlant != 0:
-                    listTransformMatrix[2] = floatSlant  # Skew X
-
-                # Apply Move
-                if floatMoveX != 0:
-                    listTransformMatrix[4] = floatMoveX  # Move X
-                if floatMoveY != 0:
-                    listTransformMatrix[5] = floatMoveY  # Move Y
-
-                # Apply the final transformation matrix to the layer (if modified)
-                if listTransformMatrix != [1, 0, 0, 1, 0, 0]:  # Only apply if not an identity matrix
-                    thisLayer.applyTransform(listTransformMatrix)
-
-                # Move the glyph back to its original position
-                listMoveBackMatrix = [
-                    1, 0, 0, 1,
-                    floatCenterX, floatCenterY
-                ]
-                thisLayer.applyTransform(listMoveBackMatrix)
+        def valuesForLayer(thisLayer):
+            """(x, y, scale, rotate, slant) for a layer, computed once per location."""
+            if thisParametric is None:
+                return tupleFixed
+            tupleLocation = layerLocation(thisFont, thisLayer, dictMasterLocations)
+            if tupleLocation not in dictValues:
+                x, y, scale, rotate, slant = thisParametric.valuesAt(tupleLocation)
+                dictValues[tupleLocation] = (x, y, scale / 100.0, rotate, math.tan(math.radians(slant)))
+            return dictValues[tupleLocation]
+
+        iterGlyphLayers = iterScope(
+            thisFont, self.uiWindow.popLayerScope.get(), self.uiWindow.popGlyphSource.get(), self.getFilters()
+        )
+
+        intGlyphs = 0
+        intLayers = 0
+        thisFont.disableUpdateInterface()
+        try:
+            for thisGlyph, listLayers in iterGlyphLayers:
+                if not listLayers:
+                    continue
+                thisGlyph.beginUndo()
+                try:
+                    for thisLayer in listLayers:
+                        # One composed matrix per layer, around the center of its bounds
+                        floatCenterX, floatCenterY = layerCenter(thisLayer)
+                        listTransformMatrix = composeMatrix(*valuesForLayer(thisLayer), floatCenterX, floatCenterY)
+                        applyMatrix(thisLayer, listTransformMatrix)
+                        intLayers += 1
+                finally:
+                    thisGlyph.endUndo()
+                intGlyphs += 1
+        finally:
+            thisFont.enableUpdateInterface()
 
         Glyphs.redraw()  # Ensure UI updates
+        self.uiWindow.txtStatus.set(f"{intGlyphs} glyph(s), {intLayers} layer(s) transformed")
 
 # Run the UI
 TransformGlyphsInAllMasters()